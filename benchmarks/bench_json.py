@@ -0,0 +1,79 @@
+"""Compara os decodificadores JSON disponíveis (json, orjson, msgspec) com
+response.json() em uma página sintética do inventário de estações.
+
+Uso:
+    python benchmarks/bench_json.py [numero_de_estacoes] [repeticoes]
+"""
+
+import json
+import sys
+import time
+
+import httpx
+
+from api_hidro.columnar import colunas
+from api_hidro.models.models import Inventario
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def pagina(n: int) -> bytes:
+    items = []
+    for codigo in range(n):
+        item: dict[str, object] = {}
+        # Como na API: números como números, indicadores como "0"/"1" e datas
+        # como texto
+        for alias, tipo in colunas(Inventario).values():
+            if tipo == "int":
+                item[alias] = codigo
+            elif tipo == "float":
+                item[alias] = codigo / 7
+            elif tipo == "bool":
+                item[alias] = str(codigo % 2)
+            elif tipo in ("date", "datetime"):
+                item[alias] = None if codigo % 3 else "2005-05-19 00:00:00.0"
+            else:
+                item[alias] = f"Valor {codigo} de {alias}"
+        items.append(item)
+    resposta = {"status": "OK", "code": 200, "message": "", "items": items}
+    return json.dumps(resposta).encode()
+
+
+def executa(nome: str, decodifica, conteudo: bytes, repeticoes: int) -> None:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        decodifica(conteudo)
+    duracao = (time.perf_counter() - inicio) / repeticoes
+    print(f"{nome:<24} {duracao * 1000:8.2f} ms/página")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    conteudo = pagina(n)
+    print(f"Página com {n} estações ({len(conteudo) / 1e6:.1f} MB)")
+
+    def response_json(conteudo: bytes):
+        return httpx.Response(200, content=conteudo).json()
+
+    executa("response.json()", response_json, conteudo, repeticoes)
+    executa("json.loads(bytes)", json.loads, conteudo, repeticoes)
+    if orjson is not None:
+        executa("orjson.loads", orjson.loads, conteudo, repeticoes)
+    if msgspec is not None:
+        executa(
+            "msgspec.json.Decoder", msgspec.json.Decoder().decode, conteudo, repeticoes
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compara requests.get isolado com o HttpTransport (pool keep-alive)
+contra um servidor HTTP local que simula a API HIDRO.
+
+Uso:
+    python benchmarks/bench_transport.py [numero_de_requisicoes] [latencia_conexao_ms]
+
+A latência de conexão é aplicada a cada nova conexão aceita pelo servidor,
+simulando o custo do handshake TCP+TLS com www.ana.gov.br.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from api_hidro.api_requests.sync_request import http_get_sync
+from api_hidro.api_requests.transport import HttpTransport, TransportConfig
+
+CORPO = json.dumps({"status": "OK", "code": 200, "message": "", "items": []}).encode()
+
+
+class FakeHidroHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(CORPO)))
+        self.end_headers()
+        self.wfile.write(CORPO)
+
+    def log_message(self, format, *args): ...
+
+
+class FakeHidroServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latencia_conexao: float):
+        super().__init__(("127.0.0.1", 0), FakeHidroHandler)
+        self.latencia_conexao = latencia_conexao
+        self.conexoes = 0
+
+    def get_request(self):
+        request = super().get_request()
+        self.conexoes += 1
+        time.sleep(self.latencia_conexao)
+        return request
+
+
+def executa(nome: str, servidor: FakeHidroServer, chamada, n: int) -> None:
+    servidor.conexoes = 0
+    inicio = time.perf_counter()
+    for _ in range(n):
+        chamada()
+    duracao = time.perf_counter() - inicio
+    print(
+        f"{nome:<28} {n} requisições em {duracao:.3f}s "
+        f"({duracao / n * 1000:.2f} ms/req) - conexões abertas: {servidor.conexoes}"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latencia_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    servidor = FakeHidroServer(latencia_ms / 1000)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/HidroSerieVazao/v1"
+
+    executa(
+        "requests.get (sem sessão)",
+        servidor,
+        lambda: requests.get(url, params={"Código da Estação": 1}).json(),
+        n,
+    )
+    with HttpTransport(TransportConfig()) as transport:
+        executa(
+            "HttpTransport (keep-alive)",
+            servidor,
+            lambda: http_get_sync(url, {}, {"Código da Estação": 1}, transport),
+            n,
+        )
+
+    servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
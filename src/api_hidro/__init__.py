@@ -1,13 +1,23 @@
 from api_hidro.api_requests.hidro_inventario import (
     inventario_completo,
+    inventario_completo_df,
     inventario_por_codigo_estacao,
+    inventario_por_codigos,
     retorna_inventario,
+    retorna_inventario_atualizado,
     retorna_inventario_completo,
 )
+from api_hidro.api_requests.hidro_lote import (
+    bulk_serie_historica,
+    bulk_serie_historica_df,
+)
 from api_hidro.api_requests.hidro_serie import (
     serie_historica_chuva,
+    serie_historica_chuva_df,
     serie_historica_cota,
+    serie_historica_cota_df,
     serie_historica_vazao,
+    serie_historica_vazao_df,
 )
 from api_hidro.api_requests.hidro_telemetrica import (
     serie_historica_telemetrica_adotada,
@@ -17,11 +27,19 @@ from api_hidro.api_requests.hidro_telemetrica import (
 __all__ = [
     "retorna_inventario",
     "inventario_por_codigo_estacao",
+    "inventario_por_codigos",
     "inventario_completo",
+    "inventario_completo_df",
     "retorna_inventario_completo",
+    "retorna_inventario_atualizado",
     "serie_historica_chuva",
     "serie_historica_cota",
     "serie_historica_vazao",
+    "serie_historica_chuva_df",
+    "serie_historica_cota_df",
+    "serie_historica_vazao_df",
+    "bulk_serie_historica",
+    "bulk_serie_historica_df",
     "serie_historica_telemetrica_adotada",
     "serie_historica_telemetrica_detalhada",
 ]
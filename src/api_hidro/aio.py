@@ -0,0 +1,132 @@
+"""Versões assíncronas (async def) das funções públicas da biblioteca.
+
+As funções deste módulo possuem os mesmos nomes e argumentos das funções
+síncronas exportadas por ``api_hidro`` e podem ser aguardadas em um event loop
+já em execução (FastAPI, Jupyter, workers asyncio), compartilhando o loop e as
+conexões do transporte assíncrono do ``TokenAuthHandler``. As funções
+``iter_*`` são geradores assíncronos (``async for``).
+"""
+
+from api_hidro.api_requests.hidro_carga import (
+    executa_carga_historica_async as executa_carga_historica,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    inventario_completo_async as inventario_completo,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    inventario_completo_df_async as inventario_completo_df,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    inventario_por_codigo_estacao_async as inventario_por_codigo_estacao,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    inventario_por_codigos_async as inventario_por_codigos,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    retorna_inventario_async as retorna_inventario,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    retorna_inventario_atualizado_async as retorna_inventario_atualizado,
+)
+from api_hidro.api_requests.hidro_inventario import (
+    retorna_inventario_completo_async as retorna_inventario_completo,
+)
+from api_hidro.api_requests.hidro_lote import (
+    aiter_bulk_serie_historica as iter_bulk_serie_historica,
+)
+from api_hidro.api_requests.hidro_lote import (
+    aiter_bulk_serie_historica_df as iter_bulk_serie_historica_df,
+)
+from api_hidro.api_requests.hidro_lote import (
+    bulk_serie_historica_async as bulk_serie_historica,
+)
+from api_hidro.api_requests.hidro_lote import (
+    bulk_serie_historica_df_async as bulk_serie_historica_df,
+)
+from api_hidro.api_requests.hidro_serie import (
+    aiter_serie_historica as iter_serie_historica,
+)
+from api_hidro.api_requests.hidro_serie import (
+    aiter_serie_historica_chuva as iter_serie_historica_chuva,
+)
+from api_hidro.api_requests.hidro_serie import (
+    aiter_serie_historica_cota as iter_serie_historica_cota,
+)
+from api_hidro.api_requests.hidro_serie import (
+    aiter_serie_historica_df as iter_serie_historica_df,
+)
+from api_hidro.api_requests.hidro_serie import (
+    aiter_serie_historica_vazao as iter_serie_historica_vazao,
+)
+from api_hidro.api_requests.hidro_serie import (
+    retorna_serie_historica_async as retorna_serie_historica,
+)
+from api_hidro.api_requests.hidro_serie import (
+    serie_historica_chuva_async as serie_historica_chuva,
+)
+from api_hidro.api_requests.hidro_serie import (
+    serie_historica_chuva_df_async as serie_historica_chuva_df,
+)
+from api_hidro.api_requests.hidro_serie import (
+    serie_historica_cota_async as serie_historica_cota,
+)
+from api_hidro.api_requests.hidro_serie import (
+    serie_historica_cota_df_async as serie_historica_cota_df,
+)
+from api_hidro.api_requests.hidro_serie import (
+    serie_historica_vazao_async as serie_historica_vazao,
+)
+from api_hidro.api_requests.hidro_serie import (
+    serie_historica_vazao_df_async as serie_historica_vazao_df,
+)
+from api_hidro.api_requests.hidro_sincronizacao import (
+    sincroniza_estacoes_async as sincroniza_estacoes,
+)
+from api_hidro.api_requests.hidro_sincronizacao import (
+    sincroniza_serie_historica_async as sincroniza_serie_historica,
+)
+from api_hidro.api_requests.hidro_sincronizacao import (
+    sincroniza_serie_telemetrica_async as sincroniza_serie_telemetrica,
+)
+from api_hidro.api_requests.hidro_telemetrica import (
+    retorna_serie_historica_telemetrica_async as retorna_serie_historica_telemetrica,
+)
+from api_hidro.api_requests.hidro_telemetrica import (
+    serie_historica_telemetrica_adotada_async as serie_historica_telemetrica_adotada,
+)
+from api_hidro.api_requests.hidro_telemetrica import (
+    serie_historica_telemetrica_detalhada_async as serie_historica_telemetrica_detalhada,
+)
+
+__all__ = [
+    "retorna_inventario",
+    "inventario_por_codigo_estacao",
+    "inventario_por_codigos",
+    "inventario_completo",
+    "inventario_completo_df",
+    "retorna_inventario_completo",
+    "retorna_inventario_atualizado",
+    "retorna_serie_historica",
+    "serie_historica_chuva",
+    "serie_historica_cota",
+    "serie_historica_vazao",
+    "serie_historica_chuva_df",
+    "serie_historica_cota_df",
+    "serie_historica_vazao_df",
+    "iter_serie_historica",
+    "iter_serie_historica_chuva",
+    "iter_serie_historica_cota",
+    "iter_serie_historica_vazao",
+    "iter_serie_historica_df",
+    "bulk_serie_historica",
+    "iter_bulk_serie_historica",
+    "bulk_serie_historica_df",
+    "iter_bulk_serie_historica_df",
+    "executa_carga_historica",
+    "retorna_serie_historica_telemetrica",
+    "serie_historica_telemetrica_adotada",
+    "serie_historica_telemetrica_detalhada",
+    "sincroniza_serie_historica",
+    "sincroniza_serie_telemetrica",
+    "sincroniza_estacoes",
+]
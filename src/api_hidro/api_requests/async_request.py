@@ -0,0 +1,187 @@
+import asyncio
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import httpx
+
+from api_hidro import json_decoder
+from api_hidro.api_requests.coalescing import chave_requisicao
+from api_hidro.api_requests.transport import AsyncHttpTransport, default_async_transport
+from api_hidro.models.api_response_models import JSONObject
+from api_hidro.token_authentication import TokenAuthHandler
+
+
+async def __http_response_async(
+    url: str,
+    headers: dict[str, Any],
+    params: JSONObject,
+    transport: AsyncHttpTransport | None = None,
+    fairness_key: Hashable = None,
+) -> httpx.Response:
+    transport = transport or default_async_transport()
+    retry = transport.config.retry
+    attempt = 1
+
+    while True:
+        # A espera entre tentativas ocorre fora da vaga do escalonador
+        try:
+            response = await transport.get(
+                url, headers=headers, params=params, fairness_key=fairness_key
+            )
+        except httpx.TransportError:
+            if not retry.should_retry(attempt):
+                raise
+            await asyncio.sleep(retry.delay(attempt))
+            attempt += 1
+            continue
+
+        if response.status_code != 200 and retry.should_retry(
+            attempt, response.status_code
+        ):
+            await asyncio.sleep(
+                retry.delay(attempt, response.headers.get("Retry-After"))
+            )
+            attempt += 1
+            continue
+        break
+
+    if response.status_code != 200:
+        response.raise_for_status()
+
+    return response
+
+
+async def http_get_async(
+    url: str,
+    headers: dict[str, Any],
+    params: JSONObject,
+    transport: AsyncHttpTransport | None = None,
+    fairness_key: Hashable = None,
+) -> dict[str, Any]:
+    response = await __http_response_async(
+        url, headers, params, transport, fairness_key
+    )
+    return json_decoder.loads(response.content)
+
+
+async def __api_response_async(
+    token_auth: TokenAuthHandler,
+    url: str,
+    params: JSONObject,
+    fairness_key: Hashable = None,
+) -> httpx.Response:
+    replayed = False
+    while True:
+        async with token_auth as api_token:
+            headers = {"Authorization": f"Bearer {api_token}"}
+            try:
+                return await __http_response_async(
+                    url, headers, params, token_auth.async_transport, fairness_key
+                )
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != 401 or replayed:
+                    raise
+        token_auth.invalidate(api_token)
+        replayed = True
+
+
+async def __api_get_coalesced[T](
+    token_auth: TokenAuthHandler,
+    url: str,
+    params: JSONObject,
+    fairness_key: Hashable,
+    tipo: str,
+    decode: Callable[[httpx.Response], T],
+) -> T:
+    async def requisicao() -> T:
+        response = await __api_response_async(token_auth, url, params, fairness_key)
+        return decode(response)
+
+    transport = token_auth.async_transport
+    if not transport.config.coalesce:
+        return await requisicao()
+    # A obtenção do token e a repetição após HTTP 401 fazem parte da requisição
+    # compartilhada: o agrupamento fica restrito ao mesmo TokenAuthHandler, de
+    # modo que uma falha de autenticação de um handler (senha incorreta, token
+    # revogado) não é entregue às requisições de outros handlers. O handler_id,
+    # ao contrário de id(), não é reutilizado após a coleta do handler
+    chave = (token_auth.handler_id, chave_requisicao(tipo, url, params))
+    return await transport.coalescer.call_async(chave, requisicao)
+
+
+def __copia_resposta(data: dict[str, Any]) -> dict[str, Any]:
+    # Os itens da API são dicionários planos (valores str, números ou None):
+    # copiar a lista e cada dicionário isola o chamador do resultado agrupado
+    items = data.get("items")
+    if isinstance(items, list):
+        items = [dict(item) if isinstance(item, dict) else item for item in items]
+    elif isinstance(items, dict):
+        items = dict(items)
+    return {**data, "items": items}
+
+
+async def api_get_async(
+    token_auth: TokenAuthHandler,
+    url: str,
+    params: JSONObject,
+    fairness_key: Hashable = None,
+) -> dict[str, Any]:
+    """Requisição autenticada à API HIDRO
+
+    Caso a API recuse o token (HTTP 401) antes do prazo de expiração local, o
+    token é invalidado, renovado e a requisição é repetida uma única vez.
+    Requisições idênticas simultâneas do mesmo TokenAuthHandler são agrupadas
+    pelo RequestCoalescer do transporte em uma única requisição; cada chamador
+    recebe a sua própria cópia dos itens e pode modificá-la.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        url (str): URL do endpoint
+        params (JSONObject): Parâmetros da requisição
+        fairness_key (Hashable, optional): Chave de justiça do escalonador (ex.:
+            código da estação). Defaults to None.
+
+    Raises:
+        httpx.HTTPStatusError: Erro gerado quando a API retorna status diferente de 200
+
+    Returns:
+        dict[str, Any]: Resposta da API em formato JSON
+    """
+
+    data = await __api_get_coalesced(
+        token_auth,
+        url,
+        params,
+        fairness_key,
+        "json",
+        lambda response: json_decoder.loads(response.content),
+    )
+    if token_auth.async_transport.config.coalesce and isinstance(data, dict):
+        # O resultado agrupado (e, com ttl, o do cache) é compartilhado
+        data = __copia_resposta(data)
+    return data
+
+
+async def api_get_bytes_async(
+    token_auth: TokenAuthHandler,
+    url: str,
+    params: JSONObject,
+    fairness_key: Hashable = None,
+) -> bytes:
+    """Requisição autenticada à API HIDRO que retorna o corpo da resposta sem
+    decodificar, para ser decodificado em outra thread ou processo.
+
+    Ver api_get_async.
+
+    Returns:
+        bytes: Corpo da resposta da API (JSON)
+    """
+
+    return await __api_get_coalesced(
+        token_auth,
+        url,
+        params,
+        fairness_key,
+        "bytes",
+        lambda response: response.content,
+    )
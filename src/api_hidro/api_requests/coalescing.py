@@ -0,0 +1,160 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any
+
+from api_hidro.models.api_response_models import JSONObject
+
+
+def chave_requisicao(tipo: str, url: str, params: JSONObject | None) -> Hashable:
+    """Chave de uma requisição: tipo do resultado, URL e parâmetros.
+
+    Parâmetros None são omitidos, como no transporte, e a ordem dos parâmetros
+    não altera a chave.
+    """
+
+    itens = ((k, v) for k, v in (params or {}).items() if v is not None)
+    return tipo, url, tuple(sorted(itens, key=lambda item: item[0]))
+
+
+class RequestCoalescer:
+    """Agrupamento (single-flight) de requisições idênticas em andamento, com
+    cache em memória de curta duração.
+
+    Requisições com a mesma chave (endpoint e parâmetros) feitas enquanto a
+    primeira ainda está em andamento não são enviadas à API: todas aguardam a
+    primeira e recebem o mesmo resultado já decodificado. O agrupamento vale
+    entre tarefas assíncronas, event loops e threads. Com ``ttl`` maior que
+    zero, os resultados bem-sucedidos também são mantidos por ``ttl`` segundos
+    em um cache LRU de até ``maxsize`` entradas. Erros nunca são armazenados.
+
+    O mesmo objeto é entregue a todas as requisições agrupadas e às leituras do
+    cache, e não deve ser modificado.
+
+    Args:
+        ttl (float, optional): Validade, em segundos, dos resultados no cache.
+            0 desativa o cache, mantendo apenas o agrupamento. Defaults to 0.
+        maxsize (int, optional): Número máximo de resultados no cache.
+            Defaults to 1024.
+    """
+
+    def __init__(self, ttl: float = 0.0, maxsize: int = 1024):
+        if ttl < 0 or maxsize < 0:
+            raise ValueError("ttl e maxsize não podem ser negativos")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.__cache: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.__em_andamento: dict[Hashable, Future] = {}
+        # Tarefas líderes, mantidas até a conclusão mesmo que todas as
+        # requisições agrupadas sejam canceladas
+        self.__tarefas: set[asyncio.Task] = set()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    def clear(self) -> None:
+        """Descarta os resultados do cache"""
+
+        with self.__lock:
+            self.__cache.clear()
+
+    def __busca(self, chave: Hashable) -> tuple[bool, Any, Future | None, bool]:
+        # Retorna (encontrado no cache, resultado, future, é o líder)
+        with self.__lock:
+            entrada = self.__cache.get(chave)
+            if entrada is not None:
+                expira, resultado = entrada
+                if time.monotonic() < expira:
+                    self.__cache.move_to_end(chave)
+                    return True, resultado, None, False
+                del self.__cache[chave]
+
+            future = self.__em_andamento.get(chave)
+            if future is not None:
+                return False, None, future, False
+
+            future = Future()
+            # Em execução, a future não pode ser cancelada por quem a aguarda
+            future.set_running_or_notify_cancel()
+            self.__em_andamento[chave] = future
+            return False, None, future, True
+
+    def __conclui(
+        self,
+        chave: Hashable,
+        future: Future,
+        resultado: Any = None,
+        erro: BaseException | None = None,
+    ) -> None:
+        with self.__lock:
+            del self.__em_andamento[chave]
+            if erro is None and self.ttl > 0 and self.maxsize > 0:
+                self.__cache[chave] = (time.monotonic() + self.ttl, resultado)
+                self.__cache.move_to_end(chave)
+                while len(self.__cache) > self.maxsize:
+                    self.__cache.popitem(last=False)
+        if erro is None:
+            future.set_result(resultado)
+        else:
+            future.set_exception(erro)
+
+    def call[T](self, chave: Hashable, func: Callable[[], T]) -> T:
+        """Executa func, ou aguarda a execução em andamento com a mesma chave
+
+        Args:
+            chave (Hashable): Chave da requisição (ver chave_requisicao)
+            func (Callable[[], T]): Função que faz a requisição
+
+        Returns:
+            T: Resultado de func, possivelmente compartilhado
+        """
+
+        encontrado, resultado, future, lider = self.__busca(chave)
+        if encontrado:
+            return resultado
+        assert future is not None
+        if not lider:
+            return future.result()
+
+        try:
+            resultado = func()
+        except BaseException as exc:
+            self.__conclui(chave, future, erro=exc)
+            raise
+        self.__conclui(chave, future, resultado)
+        return resultado
+
+    async def call_async[T](
+        self, chave: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Versão assíncrona de call.
+
+        A requisição do líder é executada em uma tarefa própria: o cancelamento
+        de uma das requisições agrupadas não cancela as demais.
+        """
+
+        encontrado, resultado, future, lider = self.__busca(chave)
+        if encontrado:
+            return resultado
+        assert future is not None
+        if lider:
+            tarefa = asyncio.ensure_future(self.__executa(chave, future, func))
+            self.__tarefas.add(tarefa)
+            tarefa.add_done_callback(self.__tarefas.discard)
+        return await asyncio.wrap_future(future)
+
+    async def __executa(
+        self, chave: Hashable, future: Future, func: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            resultado = await func()
+        except BaseException as exc:
+            self.__conclui(chave, future, erro=exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        self.__conclui(chave, future, resultado)
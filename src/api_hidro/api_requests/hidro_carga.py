@@ -0,0 +1,193 @@
+import asyncio
+import time
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import cast
+
+from api_hidro.api_requests.hidro_lote import BulkProgress, ProgressCallback
+from api_hidro.api_requests.hidro_serie import (
+    TipoDeEstacao,
+    retorna_serie_historica_async,
+)
+from api_hidro.api_requests.hidro_sincronizacao import CHAVE_SERIE
+from api_hidro.errors import IncompleteDataError
+from api_hidro.job_manifest import JobManifest, Unidade
+from api_hidro.serie_cache import SerieCache
+from api_hidro.sync_store import SyncStore
+from api_hidro.token_authentication import TokenAuthHandler
+from api_hidro.utils import as_completed_bounded
+
+
+def __unidades(
+    estacoes: Sequence[int],
+    tipos: Sequence[TipoDeEstacao],
+    data_inicial: str,
+    data_final: str,
+    shard: int,
+    num_shards: int,
+) -> list[Unidade]:
+    if num_shards < 1 or not 0 <= shard < num_shards:
+        raise ValueError("shard deve estar entre 0 e num_shards - 1")
+
+    ano_inicial = datetime.strptime(data_inicial, "%Y-%m-%d").year
+    ano_final = datetime.strptime(data_final, "%Y-%m-%d").year
+    if ano_final < ano_inicial:
+        raise ValueError("Data final não pode ser menor que data inicial")
+
+    return [
+        (codigo, tipo, ano)
+        for codigo in dict.fromkeys(estacoes)
+        if codigo % num_shards == shard
+        for tipo in tipos
+        for ano in range(ano_inicial, ano_final + 1)
+    ]
+
+
+async def executa_carga_historica_async(
+    token_auth: TokenAuthHandler,
+    manifest: JobManifest,
+    store: SyncStore,
+    estacoes: Sequence[int],
+    tipos: Sequence[TipoDeEstacao],
+    data_inicial: str,
+    data_final: str,
+    shard: int = 0,
+    num_shards: int = 1,
+    progresso: ProgressCallback | None = None,
+    cache: SerieCache | None = None,
+) -> int:
+    """Versão assíncrona de executa_carga_historica"""
+
+    unidades = __unidades(estacoes, tipos, data_inicial, data_final, shard, num_shards)
+    # Manifesto e store em uma thread auxiliar: com vários processos
+    # compartilhando os arquivos, a espera pelo lock do SQLite não bloqueia as
+    # demais requisições
+    concluidas = await asyncio.to_thread(manifest.concluidas)
+    pendentes = [unidade for unidade in unidades if unidade not in concluidas]
+
+    async def carrega(unidade: Unidade) -> int:
+        codigo, tipo, ano = unidade
+        tipo_estacao = cast(TipoDeEstacao, tipo)
+        items = await retorna_serie_historica_async(
+            token_auth,
+            codigo,
+            tipo_estacao,
+            date(ano, 1, 1).isoformat(),
+            date(ano, 12, 31).isoformat(),
+            cache,
+        )
+        # Os registros são gravados antes de concluir a unidade: caso o processo
+        # seja interrompido entre as duas operações, a unidade é repetida e os
+        # registros são apenas substituídos
+        gravados = await asyncio.to_thread(
+            store.merge,
+            f"HidroSerie{tipo}",
+            codigo,
+            items or [],
+            CHAVE_SERIE[tipo_estacao],
+            None,
+        )
+        await asyncio.to_thread(manifest.conclui, unidade, gravados)
+        return gravados
+
+    falhas: dict[Unidade, Exception] = {}
+    feitas = 0
+    inicio = time.monotonic()
+
+    async for unidade, result in as_completed_bounded(
+        pendentes, carrega, token_auth.async_transport.scheduler.max_concurrency
+    ):
+        feitas += 1
+        if isinstance(result, Exception):
+            if isinstance(result, IncompleteDataError) and result.failures:
+                result = next(iter(result.failures.values()))
+            falhas[unidade] = result
+            await asyncio.to_thread(manifest.registra_falha, unidade, repr(result))
+
+        if progresso is not None:
+            decorrido = time.monotonic() - inicio
+            progresso(
+                BulkProgress(
+                    total=len(unidades),
+                    concluidos=len(unidades) - len(pendentes) + feitas,
+                    falhas=len(falhas),
+                    decorrido=decorrido,
+                    eta=decorrido / feitas * (len(pendentes) - feitas),
+                )
+            )
+
+    if falhas:
+        raise IncompleteDataError(
+            f"Falha em {len(falhas)} de {len(pendentes)} unidades da carga: "
+            f"{sorted(falhas)[:10]}",
+            failures=falhas,
+        )
+
+    return feitas
+
+
+def executa_carga_historica(
+    token_auth: TokenAuthHandler,
+    manifest: JobManifest,
+    store: SyncStore,
+    estacoes: Sequence[int],
+    tipos: Sequence[TipoDeEstacao],
+    data_inicial: str,
+    data_final: str,
+    shard: int = 0,
+    num_shards: int = 1,
+    progresso: ProgressCallback | None = None,
+    cache: SerieCache | None = None,
+) -> int:
+    """Executa uma carga histórica retomável das séries de várias estações.
+
+    O trabalho é dividido em unidades (código da estação, tipo, ano). Cada
+    unidade concluída é gravada no ``store`` e marcada no ``manifest``; ao
+    executar novamente a mesma carga (após uma queda do processo, falha de
+    autenticação ou instabilidade da rede), apenas as unidades pendentes ou com
+    falha são processadas.
+
+    A carga pode ser dividida entre ``num_shards`` processos ou máquinas: cada
+    um processa as estações com ``codigoestacao % num_shards == shard``. Os
+    processos podem compartilhar os mesmos arquivos de manifesto e de store.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        manifest (JobManifest): Manifesto das unidades concluídas
+        store (SyncStore): Armazenamento local das séries
+        estacoes (Sequence[int]): Códigos das estações
+        tipos (Sequence[TipoDeEstacao]): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        shard (int, optional): Índice desta parte da carga. Defaults to 0.
+        num_shards (int, optional): Número de partes da carga. Defaults to 1.
+        progresso (ProgressCallback | None, optional): Função chamada com um
+            BulkProgress a cada unidade processada. Defaults to None.
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+
+    Raises:
+        ValueError: Erro lançado caso shard ou o período sejam inválidos
+        IncompleteDataError: Erro lançado ao final caso alguma unidade falhe.
+            As unidades com falha estão em ``failures`` e no manifesto, e são
+            repetidas na próxima execução.
+
+    Returns:
+        int: Número de unidades concluídas nesta execução
+    """
+
+    return token_auth.async_transport.run(
+        executa_carga_historica_async(
+            token_auth,
+            manifest,
+            store,
+            estacoes,
+            tipos,
+            data_inicial,
+            data_final,
+            shard,
+            num_shards,
+            progresso,
+            cache,
+        )
+    )
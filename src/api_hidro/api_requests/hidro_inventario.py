@@ -1,7 +1,11 @@
 import asyncio
-from typing import cast
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, cast
 
-from api_hidro.api_requests.sync_request import http_get_sync
+import pandas as pd
+
+from api_hidro.api_requests.async_request import api_get_async
+from api_hidro.columnar import dataframe_to_models, items_to_dataframe
 from api_hidro.constants import BACIAS
 from api_hidro.data_types import CodigoBacia, DictInventarioDaAPI, Estado
 from api_hidro.models.api_response_models import (
@@ -9,9 +13,20 @@ from api_hidro.models.api_response_models import (
 )
 from api_hidro.models.models import Inventario
 from api_hidro.token_authentication import TokenAuthHandler
-from api_hidro.utils import flatten_concatenation
+from api_hidro.utils import (
+    as_completed_bounded,
+    flatten_concatenation,
+    split_failures,
+)
+
+from ..errors import ArgsNotGivenError, IncompleteDataError, InventoryNotFoundError
 
-from ..errors import ArgsNotGivenError, InventoryNotFoundError
+if TYPE_CHECKING:
+    from api_hidro.inventory_snapshot import InventorySnapshot
+
+# Acima deste número de códigos, inventario_por_codigos obtém o inventário das
+# bacias em vez de consultar cada estação
+LIMIAR_CONSULTAS_INDIVIDUAIS = 50
 
 
 async def __retorna_inventario(
@@ -19,6 +34,8 @@ async def __retorna_inventario(
     codigoestacao: int | None = None,
     unidade_federativa: Estado | None = None,
     codigo_bacia: CodigoBacia | None = None,
+    data_atualizacao_inicial: str | None = None,
+    data_atualizacao_final: str | None = None,
 ) -> JSONAPIResponse:
     """
     Função privada do módulo
@@ -30,6 +47,10 @@ async def __retorna_inventario(
         codigoestacao (int | None, optional): Código da estação. Defaults to None.
         unidade_federativa (str | None, optional): Sigla da Unidade Federativa. Defaults to None.
         codigo_bacia (int | None, optional): Código da Bacia. Defaults to None.
+        data_atualizacao_inicial (str | None, optional): Retorna apenas estações
+            atualizadas a partir desta data (YYYY-MM-DD). Defaults to None.
+        data_atualizacao_final (str | None, optional): Retorna apenas estações
+            atualizadas até esta data (YYYY-MM-DD). Defaults to None.
 
     Raises:
         ArgsNotGivenError: Erro gerado quando não for fornecido nenhum dos argumentos
@@ -43,22 +64,28 @@ async def __retorna_inventario(
             "Pelo menos um dos campos de pesquisa deve ser fornecido!"
         )
 
-    with token_auth as api_token:
-        headers = {"Authorization": f"Bearer {api_token}"}
-        url = "https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroInventarioEstacoes/v1"
-
-        params: dict[str, int | str | float | bool | None] = {
-            "Código da Estação": codigoestacao,
-            "Unidade Federativa": unidade_federativa,
-            "Código da Bacia": codigo_bacia,
-        }
-        data = await asyncio.to_thread(http_get_sync, url, headers, params)
+    url = "https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroInventarioEstacoes/v1"
+
+    params: dict[str, int | str | float | bool | None] = {
+        "Código da Estação": codigoestacao,
+        "Unidade Federativa": unidade_federativa,
+        "Código da Bacia": codigo_bacia,
+        "Data Atualização Inicial (yyyy-MM-dd)": data_atualizacao_inicial,
+        "Data Atualização Final (yyyy-MM-dd)": data_atualizacao_final,
+    }
+    data = await api_get_async(
+        token_auth,
+        url,
+        params,
+        fairness_key=codigoestacao or unidade_federativa or codigo_bacia,
+    )
 
     return cast(JSONAPIResponse, data)
 
 
 async def __retorna_inventario_completo(
     token_auth: TokenAuthHandler,
+    **filtros: str | None,
 ) -> list[DictInventarioDaAPI]:
     """
     Função privada do módulo
@@ -66,33 +93,314 @@ async def __retorna_inventario_completo(
 
     Returns:
         token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        filtros (str | None): Filtros adicionais de __retorna_inventario (datas de
+         atualização).
         JSONList: Retorna uma lista com o inventário de todas as estação em formato
          de  dicionário Python (JSON da API).
     """
 
+    codigos_bacia = [bacia["codigobacia"] for bacia in BACIAS]
     result = await asyncio.gather(
         *[
             __retorna_inventario(
-                token_auth=token_auth, codigo_bacia=bacia["codigobacia"]
+                token_auth=token_auth, codigo_bacia=codigo_bacia, **filtros
             )
-            for bacia in BACIAS
-        ]
+            for codigo_bacia in codigos_bacia
+        ],
+        return_exceptions=True,
     )
 
     if not result:
         raise ValueError("Nenhum dado retornado para o inventário completo.")
 
+    successes, failures = split_failures(codigos_bacia, result)
     data: list[list[DictInventarioDaAPI]] = []
 
-    for obj in result:
+    for obj in successes.values():
         if obj is not None:
             json_obj = cast(list[DictInventarioDaAPI], obj.get("items"))
             if json_obj:
                 data.append(json_obj)
 
+    if failures:
+        raise IncompleteDataError(
+            f"Falha ao obter o inventário de {len(failures)} de {len(BACIAS)} bacias: "
+            f"{sorted(failures)}",
+            data=flatten_concatenation(data),
+            failures=failures,
+        )
+
     return flatten_concatenation(data)
 
 
+def __bacias_provaveis(codigos: Sequence[int]) -> list[CodigoBacia]:
+    # Os códigos das estações fluviométricas (8 dígitos) começam pelo código da
+    # bacia; os das pluviométricas não, e exigem todas as bacias
+    bacias: set[int] = set()
+    for codigo in codigos:
+        if not 10_000_000 <= codigo <= 99_999_999:
+            return [bacia["codigobacia"] for bacia in BACIAS]
+        bacias.add(codigo // 10_000_000)
+    return [bacia["codigobacia"] for bacia in BACIAS if bacia["codigobacia"] in bacias]
+
+
+async def __inventario_por_bacias(
+    token_auth: TokenAuthHandler, bacias: list[CodigoBacia], codigos: set[int]
+) -> tuple[dict[int, DictInventarioDaAPI], dict[CodigoBacia, Exception]]:
+    result = await asyncio.gather(
+        *[
+            __retorna_inventario(token_auth=token_auth, codigo_bacia=codigo_bacia)
+            for codigo_bacia in bacias
+        ],
+        return_exceptions=True,
+    )
+    successes, failures = split_failures(bacias, result)
+
+    encontrados: dict[int, DictInventarioDaAPI] = {}
+    for response in successes.values():
+        for item in cast(list[DictInventarioDaAPI], response.get("items") or []):
+            codigo = int(cast(int, item["codigoestacao"]))
+            if codigo in codigos:
+                encontrados[codigo] = item
+    return encontrados, failures
+
+
+async def __inventario_individual(
+    token_auth: TokenAuthHandler, codigos: list[int]
+) -> tuple[dict[int, DictInventarioDaAPI], dict[int, Exception]]:
+    async def retorna(codigo: int) -> list[DictInventarioDaAPI]:
+        return await retorna_inventario_async(token_auth, codigoestacao=codigo)
+
+    encontrados: dict[int, DictInventarioDaAPI] = {}
+    failures: dict[int, Exception] = {}
+    async for codigo, result in as_completed_bounded(
+        codigos, retorna, token_auth.async_transport.scheduler.max_concurrency
+    ):
+        if isinstance(result, Exception):
+            failures[codigo] = result
+        elif result:
+            encontrados[codigo] = result[0]
+    return encontrados, failures
+
+
+async def retorna_inventario_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int | None = None,
+    unidade_federativa: Estado | None = None,
+    codigo_bacia: CodigoBacia | None = None,
+) -> list[DictInventarioDaAPI]:
+    """
+    Versão assíncrona de retorna_inventario.
+    Pelo menos unm dos argumentos da função deve ser fornecida.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        codigoestacao (int | None, optional): Código da estação. Defaults to None.
+        unidade_federativa (str | None, optional): Sigla da Unidade Federativa.
+            Defaults to None.
+        codigo_bacia (int | None, optional): Código da Bacia. Defaults to None.
+
+    Raises:
+        ArgsNotGivenError: Erro gerado quando não for fornecido nenhum dos argumentos.
+
+    Returns:
+        JSONList: Retorna em uma lista, o inventário da estação em formato de dicionário
+         Python (JSON da API).
+    """
+
+    response = await __retorna_inventario(
+        token_auth=token_auth,
+        codigoestacao=codigoestacao,
+        unidade_federativa=unidade_federativa,
+        codigo_bacia=codigo_bacia,
+    )
+
+    return cast(list[DictInventarioDaAPI], response["items"])
+
+
+async def inventario_por_codigo_estacao_async(
+    token_auth: TokenAuthHandler, codigoestacao: int
+) -> Inventario:
+    """
+    Versão assíncrona de inventario_por_codigo_estacao
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        codigoestacao (int): Código da estação
+
+    Raises:
+        InventoryNotFoundError: Erro gerado quando não for encontrado nenhum dado
+
+    Returns:
+        Inventario: Objeto da Classe Inventario com os dados da estação
+    """
+
+    inventario = await retorna_inventario_async(
+        token_auth=token_auth, codigoestacao=codigoestacao
+    )
+    if not inventario:
+        raise InventoryNotFoundError(
+            f"Nenhum inventário encontrado para o código da estação {codigoestacao}."
+        )
+    return Inventario.model_validate(inventario[0], by_alias=True)
+
+
+async def inventario_por_codigos_async(
+    token_auth: TokenAuthHandler,
+    codigos: Sequence[int],
+    snapshot: "InventorySnapshot | None" = None,
+    limiar: int = LIMIAR_CONSULTAS_INDIVIDUAIS,
+) -> dict[int, Inventario]:
+    """
+    Versão assíncrona de inventario_por_codigos
+    """
+
+    pendentes = list(dict.fromkeys(codigos))
+    resultado: dict[int, Inventario] = {}
+
+    if (
+        snapshot is not None
+        and await asyncio.to_thread(snapshot.atualizado_em) is not None
+    ):
+        df = await snapshot.dataframe_async(token_auth)
+        selecao = df[df["codigoestacao"].isin(pendentes)]
+        for estacao in dataframe_to_models(selecao, Inventario):
+            resultado[estacao.codigoestacao] = estacao
+        # A cópia local contém o inventário completo: os códigos ausentes não
+        # existem, e consultá-los obrigaria a obter bacias inteiras novamente
+        return resultado
+
+    items: dict[int, DictInventarioDaAPI] = {}
+    failures: dict[int, Exception] = {}
+
+    if len(pendentes) > limiar:
+        bacias = __bacias_provaveis(pendentes)
+        items, falhas_bacias = await __inventario_por_bacias(
+            token_auth, bacias, set(pendentes)
+        )
+        obtidas = {bacia for bacia in bacias if bacia not in falhas_bacias}
+        pendentes = [codigo for codigo in pendentes if codigo not in items]
+
+        restantes = [
+            bacia["codigobacia"]
+            for bacia in BACIAS
+            if bacia["codigobacia"] not in bacias
+        ]
+        if len(pendentes) > limiar and restantes and not falhas_bacias:
+            encontrados, falhas_bacias = await __inventario_por_bacias(
+                token_auth, restantes, set(pendentes)
+            )
+            items |= encontrados
+            obtidas |= {bacia for bacia in restantes if bacia not in falhas_bacias}
+            pendentes = [codigo for codigo in pendentes if codigo not in items]
+
+        # Cada código restante é atribuído às suas bacias prováveis: com todas
+        # obtidas, o código não existe; com alguma falha, recebe a falha da
+        # bacia; as demais são consultadas individualmente
+        falhas_codigos: dict[int, Exception] = {}
+        individuais: list[int] = []
+        for codigo in pendentes:
+            provaveis = __bacias_provaveis([codigo])
+            falhas = [falhas_bacias[b] for b in provaveis if b in falhas_bacias]
+            if falhas:
+                falhas_codigos[codigo] = falhas[0]
+            elif not all(bacia in obtidas for bacia in provaveis):
+                individuais.append(codigo)
+
+        if len(falhas_codigos) > limiar:
+            failures = falhas_codigos
+            pendentes = individuais
+        else:
+            pendentes = individuais + list(falhas_codigos)
+
+    if pendentes:
+        encontrados, falhas_individuais = await __inventario_individual(
+            token_auth, pendentes
+        )
+        items |= encontrados
+        failures |= falhas_individuais
+
+    for codigo, item in items.items():
+        resultado[codigo] = Inventario.model_validate(item, by_alias=True)
+
+    if failures:
+        raise IncompleteDataError(
+            f"Falha ao obter o inventário de {len(failures)} de "
+            f"{len(set(codigos))} estações: {sorted(failures)[:10]}",
+            data=resultado,
+            failures=failures,
+        )
+
+    return resultado
+
+
+async def retorna_inventario_completo_async(
+    token_auth: TokenAuthHandler,
+) -> list[DictInventarioDaAPI]:
+    """
+    Versão assíncrona de retorna_inventario_completo
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+
+    Returns:
+        JSONList: Retorna uma lista com o inventário de todas as estação em formato JSON
+    """
+    return await __retorna_inventario_completo(token_auth=token_auth)
+
+
+async def retorna_inventario_atualizado_async(
+    token_auth: TokenAuthHandler,
+    data_inicial: str,
+    data_final: str | None = None,
+) -> list[DictInventarioDaAPI]:
+    """
+    Versão assíncrona de retorna_inventario_atualizado
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str | None, optional): Data no formato YYYY-MM-DD.
+            Defaults to None.
+
+    Returns:
+        JSONList: Inventário das estações atualizadas no período em formato JSON
+    """
+    return await __retorna_inventario_completo(
+        token_auth=token_auth,
+        data_atualizacao_inicial=data_inicial,
+        data_atualizacao_final=data_final,
+    )
+
+
+async def inventario_completo_async(token_auth: TokenAuthHandler) -> list[Inventario]:
+    """
+    Versão assíncrona de inventario_completo
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+
+    Returns:
+        list[Inventario]: Retorna uma lista com o inventário de todas as estações
+    """
+    result = await retorna_inventario_completo_async(token_auth=token_auth)
+    return [Inventario.model_validate(item, by_alias=True) for item in result]
+
+
+async def inventario_completo_df_async(token_auth: TokenAuthHandler) -> pd.DataFrame:
+    """
+    Versão assíncrona de inventario_completo_df
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+
+    Returns:
+        pd.DataFrame: Inventário de todas as estações, uma estação por linha
+    """
+    result = await retorna_inventario_completo_async(token_auth=token_auth)
+    return items_to_dataframe(cast(list[dict], result), Inventario)
+
+
 def retorna_inventario(
     token_auth: TokenAuthHandler,
     codigoestacao: int | None = None,
@@ -123,8 +431,8 @@ def retorna_inventario(
             "Pelo menos um dos campos de pesquisa deve ser fornecido!"
         )
 
-    response = asyncio.run(
-        __retorna_inventario(
+    return token_auth.async_transport.run(
+        retorna_inventario_async(
             token_auth=token_auth,
             codigoestacao=codigoestacao,
             unidade_federativa=unidade_federativa,
@@ -132,8 +440,6 @@ def retorna_inventario(
         )
     )
 
-    return cast(list[DictInventarioDaAPI], response["items"])
-
 
 def inventario_por_codigo_estacao(
     token_auth: TokenAuthHandler, codigoestacao: int
@@ -152,12 +458,54 @@ def inventario_por_codigo_estacao(
         Inventario: Objeto da Classe Inventario com os dados da estação
     """
 
-    inventario = retorna_inventario(token_auth=token_auth, codigoestacao=codigoestacao)
-    if not inventario:
-        raise InventoryNotFoundError(
-            f"Nenhum inventário encontrado para o código da estação {codigoestacao}."
+    return token_auth.async_transport.run(
+        inventario_por_codigo_estacao_async(
+            token_auth=token_auth, codigoestacao=codigoestacao
         )
-    return Inventario.model_validate(inventario[0], by_alias=True)
+    )
+
+
+def inventario_por_codigos(
+    token_auth: TokenAuthHandler,
+    codigos: Sequence[int],
+    snapshot: "InventorySnapshot | None" = None,
+    limiar: int = LIMIAR_CONSULTAS_INDIVIDUAIS,
+) -> dict[int, Inventario]:
+    """
+    Retorna o inventário de várias estações, escolhendo a forma mais barata de
+    obtê-lo:
+
+    - a cópia local do ``snapshot``, caso exista, sem nenhuma consulta à API
+      além das atualizações do próprio snapshot (os códigos ausentes da cópia
+      são tratados como inexistentes);
+    - o inventário das bacias das estações, quando houver mais de ``limiar``
+      códigos (os códigos das estações fluviométricas começam pelo código da
+      bacia; para os demais, são obtidas todas as bacias). Os códigos ausentes
+      das bacias obtidas são tratados como inexistentes e os das bacias com
+      falha recebem a falha da bacia, ou são consultados individualmente
+      quando forem poucos;
+    - consultas individuais concorrentes, quando houver poucos códigos.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        codigos (Sequence[int]): Códigos das estações
+        snapshot (InventorySnapshot | None, optional): Inventário local.
+            Defaults to None.
+        limiar (int, optional): Número máximo de consultas individuais.
+            Defaults to LIMIAR_CONSULTAS_INDIVIDUAIS.
+
+    Raises:
+        IncompleteDataError: Erro lançado caso o inventário de alguma estação
+            não possa ser obtido. As estações obtidas são preservadas em
+            ``data`` e as falhas, por código, em ``failures``.
+
+    Returns:
+        dict[int, Inventario]: Inventário de cada estação encontrada, indexado
+            pelo código. Códigos inexistentes não são incluídos.
+    """
+    return token_auth.async_transport.run(
+        inventario_por_codigos_async(token_auth, codigos, snapshot, limiar)
+    )
 
 
 def retorna_inventario_completo(
@@ -173,8 +521,35 @@ def retorna_inventario_completo(
     Returns:
         JSONList: Retorna uma lista com o inventário de todas as estação em formato JSON
     """
-    result = asyncio.run(__retorna_inventario_completo(token_auth=token_auth))
-    return cast(list[DictInventarioDaAPI], result)
+    return token_auth.async_transport.run(
+        retorna_inventario_completo_async(token_auth=token_auth)
+    )
+
+
+def retorna_inventario_atualizado(
+    token_auth: TokenAuthHandler,
+    data_inicial: str,
+    data_final: str | None = None,
+) -> list[DictInventarioDaAPI]:
+    """
+    Retorna o inventário, de todas as bacias, apenas das estações cujo cadastro
+    foi atualizado no período (campo Data_Ultima_Atualizacao).
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str | None, optional): Data no formato YYYY-MM-DD.
+            Defaults to None.
+
+    Raises:
+        IncompleteDataError: Erro lançado caso alguma bacia não seja obtida.
+
+    Returns:
+        JSONList: Inventário das estações atualizadas no período em formato JSON
+    """
+    return token_auth.async_transport.run(
+        retorna_inventario_atualizado_async(token_auth, data_inicial, data_final)
+    )
 
 
 def inventario_completo(token_auth: TokenAuthHandler) -> list[Inventario]:
@@ -187,5 +562,23 @@ def inventario_completo(token_auth: TokenAuthHandler) -> list[Inventario]:
     Returns:
         list[Inventario]: Retorna uma lista com o inventário de todas as estação em formato JSON
     """
-    result = retorna_inventario_completo(token_auth=token_auth)
-    return [Inventario.model_validate(item, by_alias=True) for item in result]
+    return token_auth.async_transport.run(
+        inventario_completo_async(token_auth=token_auth)
+    )
+
+
+def inventario_completo_df(token_auth: TokenAuthHandler) -> pd.DataFrame:
+    """
+    Retorna inventário completo das estações do HIDRO em um DataFrame.
+    Os itens JSON da API são convertidos diretamente em colunas com os nomes e os
+    tipos dos campos de Inventario, sem validar cada estação com o modelo Pydantic.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+
+    Returns:
+        pd.DataFrame: Inventário de todas as estações, uma estação por linha
+    """
+    return token_auth.async_transport.run(
+        inventario_completo_df_async(token_auth=token_auth)
+    )
@@ -0,0 +1,505 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from datetime import date
+
+import pandas as pd
+from pydantic import BaseModel
+
+from api_hidro.api_requests.async_request import api_get_bytes_async
+from api_hidro.api_requests.hidro_serie import (
+    MODELOS_SERIE,
+    TipoDeEstacao,
+    periodos_anuais,
+    requisicao_serie_anual,
+    retorna_serie_historica_async,
+)
+from api_hidro.columnar import items_to_dataframe
+from api_hidro.data_types import PreferenciaConsistencia, TipoFiltroData
+from api_hidro.errors import IncompleteDataError
+from api_hidro.models.api_response_models import JSONList
+from api_hidro.process_pool import ProcessPoolParser, pagina_dataframe
+from api_hidro.serie_cache import SerieCache
+from api_hidro.token_authentication import TokenAuthHandler
+from api_hidro.utils import as_completed_bounded
+
+
+class BulkProgress(BaseModel):
+    """Andamento de um download em lote.
+
+    Cada unidade de trabalho é um ano de uma estação (uma requisição à API).
+    """
+
+    total: int
+    concluidos: int
+    falhas: int
+    decorrido: float
+    eta: float | None
+
+    @property
+    def percentual(self) -> float:
+        return 100.0 * self.concluidos / self.total if self.total else 100.0
+
+
+type ProgressCallback = Callable[[BulkProgress], None]
+
+
+def __unidades(
+    estacoes: Sequence[int],
+    data_inicial: str,
+    data_final: str,
+    tipo_filtro_data: TipoFiltroData,
+) -> list[tuple[int, date, date]]:
+    # Os mesmos períodos anuais de retorna_serie_historica, de modo que os
+    # caminhos JSON e DataFrame retornam os mesmos meses
+    periodos = periodos_anuais(data_inicial, data_final, tipo_filtro_data)
+    return [
+        (codigo, inicio, fim)
+        for codigo in dict.fromkeys(estacoes)
+        for inicio, fim in periodos
+    ]
+
+
+async def __executa_lote[T](
+    token_auth: TokenAuthHandler,
+    unidades: list[tuple[int, date, date]],
+    func: Callable[[tuple[int, date, date]], Awaitable[T]],
+    progresso: ProgressCallback | None,
+) -> AsyncIterator[tuple[int, T]]:
+    falhas: dict[int, dict[int, Exception]] = {}
+    concluidos = 0
+    inicio_lote = time.monotonic()
+
+    async for (codigo, inicio, _), result in as_completed_bounded(
+        unidades,
+        func,
+        token_auth.async_transport.scheduler.max_concurrency,
+    ):
+        concluidos += 1
+        if isinstance(result, Exception):
+            # Falhas de um único ano chegam como IncompleteDataError do ano
+            if isinstance(result, IncompleteDataError) and result.failures:
+                result = next(iter(result.failures.values()))
+            falhas.setdefault(codigo, {})[inicio.year] = result
+        else:
+            yield codigo, result
+
+        if progresso is not None:
+            decorrido = time.monotonic() - inicio_lote
+            progresso(
+                BulkProgress(
+                    total=len(unidades),
+                    concluidos=concluidos,
+                    falhas=sum(len(anos) for anos in falhas.values()),
+                    decorrido=decorrido,
+                    eta=decorrido / concluidos * (len(unidades) - concluidos),
+                )
+            )
+
+    if falhas:
+        estacoes = {codigo for codigo, _, _ in unidades}
+        raise IncompleteDataError(
+            f"Falha ao obter a série de {len(falhas)} de {len(estacoes)} "
+            f"estações: {sorted(falhas)}",
+            failures={
+                codigo: IncompleteDataError(
+                    f"Falha ao obter {len(anos)} anos da série da estação {codigo}: "
+                    f"{sorted(anos)}",
+                    failures=anos,
+                )
+                for codigo, anos in falhas.items()
+            },
+        )
+
+
+async def aiter_bulk_serie_historica(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    progresso: ProgressCallback | None = None,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> AsyncIterator[tuple[int, JSONList]]:
+    """Versão assíncrona de iter_bulk_serie_historica
+
+    Raises:
+        IncompleteDataError: Erro lançado ao final da iteração caso algum ano de
+            alguma estação não tenha sido obtido. ``failures`` contém, para cada
+            estação com falha, um IncompleteDataError com os anos que falharam.
+
+    Yields:
+        tuple[int, JSONList]: Código da estação e a série de um ano no formato JSON
+    """
+
+    unidades = __unidades(estacoes, data_inicial, data_final, tipo_filtro_data)
+
+    async def retorna_ano(unidade: tuple[int, date, date]) -> JSONList:
+        codigo, inicio, fim = unidade
+        return (
+            await retorna_serie_historica_async(
+                token_auth,
+                codigo,
+                tipo_estacao,
+                inicio.isoformat(),
+                fim.isoformat(),
+                cache,
+                tipo_filtro_data,
+            )
+            or []
+        )
+
+    async for codigo, serie_anual in __executa_lote(
+        token_auth, unidades, retorna_ano, progresso
+    ):
+        if serie_anual:
+            yield codigo, serie_anual
+
+
+async def bulk_serie_historica_async(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    progresso: ProgressCallback | None = None,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> dict[int, JSONList]:
+    """Versão assíncrona de bulk_serie_historica"""
+
+    series: dict[int, JSONList] = {codigo: [] for codigo in estacoes}
+    try:
+        async for codigo, serie_anual in aiter_bulk_serie_historica(
+            token_auth,
+            estacoes,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            progresso,
+            cache,
+            tipo_filtro_data,
+        ):
+            series[codigo] += serie_anual
+    except IncompleteDataError as exc:
+        exc.data = {
+            codigo: serie
+            for codigo, serie in series.items()
+            if codigo not in exc.failures
+        }
+        raise
+
+    return series
+
+
+def iter_bulk_serie_historica(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    progresso: ProgressCallback | None = None,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> Iterator[tuple[int, JSONList]]:
+    """Retorna as Séries Históricas de várias estações ano a ano, à medida que
+    cada requisição é concluída.
+
+    Todas as requisições (estação x ano) compartilham o transporte, as conexões
+    e o limite de concorrência do RequestScheduler do ``token_auth``, que
+    distribui as vagas entre as estações de forma justa. Apenas um número
+    limitado de requisições fica em andamento ao mesmo tempo, e a falha de uma
+    estação não interrompe as demais.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        estacoes (Sequence[int]): Códigos das estações
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        progresso (ProgressCallback | None, optional): Função chamada com um
+            BulkProgress a cada requisição concluída. Defaults to None.
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+
+    Raises:
+        IncompleteDataError: Erro lançado ao final da iteração caso algum ano de
+            alguma estação não tenha sido obtido. ``failures`` contém, para cada
+            estação com falha, um IncompleteDataError com os anos que falharam.
+
+    Yields:
+        tuple[int, JSONList]: Código da estação e a série de um ano no formato JSON
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_bulk_serie_historica(
+            token_auth,
+            estacoes,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            progresso,
+            cache,
+            tipo_filtro_data,
+        )
+    )
+
+
+def bulk_serie_historica(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    progresso: ProgressCallback | None = None,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> dict[int, JSONList]:
+    """Retorna as Séries Históricas de várias estações em uma única operação.
+
+    Ver iter_bulk_serie_historica. Os dados de cada estação podem ser convertidos
+    com columnar.items_to_dataframe e hidro_serie.MODELOS_SERIE.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        estacoes (Sequence[int]): Códigos das estações
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        progresso (ProgressCallback | None, optional): Função chamada com um
+            BulkProgress a cada requisição concluída. Defaults to None.
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+
+    Raises:
+        IncompleteDataError: Erro lançado caso alguma estação não tenha sido
+            obtida por completo. As estações completas são preservadas em
+            ``data`` e as falhas, por estação, em ``failures``.
+
+    Returns:
+        dict[int, JSONList]: Série histórica no formato JSON de cada estação
+    """
+
+    return token_auth.async_transport.run(
+        bulk_serie_historica_async(
+            token_auth,
+            estacoes,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            progresso,
+            cache,
+            tipo_filtro_data,
+        )
+    )
+
+
+async def aiter_bulk_serie_historica_df(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    parser: ProcessPoolParser | None = None,
+    progresso: ProgressCallback | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> AsyncIterator[tuple[int, pd.DataFrame]]:
+    """Versão assíncrona de iter_bulk_serie_historica_df
+
+    Raises:
+        IncompleteDataError: Erro lançado ao final da iteração caso algum ano de
+            alguma estação não tenha sido obtido. ``failures`` contém, para cada
+            estação com falha, um IncompleteDataError com os anos que falharam.
+
+    Yields:
+        tuple[int, pd.DataFrame]: Código da estação e a série de um ano
+    """
+
+    unidades = __unidades(estacoes, data_inicial, data_final, tipo_filtro_data)
+    model = MODELOS_SERIE[tipo_estacao]
+
+    async def retorna_ano(unidade: tuple[int, date, date]) -> pd.DataFrame:
+        codigo, inicio, fim = unidade
+        url, params = requisicao_serie_anual(
+            codigo, tipo_estacao, tipo_filtro_data, inicio, fim
+        )
+        conteudo = await api_get_bytes_async(
+            token_auth, url, params, fairness_key=codigo
+        )
+        if parser is not None:
+            return await parser.converte(conteudo, model, consistencia)
+        # Mesma validação do ProcessPoolParser padrão, em uma thread auxiliar
+        return await asyncio.to_thread(
+            pagina_dataframe, conteudo, model, True, consistencia
+        )
+
+    async for codigo, serie_anual in __executa_lote(
+        token_auth, unidades, retorna_ano, progresso
+    ):
+        if not serie_anual.empty:
+            yield codigo, serie_anual
+
+
+async def bulk_serie_historica_df_async(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    parser: ProcessPoolParser | None = None,
+    progresso: ProgressCallback | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> dict[int, pd.DataFrame]:
+    """Versão assíncrona de bulk_serie_historica_df"""
+
+    anuais: dict[int, list[pd.DataFrame]] = {codigo: [] for codigo in estacoes}
+
+    def concatena(codigo: int) -> pd.DataFrame:
+        if not anuais[codigo]:
+            return items_to_dataframe([], MODELOS_SERIE[tipo_estacao])
+        return (
+            pd.concat(anuais[codigo], ignore_index=True)
+            .sort_values("data_hora_dado", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    try:
+        async for codigo, serie_anual in aiter_bulk_serie_historica_df(
+            token_auth,
+            estacoes,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            parser,
+            progresso,
+            tipo_filtro_data,
+            consistencia,
+        ):
+            anuais[codigo].append(serie_anual)
+    except IncompleteDataError as exc:
+        exc.data = {
+            codigo: concatena(codigo) for codigo in anuais if codigo not in exc.failures
+        }
+        raise
+
+    return {codigo: concatena(codigo) for codigo in anuais}
+
+
+def iter_bulk_serie_historica_df(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    parser: ProcessPoolParser | None = None,
+    progresso: ProgressCallback | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> Iterator[tuple[int, pd.DataFrame]]:
+    """Retorna as Séries Históricas de várias estações ano a ano, em DataFrames,
+    à medida que cada requisição é concluída.
+
+    Como iter_bulk_serie_historica, mas as respostas da API não são decodificadas
+    no event loop: o corpo de cada resposta é decodificado, validado e convertido
+    em colunas pelo ``parser``, em um pool de processos, ou, sem ``parser``, em
+    uma thread auxiliar. Esse caminho não utiliza o SerieCache.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        estacoes (Sequence[int]): Códigos das estações
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        parser (ProcessPoolParser | None, optional): Pool de processos da
+            conversão. Defaults to None.
+        progresso (ProgressCallback | None, optional): Função chamada com um
+            BulkProgress a cada requisição concluída. Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+        consistencia (PreferenciaConsistencia, optional): Seleção do nível de
+            consistência de cada mês. Defaults to "consistido".
+
+    Raises:
+        IncompleteDataError: Erro lançado ao final da iteração caso algum ano de
+            alguma estação não tenha sido obtido. ``failures`` contém, para cada
+            estação com falha, um IncompleteDataError com os anos que falharam.
+
+    Yields:
+        tuple[int, pd.DataFrame]: Código da estação e a série de um ano
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_bulk_serie_historica_df(
+            token_auth,
+            estacoes,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            parser,
+            progresso,
+            tipo_filtro_data,
+            consistencia,
+        )
+    )
+
+
+def bulk_serie_historica_df(
+    token_auth: TokenAuthHandler,
+    estacoes: Sequence[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    parser: ProcessPoolParser | None = None,
+    progresso: ProgressCallback | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> dict[int, pd.DataFrame]:
+    """Retorna as Séries Históricas de várias estações em DataFrames.
+
+    Ver iter_bulk_serie_historica_df.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        estacoes (Sequence[int]): Códigos das estações
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        parser (ProcessPoolParser | None, optional): Pool de processos da
+            conversão. Defaults to None.
+        progresso (ProgressCallback | None, optional): Função chamada com um
+            BulkProgress a cada requisição concluída. Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+        consistencia (PreferenciaConsistencia, optional): Seleção do nível de
+            consistência de cada mês. Defaults to "consistido".
+
+    Raises:
+        IncompleteDataError: Erro lançado caso alguma estação não tenha sido
+            obtida por completo. As estações completas são preservadas em
+            ``data`` e as falhas, por estação, em ``failures``.
+
+    Returns:
+        dict[int, pd.DataFrame]: Série histórica de cada estação, uma linha por
+            mês (ou por mês e nível de consistência com consistencia='todos')
+    """
+
+    return token_auth.async_transport.run(
+        bulk_serie_historica_df_async(
+            token_auth,
+            estacoes,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            parser,
+            progresso,
+            tipo_filtro_data,
+            consistencia,
+        )
+    )
@@ -1,40 +1,132 @@
 import asyncio
-from datetime import datetime
+from collections.abc import AsyncIterator, Iterator
+from datetime import date, datetime
 from typing import Literal, cast
 
-from api_hidro.api_requests.sync_request import http_get_sync
-from api_hidro.errors import TimeSerieNotFoundError
-from api_hidro.models.api_response_models import JSONAPIResponse, JSONList
+import pandas as pd
+
+from api_hidro.api_requests.async_request import api_get_async
+from api_hidro.columnar import deduplica_consistencia, items_to_dataframe
+from api_hidro.data_types import PreferenciaConsistencia, TipoFiltroData
+from api_hidro.errors import IncompleteDataError, TimeSerieNotFoundError
+from api_hidro.models.api_response_models import (
+    JSONAPIResponse,
+    JSONList,
+    JSONObject,
+)
 from api_hidro.models.models import (
     DadosMesAnoChuva,
     DadosMesAnoCota,
     DadosMesAnoVazao,
 )
+from api_hidro.serie_cache import SerieCache
 from api_hidro.token_authentication import TokenAuthHandler
-from api_hidro.utils import flatten_concatenation
+from api_hidro.utils import (
+    as_completed_bounded,
+    flatten_concatenation,
+    split_failures,
+)
 
 TipoDeEstacao = Literal["Chuva", "Cotas", "Vazao"]
 
+MODELOS_SERIE: dict[
+    TipoDeEstacao, type[DadosMesAnoChuva | DadosMesAnoCota | DadosMesAnoVazao]
+] = {
+    "Chuva": DadosMesAnoChuva,
+    "Cotas": DadosMesAnoCota,
+    "Vazao": DadosMesAnoVazao,
+}
+
+
+def requisicao_serie_anual(
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    tipo_filtro_data: TipoFiltroData,
+    dt_inicial: date,
+    dt_final: date,
+) -> tuple[str, JSONObject]:
+    """URL e parâmetros da requisição da série de uma estação em um período de
+    até um ano"""
+
+    endpoint = f"HidroSerie{tipo_estacao}"
+    url = f"https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/{endpoint}/v1"
+    params: JSONObject = {
+        "Código da Estação": codigoestacao,
+        "Tipo Filtro Data": tipo_filtro_data,
+        "Data Inicial (yyyy-MM-dd)": dt_inicial.strftime("%Y-%m-%d"),
+        "Data Final (yyyy-MM-dd)": dt_final.strftime("%Y-%m-%d"),
+    }
+    return url, params
+
 
 async def __retorna_serie_anual(
     token_auth: TokenAuthHandler,
     codigoestacao: int,
     tipo_estacao: TipoDeEstacao,
-    data_inicial: str,
-    data_final: str,
-) -> JSONAPIResponse:
-    with token_auth as api_token:
-        headers = {"Authorization": f"Bearer {api_token}"}
-        url = f"https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroSerie{tipo_estacao}/v1"
-        params: dict[str, int | str | float | bool | None] = {
-            "Código da Estação": codigoestacao,
-            "Tipo Filtro Data": "DATA_LEITURA",
-            "Data Inicial (yyyy-MM-dd)": data_inicial,
-            "Data Final (yyyy-MM-dd)": data_final,
-        }
-        data = await asyncio.to_thread(http_get_sync, url, headers, params)
+    tipo_filtro_data: TipoFiltroData,
+    dt_inicial: date,
+    dt_final: date,
+    cache: SerieCache | None = None,
+) -> JSONList:
+    endpoint = f"HidroSerie{tipo_estacao}"
 
-    return cast(JSONAPIResponse, data)
+    # SQLite e zlib em uma thread auxiliar, para não bloquear o event loop
+    if cache is not None:
+        items = await asyncio.to_thread(
+            cache.get, endpoint, codigoestacao, tipo_filtro_data, dt_inicial.year
+        )
+        if items is not None:
+            return items
+
+    url, params = requisicao_serie_anual(
+        codigoestacao, tipo_estacao, tipo_filtro_data, dt_inicial, dt_final
+    )
+    data = cast(
+        JSONAPIResponse,
+        await api_get_async(token_auth, url, params, fairness_key=codigoestacao),
+    )
+    items = data.get("items") or []
+
+    if cache is not None:
+        await asyncio.to_thread(
+            cache.put, endpoint, codigoestacao, tipo_filtro_data, dt_inicial.year, items
+        )
+
+    return items
+
+
+def periodos_anuais(
+    data_inicial: str, data_final: str, tipo_filtro_data: TipoFiltroData
+) -> list[tuple[date, date]]:
+    """Períodos das requisições anuais de uma série histórica.
+
+    Com 'DATA_LEITURA', cada período é um ano completo, de modo que a resposta
+    anual pode ser reaproveitada; com 'DATA_ULTIMA_ATUALIZACAO', apenas as
+    datas solicitadas de cada ano.
+
+    Raises:
+        ValueError: Erro lançado caso a data final seja menor que a inicial
+
+    Returns:
+        list[tuple[date, date]]: Data inicial e final de cada ano
+    """
+
+    dt_inicial = datetime.strptime(data_inicial, "%Y-%m-%d").date()
+    dt_final = datetime.strptime(data_final, "%Y-%m-%d").date()
+
+    if dt_final < dt_inicial:
+        raise ValueError("Data final não pode ser menor que data inicial")
+
+    anos = range(dt_inicial.year, dt_final.year + 1)
+    if tipo_filtro_data == "DATA_LEITURA":
+        # Anos completos: a resposta anual pode ser reaproveitada pelo cache
+        return [(date(ano, 1, 1), date(ano, 12, 31)) for ano in anos]
+
+    # Registros alterados no período: consulta apenas as datas solicitadas
+    return [
+        (max(dt_inicial, date(ano, 1, 1)), min(dt_final, date(ano, 12, 31)))
+        for ano in anos
+    ]
 
 
 async def __retorna_serie_historica(
@@ -43,6 +135,8 @@ async def __retorna_serie_historica(
     tipo_estacao: TipoDeEstacao,
     data_inicial: str,
     data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> JSONList | None:
     """Retorna Série Histórica da estação escolhida
 
@@ -51,16 +145,18 @@ async def __retorna_serie_historica(
         tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
         data_inicial (str): Data no formato YYYY-MM-DD
         data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
 
     Returns:
         JSONList: Série histórica no formato JSON
     """
 
-    dt_inicial = datetime.strptime(data_inicial, "%Y-%m-%d").date()
-    dt_final = datetime.strptime(data_final, "%Y-%m-%d").date()
-
-    if dt_final < dt_inicial:
-        raise ValueError("Data final não pode ser menor que data inicial")
+    periodos = periodos_anuais(data_inicial, data_final, tipo_filtro_data)
+    if tipo_filtro_data != "DATA_LEITURA":
+        cache = None
 
     result = await asyncio.gather(
         *[
@@ -68,53 +164,86 @@ async def __retorna_serie_historica(
                 token_auth,
                 codigoestacao,
                 tipo_estacao,
-                f"{ano}-01-01",
-                f"{ano}-12-31",
+                tipo_filtro_data,
+                inicio,
+                fim,
+                cache,
             )
-            for ano in range(dt_inicial.year, dt_final.year + 1)
-        ]
+            for inicio, fim in periodos
+        ],
+        return_exceptions=True,
     )
 
-    data = [json_obj.get("items") for json_obj in result if json_obj]
+    anos = [inicio.year for inicio, _ in periodos]
+    successes, failures = split_failures(anos, result)
+    data = flatten_concatenation([items for items in successes.values() if items])
+
+    if failures:
+        raise IncompleteDataError(
+            f"Falha ao obter {len(failures)} de {len(anos)} anos da série da estação "
+            f"{codigoestacao}: {sorted(failures)}",
+            data=data,
+            failures=failures,
+        )
 
-    return flatten_concatenation(data)
+    return data
 
 
-def retorna_serie_historica(
+async def retorna_serie_historica_async(
     token_auth: TokenAuthHandler,
     codigoestacao: int,
     tipo_estacao: TipoDeEstacao,
     data_inicial: str,
     data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> JSONList | None:
-    """Retorna Série Histórica da estação escolhida
+    """Versão assíncrona de retorna_serie_historica
 
     Args:
         codigoestacao (int): Código da estação
         tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
         data_inicial (str): Data no formato YYYY-MM-DD
         data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
 
     Returns:
         JSONList: Série histórica no formato JSON
     """
 
-    return asyncio.run(
-        __retorna_serie_historica(
-            token_auth, codigoestacao, tipo_estacao, data_inicial, data_final
-        )
+    return await __retorna_serie_historica(
+        token_auth,
+        codigoestacao,
+        tipo_estacao,
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
     )
 
 
-def serie_historica_chuva(
-    token_auth: TokenAuthHandler, codigoestacao: int, data_inicial: str, data_final: str
+async def serie_historica_chuva_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> list[DadosMesAnoChuva]:
-    """Retorna Série Histórica de Chuvas da estação escolhida
+    """Versão assíncrona de serie_historica_chuva
 
     Args:
         codigoestacao (int): Código da estação
         data_inicial (str): Data no formato YYYY-MM-DD
         data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
 
     Raises:
         TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
@@ -123,12 +252,14 @@ def serie_historica_chuva(
         list[DadoDiarioChuva]: Lista de dados diários de chuva no formato de modelo Pydantic
     """
 
-    serie_diaria_chuva = retorna_serie_historica(
+    serie_diaria_chuva = await retorna_serie_historica_async(
         token_auth=token_auth,
         codigoestacao=codigoestacao,
         tipo_estacao="Chuva",
         data_inicial=data_inicial,
         data_final=data_final,
+        cache=cache,
+        tipo_filtro_data=tipo_filtro_data,
     )
 
     if not serie_diaria_chuva:
@@ -139,15 +270,25 @@ def serie_historica_chuva(
     return [DadosMesAnoChuva.model_validate(item) for item in serie_diaria_chuva]
 
 
-def serie_historica_cota(
-    token_auth: TokenAuthHandler, codigoestacao: int, data_inicial: str, data_final: str
+async def serie_historica_cota_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> list[DadosMesAnoCota]:
-    """Retorna Série Histórica de Cotas da estação escolhida
+    """Versão assíncrona de serie_historica_cota
 
     Args:
         codigoestacao (int): Código da estação
         data_inicial (str): Data no formato YYYY-MM-DD
         data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
 
     Raises:
         TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
@@ -156,12 +297,14 @@ def serie_historica_cota(
         list[DadoDiarioCota]: Lista de dados diários de cota no formato de modelo Pydantic
     """
 
-    serie_diaria_cota = retorna_serie_historica(
+    serie_diaria_cota = await retorna_serie_historica_async(
         token_auth=token_auth,
         codigoestacao=codigoestacao,
         tipo_estacao="Cotas",
         data_inicial=data_inicial,
         data_final=data_final,
+        cache=cache,
+        tipo_filtro_data=tipo_filtro_data,
     )
 
     if not serie_diaria_cota:
@@ -172,15 +315,25 @@ def serie_historica_cota(
     return [DadosMesAnoCota.model_validate(item) for item in serie_diaria_cota]
 
 
-def serie_historica_vazao(
-    token_auth: TokenAuthHandler, codigoestacao: int, data_inicial: str, data_final: str
+async def serie_historica_vazao_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> list[DadosMesAnoVazao]:
-    """Retorna Série Histórica de Vazões da estação escolhida
+    """Versão assíncrona de serie_historica_vazao
 
     Args:
         codigoestacao (int): Código da estação
         data_inicial (str): Data no formato YYYY-MM-DD
         data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
 
     Raises:
         TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
@@ -189,12 +342,14 @@ def serie_historica_vazao(
         list[DadoDiarioVazao]: Lista de dados diários de vazão no formato de modelo Pydantic
     """
 
-    serie_diaria_vazao = retorna_serie_historica(
+    serie_diaria_vazao = await retorna_serie_historica_async(
         token_auth=token_auth,
         codigoestacao=codigoestacao,
         tipo_estacao="Vazao",
         data_inicial=data_inicial,
         data_final=data_final,
+        cache=cache,
+        tipo_filtro_data=tipo_filtro_data,
     )
 
     if not serie_diaria_vazao:
@@ -206,3 +361,713 @@ def serie_historica_vazao(
         DadosMesAnoVazao.model_validate(item, by_alias=True)
         for item in serie_diaria_vazao
     ]
+
+
+async def __serie_historica_df(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    serie = await retorna_serie_historica_async(
+        token_auth=token_auth,
+        codigoestacao=codigoestacao,
+        tipo_estacao=tipo_estacao,
+        data_inicial=data_inicial,
+        data_final=data_final,
+        cache=cache,
+        tipo_filtro_data=tipo_filtro_data,
+    )
+
+    if not serie:
+        raise TimeSerieNotFoundError(
+            f"Série histórica de {tipo_estacao.lower()} não encontrada para o "
+            f"código da estação {codigoestacao}."
+        )
+
+    return deduplica_consistencia(
+        items_to_dataframe(serie, MODELOS_SERIE[tipo_estacao]), consistencia
+    )
+
+
+async def serie_historica_chuva_df_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    """Versão assíncrona de serie_historica_chuva_df"""
+
+    return await __serie_historica_df(
+        token_auth,
+        codigoestacao,
+        "Chuva",
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+        consistencia,
+    )
+
+
+async def serie_historica_cota_df_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    """Versão assíncrona de serie_historica_cota_df"""
+
+    return await __serie_historica_df(
+        token_auth,
+        codigoestacao,
+        "Cotas",
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+        consistencia,
+    )
+
+
+async def serie_historica_vazao_df_async(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    """Versão assíncrona de serie_historica_vazao_df"""
+
+    return await __serie_historica_df(
+        token_auth,
+        codigoestacao,
+        "Vazao",
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+        consistencia,
+    )
+
+
+async def aiter_serie_historica(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> AsyncIterator[JSONList]:
+    """Versão assíncrona de iter_serie_historica
+
+    Args:
+        codigoestacao (int): Código da estação
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+
+    Raises:
+        IncompleteDataError: Erro lançado ao final da iteração caso algum ano não
+            tenha sido obtido. Os anos com falha estão em ``failures``.
+
+    Yields:
+        JSONList: Série histórica de um ano no formato JSON
+    """
+
+    periodos = {
+        inicio.year: (inicio, fim)
+        for inicio, fim in periodos_anuais(data_inicial, data_final, tipo_filtro_data)
+    }
+    if tipo_filtro_data != "DATA_LEITURA":
+        cache = None
+
+    async def retorna_ano(ano: int) -> JSONList:
+        inicio, fim = periodos[ano]
+        return await __retorna_serie_anual(
+            token_auth,
+            codigoestacao,
+            tipo_estacao,
+            tipo_filtro_data,
+            inicio,
+            fim,
+            cache,
+        )
+
+    failures: dict[int, Exception] = {}
+    async for ano, result in as_completed_bounded(
+        list(periodos),
+        retorna_ano,
+        token_auth.async_transport.scheduler.max_concurrency,
+    ):
+        if isinstance(result, Exception):
+            failures[ano] = result
+        elif result:
+            yield result
+
+    if failures:
+        raise IncompleteDataError(
+            f"Falha ao obter {len(failures)} de {len(periodos)} anos da série da "
+            f"estação {codigoestacao}: {sorted(failures)}",
+            failures=failures,
+        )
+
+
+async def aiter_serie_historica_chuva(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> AsyncIterator[list[DadosMesAnoChuva]]:
+    """Versão assíncrona de iter_serie_historica_chuva"""
+
+    async for serie_anual in aiter_serie_historica(
+        token_auth,
+        codigoestacao,
+        "Chuva",
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+    ):
+        yield [DadosMesAnoChuva.model_validate(item) for item in serie_anual]
+
+
+async def aiter_serie_historica_cota(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> AsyncIterator[list[DadosMesAnoCota]]:
+    """Versão assíncrona de iter_serie_historica_cota"""
+
+    async for serie_anual in aiter_serie_historica(
+        token_auth,
+        codigoestacao,
+        "Cotas",
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+    ):
+        yield [DadosMesAnoCota.model_validate(item) for item in serie_anual]
+
+
+async def aiter_serie_historica_vazao(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> AsyncIterator[list[DadosMesAnoVazao]]:
+    """Versão assíncrona de iter_serie_historica_vazao"""
+
+    async for serie_anual in aiter_serie_historica(
+        token_auth,
+        codigoestacao,
+        "Vazao",
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+    ):
+        yield [
+            DadosMesAnoVazao.model_validate(item, by_alias=True) for item in serie_anual
+        ]
+
+
+async def aiter_serie_historica_df(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> AsyncIterator[pd.DataFrame]:
+    """Versão assíncrona de iter_serie_historica_df"""
+
+    async for serie_anual in aiter_serie_historica(
+        token_auth,
+        codigoestacao,
+        tipo_estacao,
+        data_inicial,
+        data_final,
+        cache,
+        tipo_filtro_data,
+    ):
+        yield deduplica_consistencia(
+            items_to_dataframe(serie_anual, MODELOS_SERIE[tipo_estacao]), consistencia
+        )
+
+
+def retorna_serie_historica(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> JSONList | None:
+    """Retorna Série Histórica da estação escolhida
+
+    Args:
+        codigoestacao (int): Código da estação
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+
+    Returns:
+        JSONList: Série histórica no formato JSON
+    """
+
+    return token_auth.async_transport.run(
+        retorna_serie_historica_async(
+            token_auth,
+            codigoestacao,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            cache,
+            tipo_filtro_data,
+        )
+    )
+
+
+def serie_historica_chuva(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> list[DadosMesAnoChuva]:
+    """Retorna Série Histórica de Chuvas da estação escolhida
+
+    Args:
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        list[DadoDiarioChuva]: Lista de dados diários de chuva no formato de modelo Pydantic
+    """
+
+    return token_auth.async_transport.run(
+        serie_historica_chuva_async(
+            token_auth=token_auth,
+            codigoestacao=codigoestacao,
+            data_inicial=data_inicial,
+            data_final=data_final,
+            cache=cache,
+            tipo_filtro_data=tipo_filtro_data,
+        )
+    )
+
+
+def serie_historica_cota(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> list[DadosMesAnoCota]:
+    """Retorna Série Histórica de Cotas da estação escolhida
+
+    Args:
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        list[DadoDiarioCota]: Lista de dados diários de cota no formato de modelo Pydantic
+    """
+
+    return token_auth.async_transport.run(
+        serie_historica_cota_async(
+            token_auth=token_auth,
+            codigoestacao=codigoestacao,
+            data_inicial=data_inicial,
+            data_final=data_final,
+            cache=cache,
+            tipo_filtro_data=tipo_filtro_data,
+        )
+    )
+
+
+def serie_historica_vazao(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> list[DadosMesAnoVazao]:
+    """Retorna Série Histórica de Vazões da estação escolhida
+
+    Args:
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        list[DadoDiarioVazao]: Lista de dados diários de vazão no formato de modelo Pydantic
+    """
+
+    return token_auth.async_transport.run(
+        serie_historica_vazao_async(
+            token_auth=token_auth,
+            codigoestacao=codigoestacao,
+            data_inicial=data_inicial,
+            data_final=data_final,
+            cache=cache,
+            tipo_filtro_data=tipo_filtro_data,
+        )
+    )
+
+
+def serie_historica_chuva_df(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    """Retorna Série Histórica de Chuvas da estação escolhida em um DataFrame.
+
+    Os itens JSON da API são convertidos diretamente em colunas tipadas, sem
+    instanciar o modelo Pydantic de cada registro, com um único registro por mês
+    (ver columnar.deduplica_consistencia). As colunas têm os nomes e os tipos dos
+    campos de DadosMesAnoChuva.
+
+    Args:
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
+        consistencia (PreferenciaConsistencia, optional): Nível de consistência
+            mantido quando o mesmo mês possui dados brutos e consistidos:
+            'consistido', 'bruto' ou 'todos'. Defaults to "consistido".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        pd.DataFrame: Dados mensais de chuva, um registro por linha
+    """
+
+    return token_auth.async_transport.run(
+        serie_historica_chuva_df_async(
+            token_auth,
+            codigoestacao,
+            data_inicial,
+            data_final,
+            cache,
+            tipo_filtro_data,
+            consistencia,
+        )
+    )
+
+
+def serie_historica_cota_df(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    """Retorna Série Histórica de Cotas da estação escolhida em um DataFrame.
+
+    Os itens JSON da API são convertidos diretamente em colunas tipadas, sem
+    instanciar o modelo Pydantic de cada registro, com um único registro por mês
+    (ver columnar.deduplica_consistencia). As colunas têm os nomes e os tipos dos
+    campos de DadosMesAnoCota.
+
+    Args:
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
+        consistencia (PreferenciaConsistencia, optional): Nível de consistência
+            mantido quando o mesmo mês possui dados brutos e consistidos:
+            'consistido', 'bruto' ou 'todos'. Defaults to "consistido".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        pd.DataFrame: Dados mensais de cota, um registro por linha
+    """
+
+    return token_auth.async_transport.run(
+        serie_historica_cota_df_async(
+            token_auth,
+            codigoestacao,
+            data_inicial,
+            data_final,
+            cache,
+            tipo_filtro_data,
+            consistencia,
+        )
+    )
+
+
+def serie_historica_vazao_df(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> pd.DataFrame:
+    """Retorna Série Histórica de Vazões da estação escolhida em um DataFrame.
+
+    Os itens JSON da API são convertidos diretamente em colunas tipadas, sem
+    instanciar o modelo Pydantic de cada registro, com um único registro por mês
+    (ver columnar.deduplica_consistencia). As colunas têm os nomes e os tipos dos
+    campos de DadosMesAnoVazao.
+
+    Args:
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            do dado e 'DATA_ULTIMA_ATUALIZACAO' pela data da última alteração.
+            Defaults to "DATA_LEITURA".
+        consistencia (PreferenciaConsistencia, optional): Nível de consistência
+            mantido quando o mesmo mês possui dados brutos e consistidos:
+            'consistido', 'bruto' ou 'todos'. Defaults to "consistido".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        pd.DataFrame: Dados mensais de vazão, um registro por linha
+    """
+
+    return token_auth.async_transport.run(
+        serie_historica_vazao_df_async(
+            token_auth,
+            codigoestacao,
+            data_inicial,
+            data_final,
+            cache,
+            tipo_filtro_data,
+            consistencia,
+        )
+    )
+
+
+def iter_serie_historica(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> Iterator[JSONList]:
+    """Retorna a Série Histórica da estação ano a ano, à medida que cada
+    requisição anual é concluída (não necessariamente em ordem cronológica).
+
+    Apenas um número limitado de anos é mantido em memória, o que permite
+    processar séries longas de muitas estações com memória constante.
+
+    Args:
+        codigoestacao (int): Código da estação
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+        tipo_filtro_data (TipoFiltroData, optional): Tipos -> 'DATA_LEITURA',
+            'DATA_ULTIMA_ATUALIZACAO'. Defaults to "DATA_LEITURA".
+
+    Raises:
+        IncompleteDataError: Erro lançado ao final da iteração caso algum ano não
+            tenha sido obtido. Os anos com falha estão em ``failures``.
+
+    Yields:
+        JSONList: Série histórica de um ano no formato JSON
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_serie_historica(
+            token_auth,
+            codigoestacao,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            cache,
+            tipo_filtro_data,
+        )
+    )
+
+
+def iter_serie_historica_chuva(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> Iterator[list[DadosMesAnoChuva]]:
+    """Retorna a Série Histórica de Chuvas da estação ano a ano, à medida que cada
+    requisição anual é concluída. Ver iter_serie_historica.
+
+    Yields:
+        list[DadosMesAnoChuva]: Dados de chuva de um ano no formato de modelo Pydantic
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_serie_historica_chuva(
+            token_auth, codigoestacao, data_inicial, data_final, cache, tipo_filtro_data
+        )
+    )
+
+
+def iter_serie_historica_cota(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> Iterator[list[DadosMesAnoCota]]:
+    """Retorna a Série Histórica de Cotas da estação ano a ano, à medida que cada
+    requisição anual é concluída. Ver iter_serie_historica.
+
+    Yields:
+        list[DadosMesAnoCota]: Dados de cota de um ano no formato de modelo Pydantic
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_serie_historica_cota(
+            token_auth, codigoestacao, data_inicial, data_final, cache, tipo_filtro_data
+        )
+    )
+
+
+def iter_serie_historica_vazao(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> Iterator[list[DadosMesAnoVazao]]:
+    """Retorna a Série Histórica de Vazões da estação ano a ano, à medida que cada
+    requisição anual é concluída. Ver iter_serie_historica.
+
+    Yields:
+        list[DadosMesAnoVazao]: Dados de vazão de um ano no formato de modelo Pydantic
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_serie_historica_vazao(
+            token_auth, codigoestacao, data_inicial, data_final, cache, tipo_filtro_data
+        )
+    )
+
+
+def iter_serie_historica_df(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    data_final: str,
+    cache: SerieCache | None = None,
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+    consistencia: PreferenciaConsistencia = "consistido",
+) -> Iterator[pd.DataFrame]:
+    """Retorna a Série Histórica da estação ano a ano em DataFrames, à medida que
+    cada requisição anual é concluída. Ver iter_serie_historica e
+    serie_historica_vazao_df.
+
+    Como os dados brutos e consistidos de um mês são retornados na mesma
+    requisição anual, cada DataFrame já contém um único registro por mês.
+
+    Yields:
+        pd.DataFrame: Dados mensais de um ano, um registro por linha
+    """
+
+    return token_auth.async_transport.iterate(
+        aiter_serie_historica_df(
+            token_auth,
+            codigoestacao,
+            tipo_estacao,
+            data_inicial,
+            data_final,
+            cache,
+            tipo_filtro_data,
+            consistencia,
+        )
+    )
@@ -0,0 +1,310 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+from api_hidro.api_requests.hidro_serie import (
+    TipoDeEstacao,
+    retorna_serie_historica_async,
+)
+from api_hidro.api_requests.hidro_telemetrica import (
+    retorna_serie_historica_telemetrica_async,
+)
+from api_hidro.data_types import IntervaloDeBusca, TipoTelemetrica
+from api_hidro.errors import IncompleteDataError
+from api_hidro.models.api_response_models import JSONList
+from api_hidro.serie_cache import SerieCache
+from api_hidro.sync_store import SyncStore
+from api_hidro.token_authentication import TokenAuthHandler
+from api_hidro.utils import split_failures
+
+# Campos que identificam um registro de cada endpoint. As séries mensais podem
+# conter o mesmo mês em mais de um nível de consistência.
+CHAVE_SERIE: dict[TipoDeEstacao, tuple[str, ...]] = {
+    "Chuva": ("Data_Hora_Dado", "Nivel_Consistencia"),
+    "Cotas": ("Data_Hora_Dado", "Nivelconsistencia"),
+    "Vazao": ("Data_Hora_Dado", "Nivel_Consistencia"),
+}
+CHAVE_TELEMETRICA = ("Data_Hora_Medicao",)
+
+
+async def __sincroniza(
+    store: SyncStore,
+    endpoint: str,
+    codigoestacao: int,
+    chave: tuple[str, ...],
+    consulta: Callable[[date | None, date], Awaitable[JSONList | None]],
+) -> int:
+    hoje = date.today()
+    # SQLite, zlib e JSON em uma thread auxiliar, para não bloquear as
+    # requisições das demais estações
+    marca = await asyncio.to_thread(store.watermark, endpoint, codigoestacao)
+
+    try:
+        items: JSONList = await consulta(marca, hoje) or []
+    except IncompleteDataError as exc:
+        # Grava o que foi obtido, mas mantém a marca d'água para repetir o período
+        await asyncio.to_thread(
+            store.merge, endpoint, codigoestacao, exc.data, chave, None
+        )
+        raise
+
+    # As alterações do próprio dia voltam a ser consultadas na próxima execução
+    return await asyncio.to_thread(
+        store.merge, endpoint, codigoestacao, items, chave, hoje
+    )
+
+
+async def sincroniza_serie_historica_async(
+    token_auth: TokenAuthHandler,
+    store: SyncStore,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    cache: SerieCache | None = None,
+) -> int:
+    """Versão assíncrona de sincroniza_serie_historica
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        store (SyncStore): Armazenamento local da série sincronizada
+        codigoestacao (int): Código da estação
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD, usada na primeira
+            sincronização da estação
+        cache (SerieCache | None, optional): Cache local das respostas anuais,
+            usado na primeira sincronização. Defaults to None.
+
+    Returns:
+        int: Número de registros gravados
+    """
+
+    async def consulta(marca: date | None, hoje: date) -> JSONList | None:
+        if marca is None:
+            return await retorna_serie_historica_async(
+                token_auth,
+                codigoestacao,
+                tipo_estacao,
+                data_inicial,
+                hoje.isoformat(),
+                cache,
+            )
+        return await retorna_serie_historica_async(
+            token_auth,
+            codigoestacao,
+            tipo_estacao,
+            min(marca, hoje).isoformat(),
+            hoje.isoformat(),
+            tipo_filtro_data="DATA_ULTIMA_ATUALIZACAO",
+        )
+
+    return await __sincroniza(
+        store,
+        f"HidroSerie{tipo_estacao}",
+        codigoestacao,
+        CHAVE_SERIE[tipo_estacao],
+        consulta,
+    )
+
+
+async def sincroniza_serie_telemetrica_async(
+    token_auth: TokenAuthHandler,
+    store: SyncStore,
+    codigoestacao: int,
+    tipo_telemetrica: TipoTelemetrica,
+    data_inicial: str,
+    intervalo_busca: IntervaloDeBusca = "HORA_24",
+) -> int:
+    """Versão assíncrona de sincroniza_serie_telemetrica
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        store (SyncStore): Armazenamento local da série sincronizada
+        codigoestacao (int): Código da estação
+        tipo_telemetrica (TipoTelemetrica): Tipos -> 'Detalhada', 'Adotada'
+        data_inicial (str): Data no formato YYYY-MM-DD, usada na primeira
+            sincronização da estação
+        intervalo_busca (IntervaloDeBusca, optional): Intervalos definidos na API
+            (5min até 24h). Defaults to "HORA_24".
+
+    Returns:
+        int: Número de registros gravados
+    """
+
+    async def consulta(marca: date | None, hoje: date) -> JSONList | None:
+        return await retorna_serie_historica_telemetrica_async(
+            token_auth,
+            codigoestacao,
+            tipo_telemetrica,
+            "DATA_LEITURA" if marca is None else "DATA_ULTIMA_ATUALIZACAO",
+            data_inicial if marca is None else min(marca, hoje).isoformat(),
+            hoje.isoformat(),
+            intervalo_busca,
+        )
+
+    return await __sincroniza(
+        store,
+        f"HidroinfoanaSerieTelemetrica{tipo_telemetrica}",
+        codigoestacao,
+        CHAVE_TELEMETRICA,
+        consulta,
+    )
+
+
+async def sincroniza_estacoes_async(
+    token_auth: TokenAuthHandler,
+    store: SyncStore,
+    codigos: list[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    cache: SerieCache | None = None,
+) -> dict[int, int]:
+    """Versão assíncrona de sincroniza_estacoes
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        store (SyncStore): Armazenamento local das séries sincronizadas
+        codigos (list[int]): Códigos das estações
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD, usada na primeira
+            sincronização de cada estação
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+
+    Raises:
+        IncompleteDataError: Erro lançado caso a sincronização de alguma estação
+            falhe. As estações sincronizadas são preservadas em ``data``.
+
+    Returns:
+        dict[int, int]: Número de registros gravados por estação
+    """
+
+    result = await asyncio.gather(
+        *[
+            sincroniza_serie_historica_async(
+                token_auth, store, codigo, tipo_estacao, data_inicial, cache
+            )
+            for codigo in codigos
+        ],
+        return_exceptions=True,
+    )
+
+    successes, failures = split_failures(codigos, result)
+
+    if failures:
+        raise IncompleteDataError(
+            f"Falha ao sincronizar {len(failures)} de {len(codigos)} estações: "
+            f"{sorted(failures)}",
+            data=successes,
+            failures=failures,
+        )
+
+    return successes
+
+
+def sincroniza_serie_historica(
+    token_auth: TokenAuthHandler,
+    store: SyncStore,
+    codigoestacao: int,
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    cache: SerieCache | None = None,
+) -> int:
+    """Sincroniza incrementalmente a série histórica da estação com o
+    armazenamento local.
+
+    Na primeira sincronização, a série é obtida a partir de data_inicial. Nas
+    seguintes, somente os registros alterados desde a marca d'água da estação
+    (filtro 'DATA_ULTIMA_ATUALIZACAO') são consultados e gravados pela chave
+    primária, substituindo a versão anterior.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        store (SyncStore): Armazenamento local da série sincronizada
+        codigoestacao (int): Código da estação
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD, usada na primeira
+            sincronização da estação
+        cache (SerieCache | None, optional): Cache local das respostas anuais,
+            usado na primeira sincronização. Defaults to None.
+
+    Returns:
+        int: Número de registros gravados
+    """
+
+    return token_auth.async_transport.run(
+        sincroniza_serie_historica_async(
+            token_auth, store, codigoestacao, tipo_estacao, data_inicial, cache
+        )
+    )
+
+
+def sincroniza_serie_telemetrica(
+    token_auth: TokenAuthHandler,
+    store: SyncStore,
+    codigoestacao: int,
+    tipo_telemetrica: TipoTelemetrica,
+    data_inicial: str,
+    intervalo_busca: IntervaloDeBusca = "HORA_24",
+) -> int:
+    """Sincroniza incrementalmente a série telemétrica da estação com o
+    armazenamento local.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        store (SyncStore): Armazenamento local da série sincronizada
+        codigoestacao (int): Código da estação
+        tipo_telemetrica (TipoTelemetrica): Tipos -> 'Detalhada', 'Adotada'
+        data_inicial (str): Data no formato YYYY-MM-DD, usada na primeira
+            sincronização da estação
+        intervalo_busca (IntervaloDeBusca, optional): Intervalos definidos na API
+            (5min até 24h). Defaults to "HORA_24".
+
+    Returns:
+        int: Número de registros gravados
+    """
+
+    return token_auth.async_transport.run(
+        sincroniza_serie_telemetrica_async(
+            token_auth,
+            store,
+            codigoestacao,
+            tipo_telemetrica,
+            data_inicial,
+            intervalo_busca,
+        )
+    )
+
+
+def sincroniza_estacoes(
+    token_auth: TokenAuthHandler,
+    store: SyncStore,
+    codigos: list[int],
+    tipo_estacao: TipoDeEstacao,
+    data_inicial: str,
+    cache: SerieCache | None = None,
+) -> dict[int, int]:
+    """Sincroniza incrementalmente as séries históricas de várias estações
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+        store (SyncStore): Armazenamento local das séries sincronizadas
+        codigos (list[int]): Códigos das estações
+        tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+        data_inicial (str): Data no formato YYYY-MM-DD, usada na primeira
+            sincronização de cada estação
+        cache (SerieCache | None, optional): Cache local das respostas anuais.
+            Defaults to None.
+
+    Raises:
+        IncompleteDataError: Erro lançado caso a sincronização de alguma estação
+            falhe. As estações sincronizadas são preservadas em ``data``.
+
+    Returns:
+        dict[int, int]: Número de registros gravados por estação
+    """
+
+    return token_auth.async_transport.run(
+        sincroniza_estacoes_async(
+            token_auth, store, codigos, tipo_estacao, data_inicial, cache
+        )
+    )
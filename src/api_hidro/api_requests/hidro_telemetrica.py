@@ -1,13 +1,12 @@
-import asyncio
 from datetime import datetime, timedelta
 
-from api_hidro.api_requests.sync_request import http_get_sync
+from api_hidro.api_requests.async_request import api_get_async
 from api_hidro.data_types import IntervaloDeBusca, TipoFiltroData, TipoTelemetrica
-from api_hidro.errors import TimeSerieNotFoundError
+from api_hidro.errors import IncompleteDataError, TimeSerieNotFoundError
 from api_hidro.models.api_response_models import JSONList
 from api_hidro.models.models import DadoTelemetricaAdotada, DadoTelemetricaDetalhada
 from api_hidro.token_authentication import TokenAuthHandler
-from api_hidro.utils import flatten_concatenation
+from api_hidro.utils import flatten_concatenation, gather_bounded
 
 
 async def __retorna_serie_telemetrica_async(
@@ -18,17 +17,27 @@ async def __retorna_serie_telemetrica_async(
     data_busca: str,
     intervalo_busca: IntervaloDeBusca,
 ) -> JSONList:
-    with token_auth as api_token:
-        headers = {"Authorization": f"Bearer {api_token}"}
-        url = f"https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroinfoanaSerieTelemetrica{tipo_telemetrica}/v1"
-        params: dict[str, int | str | float | bool | None] = {
-            "Código da Estação": codigoestacao,
-            "Tipo Filtro Data": tipo_filtro_data,
-            "Data de Busca (yyyy-MM-dd)": data_busca,
-            "Range Intervalo de busca": intervalo_busca,
-        }
-        data = await asyncio.to_thread(http_get_sync, url, headers, params)
-        return data["items"]
+    url = f"https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroinfoanaSerieTelemetrica{tipo_telemetrica}/v1"
+    params: dict[str, int | str | float | bool | None] = {
+        "Código da Estação": codigoestacao,
+        "Tipo Filtro Data": tipo_filtro_data,
+        "Data de Busca (yyyy-MM-dd)": data_busca,
+        "Range Intervalo de busca": intervalo_busca,
+    }
+    data = await api_get_async(token_auth, url, params, fairness_key=codigoestacao)
+    return data["items"]
+
+
+def __remove_duplicados(dias: list[JSONList]) -> JSONList:
+    # Janelas de busca de dias consecutivos podem retornar a mesma medição
+    vistos: set[tuple] = set()
+    data: JSONList = []
+    for item in flatten_concatenation(dias):
+        chave = (item.get("codigoestacao"), item.get("Data_Hora_Medicao"))
+        if chave not in vistos:
+            vistos.add(chave)
+            data.append(item)
+    return data
 
 
 async def __retorna_serie_historica_telemetrica(
@@ -42,7 +51,9 @@ async def __retorna_serie_historica_telemetrica(
 ) -> JSONList | None:
     """Função privada do módulo
         Retorna os dados da estação telemétrica para o período selecionado.
-        Será permitido um período máximo de 10 dias consecutivos
+        O período é dividido em requisições diárias, executadas por um número
+        limitado de workers, e os registros repetidos entre dias consecutivos são
+        descartados.
 
     Args:
         token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler para autenticação
@@ -67,32 +78,38 @@ async def __retorna_serie_historica_telemetrica(
     if dt_final < dt_inicial:
         raise ValueError("Data final não pode ser menor que data inicial")
 
-    dif_dias = (dt_final - dt_inicial).days
-    if dif_dias > 10:
-        raise ValueError(
-            "Intervalo de tempo entre datas deve ser menor ou igual a 10 dias"
+    dias = [
+        (dt_inicial + timedelta(days=num_dias)).strftime("%Y-%m-%d")
+        for num_dias in range((dt_final - dt_inicial).days + 1)
+    ]
+
+    async def retorna_dia(dia: str) -> JSONList:
+        return await __retorna_serie_telemetrica_async(
+            token_auth,
+            codigoestacao,
+            tipo_telemetrica,
+            tipo_filtro_data,
+            dia,
+            intervalo_busca,
         )
 
-    result = await asyncio.gather(
-        *[
-            __retorna_serie_telemetrica_async(
-                token_auth,
-                codigoestacao,
-                tipo_telemetrica,
-                tipo_filtro_data,
-                (dt_inicial + timedelta(days=num_dias)).strftime("%Y-%m-%d"),
-                intervalo_busca,
-            )
-            for num_dias in range(dif_dias + 1)
-        ]
+    successes, failures = await gather_bounded(
+        dias, retorna_dia, token_auth.async_transport.scheduler.max_concurrency
     )
+    data = __remove_duplicados([i for i in successes.values() if i])
+
+    if failures:
+        raise IncompleteDataError(
+            f"Falha ao obter {len(failures)} de {len(dias)} dias da série telemétrica "
+            f"da estação {codigoestacao}: {sorted(failures)}",
+            data=data,
+            failures=failures,
+        )
 
-    data = [i for i in result if i]
-
-    return flatten_concatenation(data)
+    return data
 
 
-def retorna_serie_historica_telemetrica(
+async def retorna_serie_historica_telemetrica_async(
     token_auth: TokenAuthHandler,
     codigoestacao: int,
     tipo_telemetrica: TipoTelemetrica,
@@ -101,8 +118,7 @@ def retorna_serie_historica_telemetrica(
     data_final: str,
     intervalo_busca: IntervaloDeBusca,
 ) -> JSONList | None:
-    """Retorna os dados da estação telemétrica para o período selecionado.
-        Será permitido um período máximo de 10 dias consecutivos
+    """Versão assíncrona de retorna_serie_historica_telemetrica.
 
     Args:
         token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler para autenticação
@@ -117,28 +133,26 @@ def retorna_serie_historica_telemetrica(
     Returns:
         JSONList | None: Série histórica no formato JSON (dicionário Python)
     """
-    return asyncio.run(
-        __retorna_serie_historica_telemetrica(
-            token_auth,
-            codigoestacao,
-            tipo_telemetrica,
-            tipo_filtro_data,
-            data_inicial,
-            data_final,
-            intervalo_busca,
-        )
+    return await __retorna_serie_historica_telemetrica(
+        token_auth,
+        codigoestacao,
+        tipo_telemetrica,
+        tipo_filtro_data,
+        data_inicial,
+        data_final,
+        intervalo_busca,
     )
 
 
-def serie_historica_telemetrica_adotada(
+async def serie_historica_telemetrica_adotada_async(
     token_auth: TokenAuthHandler,
     codigoestacao: int,
     data_inicial: str,
     data_final: str,
     intervalo_busca: IntervaloDeBusca = "HORA_24",
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> list[DadoTelemetricaAdotada]:
-    """Retorna os dados resumidos da estação telemétrica para o período selecionado.
-        Será permitido um período máximo de 10 dias consecutivos
+    """Versão assíncrona de serie_historica_telemetrica_adotada.
 
     Args:
         token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler
@@ -147,6 +161,9 @@ def serie_historica_telemetrica_adotada(
         data_final (str): Data no formato YYYY-MM-DD
         intervalo_busca (IntervaloDeBusca, optional): Intervalos definidos na API (5min até 24h).
             Defaults to "HORA_24".
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            da medição e 'DATA_ULTIMA_ATUALIZACAO' pela data da última atualização.
+            Defaults to "DATA_LEITURA".
 
     Raises:
         TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
@@ -155,11 +172,11 @@ def serie_historica_telemetrica_adotada(
         list[DadoTelemetricaAdotada]: Lista de dados da estação telemétrica adotada
         no formato de modelo Pydantic - classe DadoTelemetricaAdotada
     """
-    dados_telemetrica = retorna_serie_historica_telemetrica(
+    dados_telemetrica = await retorna_serie_historica_telemetrica_async(
         token_auth,
         codigoestacao,
         "Adotada",
-        "DATA_LEITURA",
+        tipo_filtro_data,
         data_inicial,
         data_final,
         intervalo_busca,
@@ -176,15 +193,15 @@ def serie_historica_telemetrica_adotada(
     ]
 
 
-def serie_historica_telemetrica_detalhada(
+async def serie_historica_telemetrica_detalhada_async(
     token_auth: TokenAuthHandler,
     codigoestacao: int,
     data_inicial: str,
     data_final: str,
     intervalo_busca: IntervaloDeBusca = "HORA_24",
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
 ) -> list[DadoTelemetricaDetalhada]:
-    """Retorna os dados detalhados da estação telemétrica para o período selecionado.
-        Será permitido um período máximo de 10 dias consecutivos
+    """Versão assíncrona de serie_historica_telemetrica_detalhada.
 
     Args:
         token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler
@@ -193,19 +210,22 @@ def serie_historica_telemetrica_detalhada(
         data_final (str): Data no formato YYYY-MM-DD
         intervalo_busca (IntervaloDeBusca, optional): Intervalos definidos na API (5min até 24h).
             Defaults to "HORA_24".
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            da medição e 'DATA_ULTIMA_ATUALIZACAO' pela data da última atualização.
+            Defaults to "DATA_LEITURA".
 
     Raises:
         TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
 
     Returns:
-        list[DadoTelemetricaAdotada]: Lista de dados da estação telemétrica adotada
-        no formato de modelo Pydantic - classe DadoTelemetricaAdotada
+        list[DadoTelemetricaDetalhada]: Lista de dados da estação telemétrica detalhada
+        no formato de modelo Pydantic - classe DadoTelemetricaDetalhada
     """
-    dados_telemetrica = retorna_serie_historica_telemetrica(
+    dados_telemetrica = await retorna_serie_historica_telemetrica_async(
         token_auth,
         codigoestacao,
         "Detalhada",
-        "DATA_LEITURA",
+        tipo_filtro_data,
         data_inicial,
         data_final,
         intervalo_busca,
@@ -213,10 +233,127 @@ def serie_historica_telemetrica_detalhada(
 
     if not dados_telemetrica:
         raise TimeSerieNotFoundError(
-            f"Série histórica telemétrica adotada não encontrada para o código da estação {codigoestacao}."
+            f"Série histórica telemétrica detalhada não encontrada para o código da estação {codigoestacao}."
         )
 
     return [
         DadoTelemetricaDetalhada.model_validate(item, by_alias=True)
         for item in dados_telemetrica
     ]
+
+
+def retorna_serie_historica_telemetrica(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    tipo_telemetrica: TipoTelemetrica,
+    tipo_filtro_data: TipoFiltroData,
+    data_inicial: str,
+    data_final: str,
+    intervalo_busca: IntervaloDeBusca,
+) -> JSONList | None:
+    """Retorna os dados da estação telemétrica para o período selecionado.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler para autenticação
+            de acesso à API
+        codigoestacao (int): Código da estação
+        tipo_telemetrica (TipoTelemetrica): Tipos -> 'Detalhada', 'Adotada'
+        tipo_filtro_data (TipoFiltroData): Tipos -> 'DATA_LEITURA', 'DATA_ULTIMA_ATUALIZACAO'
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        intervalo_busca (IntervaloDeBusca): Intervalos definidos na API (5min até 24h)
+
+    Returns:
+        JSONList | None: Série histórica no formato JSON (dicionário Python)
+    """
+    return token_auth.async_transport.run(
+        retorna_serie_historica_telemetrica_async(
+            token_auth,
+            codigoestacao,
+            tipo_telemetrica,
+            tipo_filtro_data,
+            data_inicial,
+            data_final,
+            intervalo_busca,
+        )
+    )
+
+
+def serie_historica_telemetrica_adotada(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    intervalo_busca: IntervaloDeBusca = "HORA_24",
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> list[DadoTelemetricaAdotada]:
+    """Retorna os dados resumidos da estação telemétrica para o período selecionado.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        intervalo_busca (IntervaloDeBusca, optional): Intervalos definidos na API (5min até 24h).
+            Defaults to "HORA_24".
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            da medição e 'DATA_ULTIMA_ATUALIZACAO' pela data da última atualização.
+            Defaults to "DATA_LEITURA".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        list[DadoTelemetricaAdotada]: Lista de dados da estação telemétrica adotada
+        no formato de modelo Pydantic - classe DadoTelemetricaAdotada
+    """
+    return token_auth.async_transport.run(
+        serie_historica_telemetrica_adotada_async(
+            token_auth,
+            codigoestacao,
+            data_inicial,
+            data_final,
+            intervalo_busca,
+            tipo_filtro_data,
+        )
+    )
+
+
+def serie_historica_telemetrica_detalhada(
+    token_auth: TokenAuthHandler,
+    codigoestacao: int,
+    data_inicial: str,
+    data_final: str,
+    intervalo_busca: IntervaloDeBusca = "HORA_24",
+    tipo_filtro_data: TipoFiltroData = "DATA_LEITURA",
+) -> list[DadoTelemetricaDetalhada]:
+    """Retorna os dados detalhados da estação telemétrica para o período selecionado.
+
+    Args:
+        token_auth (TokenAuthHandler): Objeto da classe TokenAuthHandler
+        codigoestacao (int): Código da estação
+        data_inicial (str): Data no formato YYYY-MM-DD
+        data_final (str): Data no formato YYYY-MM-DD
+        intervalo_busca (IntervaloDeBusca, optional): Intervalos definidos na API (5min até 24h).
+            Defaults to "HORA_24".
+        tipo_filtro_data (TipoFiltroData, optional): 'DATA_LEITURA' filtra pela data
+            da medição e 'DATA_ULTIMA_ATUALIZACAO' pela data da última atualização.
+            Defaults to "DATA_LEITURA".
+
+    Raises:
+        TimeSerieNotFoundError: Erro lançado caso a série histórica não seja encontrada
+
+    Returns:
+        list[DadoTelemetricaAdotada]: Lista de dados da estação telemétrica adotada
+        no formato de modelo Pydantic - classe DadoTelemetricaAdotada
+    """
+    return token_auth.async_transport.run(
+        serie_historica_telemetrica_detalhada_async(
+            token_auth,
+            codigoestacao,
+            data_inicial,
+            data_final,
+            intervalo_busca,
+            tipo_filtro_data,
+        )
+    )
@@ -0,0 +1,95 @@
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from pydantic import BaseModel, Field
+
+# Status HTTP transitórios: a mesma requisição GET pode ter sucesso se repetida
+TRANSIENT_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryPolicy(BaseModel):
+    """Política de novas tentativas das requisições à API HIDRO.
+
+    Somente requisições GET (idempotentes) são feitas pela biblioteca, portanto
+    são repetidas apenas falhas transitórias: erros de conexão/timeout e os
+    status de ``retry_status``. A espera entre tentativas cresce
+    exponencialmente (``backoff_base * 2 ** tentativa``), limitada a
+    ``backoff_max``, com jitter aleatório. Quando a resposta traz o cabeçalho
+    ``Retry-After``, o tempo indicado pelo servidor é respeitado.
+
+    Args:
+        max_attempts (int): Número máximo de tentativas, incluindo a primeira.
+            Defaults to 5.
+        backoff_base (float): Espera, em segundos, antes da segunda tentativa.
+            Defaults to 0.5.
+        backoff_max (float): Espera máxima, em segundos, entre tentativas.
+            Defaults to 30.0.
+        jitter (bool): Sorteia a espera entre zero e o valor exponencial
+            ("full jitter"), evitando que requisições concorrentes repitam juntas.
+            Defaults to True.
+        retry_after_max (float): Espera máxima aceita do cabeçalho Retry-After.
+            Defaults to 120.0.
+        retry_status (frozenset[int]): Status HTTP considerados transitórios.
+    """
+
+    max_attempts: int = Field(default=5, ge=1)
+    backoff_base: float = Field(default=0.5, ge=0)
+    backoff_max: float = Field(default=30.0, ge=0)
+    jitter: bool = True
+    retry_after_max: float = Field(default=120.0, ge=0)
+    retry_status: frozenset[int] = TRANSIENT_STATUS
+
+    def should_retry(self, attempt: int, status_code: int | None = None) -> bool:
+        """Indica se a requisição deve ser repetida
+
+        Args:
+            attempt (int): Número da tentativa que falhou, a partir de 1
+            status_code (int | None, optional): Status HTTP da resposta. None indica
+                erro de conexão ou timeout. Defaults to None.
+
+        Returns:
+            bool: True caso ainda haja tentativas e a falha seja transitória
+        """
+
+        if attempt >= self.max_attempts:
+            return False
+        return status_code is None or status_code in self.retry_status
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Tempo de espera, em segundos, antes da próxima tentativa
+
+        Args:
+            attempt (int): Número da tentativa que falhou, a partir de 1
+            retry_after (str | None, optional): Valor do cabeçalho Retry-After.
+                Defaults to None.
+
+        Returns:
+            float: Tempo de espera em segundos
+        """
+
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.retry_after_max)
+
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Converte o cabeçalho Retry-After (segundos ou data HTTP) em segundos"""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
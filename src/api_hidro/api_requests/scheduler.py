@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from threading import Lock
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Limitador de taxa do tipo token bucket.
+
+    Cada requisição consome uma ficha; as fichas são repostas a ``rate`` por
+    segundo até o limite ``capacity``. Quando não há fichas disponíveis, a
+    requisição reserva a próxima ficha e aguarda o tempo necessário, de modo
+    que requisições concorrentes são espaçadas sem espera ativa.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate deve ser positivo e capacity maior ou igual a 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.__tokens = capacity
+        self.__updated = time.monotonic()
+        self.__lock = Lock()
+
+    def reserve(self) -> float:
+        """Reserva uma ficha e retorna o tempo de espera, em segundos, até utilizá-la"""
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(
+                self.capacity, self.__tokens + (now - self.__updated) * self.rate
+            )
+            self.__updated = now
+            self.__tokens -= 1
+            return max(0.0, -self.__tokens / self.rate)
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RequestScheduler:
+    """Escalonador das requisições assíncronas à API HIDRO.
+
+    Combina um limite global de requisições simultâneas, um token bucket por
+    host e uma fila justa (round-robin) entre chaves, normalmente o código da
+    estação. Assim, uma estação com 95 anos de série não monopoliza as vagas
+    enquanto outras estações aguardam, e o total de requisições por segundo
+    enviado a www.ana.gov.br permanece abaixo do limite de throttling.
+
+    Args:
+        max_concurrency (int): Número máximo de requisições simultâneas. Defaults to 20.
+        rate_per_host (float | None): Requisições por segundo permitidas por host.
+            None desativa o limite de taxa. Defaults to 20.0.
+        burst (int | None): Capacidade do token bucket (rajada máxima). Defaults
+            to max_concurrency.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        rate_per_host: float | None = 20.0,
+        burst: int | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser maior ou igual a 1")
+        self.max_concurrency = max_concurrency
+        self.rate_per_host = rate_per_host
+        self.burst = burst or max_concurrency
+        self.__active = 0
+        self.__waiting: OrderedDict[Hashable, deque[asyncio.Future[None]]] = (
+            OrderedDict()
+        )
+        self.__granted: set[asyncio.Future[None]] = set()
+        self.__buckets: dict[str, TokenBucket] = {}
+        self.__lock = Lock()
+
+    @property
+    def active(self) -> int:
+        return self.__active
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(fila) for fila in self.__waiting.values())
+
+    def __bucket(self, host: str) -> TokenBucket | None:
+        if self.rate_per_host is None:
+            return None
+        with self.__lock:
+            bucket = self.__buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_host, self.burst)
+                self.__buckets[host] = bucket
+            return bucket
+
+    async def __acquire(self, key: Hashable) -> None:
+        with self.__lock:
+            if self.__active < self.max_concurrency and not self.__waiting:
+                self.__active += 1
+                return
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self.__waiting.setdefault(key, deque()).append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.__lock:
+                granted = future in self.__granted
+                self.__granted.discard(future)
+                fila = self.__waiting.get(key)
+                if fila is not None and future in fila:
+                    fila.remove(future)
+                    if not fila:
+                        del self.__waiting[key]
+            if granted:
+                self.__release()
+            raise
+
+        with self.__lock:
+            self.__granted.discard(future)
+
+    def __release(self) -> None:
+        with self.__lock:
+            while self.__waiting:
+                # Round-robin: a chave atendida vai para o fim da fila
+                key, fila = self.__waiting.popitem(last=False)
+                future = fila.popleft()
+                if fila:
+                    self.__waiting[key] = fila
+                if future.done():
+                    continue
+                try:
+                    # A vaga é transferida diretamente para a próxima requisição
+                    future.get_loop().call_soon_threadsafe(_grant, future)
+                except RuntimeError:
+                    # Event loop do requisitante já foi encerrado
+                    continue
+                self.__granted.add(future)
+                return
+            self.__active -= 1
+
+    @asynccontextmanager
+    async def slot(self, url: str, key: Hashable = None) -> AsyncIterator[None]:
+        """Aguarda uma vaga para enviar uma requisição para a URL informada
+
+        Args:
+            url (str): URL da requisição, usada para selecionar o token bucket do host
+            key (Hashable, optional): Chave de justiça da fila (ex.: código da estação).
+                Defaults to None.
+        """
+
+        await self.__acquire(key)
+        try:
+            bucket = self.__bucket(urlsplit(url).netloc)
+            if bucket is not None:
+                await bucket.acquire()
+            yield
+        finally:
+            self.__release()
+
+
+def _grant(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -1,16 +1,42 @@
+import time
 from typing import Any
 
 import requests
 
+from api_hidro import json_decoder
+from api_hidro.api_requests.transport import HttpTransport, default_transport
 from api_hidro.models.api_response_models import JSONObject
 
 
 def http_get_sync(
-    url: str, headers: dict[str, Any], params: JSONObject
+    url: str,
+    headers: dict[str, Any],
+    params: JSONObject,
+    transport: HttpTransport | None = None,
 ) -> dict[str, Any]:
-    response = requests.get(url, headers=headers, params=params)
+    transport = transport or default_transport()
+    retry = transport.config.retry
+    attempt = 1
+
+    while True:
+        try:
+            response = transport.get(url, headers=headers, params=params)
+        except (requests.ConnectionError, requests.Timeout):
+            if not retry.should_retry(attempt):
+                raise
+            time.sleep(retry.delay(attempt))
+            attempt += 1
+            continue
+
+        if response.status_code != 200 and retry.should_retry(
+            attempt, response.status_code
+        ):
+            time.sleep(retry.delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
+            continue
+        break
 
     if response.status_code != 200:
         response.raise_for_status()
 
-    return response.json()
+    return json_decoder.loads(response.content)
@@ -0,0 +1,328 @@
+import asyncio
+import os
+import weakref
+from collections.abc import AsyncGenerator, Coroutine, Hashable, Iterator
+from threading import Lock, Thread
+from types import TracebackType
+from typing import Any
+
+import httpx
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+
+from api_hidro.api_requests.coalescing import RequestCoalescer
+from api_hidro.api_requests.retry import RetryPolicy
+from api_hidro.api_requests.scheduler import RequestScheduler
+from api_hidro.models.api_response_models import JSONObject
+
+
+class TransportConfig(BaseModel):
+    """Configuração do pool de conexões HTTP usado nas requisições à API HIDRO
+
+    Args:
+        pool_connections (int): Número de pools (hosts) mantidos em cache. Defaults to 10.
+        pool_maxsize (int): Número máximo de conexões mantidas abertas por host.
+            Defaults to 100.
+        connect_timeout (float): Tempo máximo, em segundos, para abrir a conexão.
+            Defaults to 10.0.
+        read_timeout (float): Tempo máximo, em segundos, de espera pela resposta.
+            Defaults to 120.0.
+        keep_alive (bool): Mantém a conexão aberta (HTTP/1.1 keep-alive) entre
+            requisições. Defaults to True.
+        retry (RetryPolicy): Política de novas tentativas para falhas transitórias.
+        coalesce (bool): Agrupa requisições idênticas simultâneas à API em uma
+            única requisição (ver RequestCoalescer). Defaults to True.
+    """
+
+    pool_connections: int = Field(default=10, ge=1)
+    pool_maxsize: int = Field(default=100, ge=1)
+    connect_timeout: float = Field(default=10.0, gt=0)
+    read_timeout: float = Field(default=120.0, gt=0)
+    keep_alive: bool = True
+    retry: RetryPolicy = RetryPolicy()
+    coalesce: bool = True
+
+
+class HttpTransport:
+    """Transporte HTTP síncrono com pool de conexões keep-alive.
+
+    Uma única instância pode ser compartilhada por todas as requisições
+    (inventário, séries, telemetria e obtenção do token), evitando abrir uma
+    nova conexão TCP/TLS a cada chamada.
+    """
+
+    def __init__(self, config: TransportConfig | None = None):
+        self.config = config or TransportConfig()
+        self.__session: requests.Session | None = None
+        self.__lock = Lock()
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return self.config.connect_timeout, self.config.read_timeout
+
+    @property
+    def session(self) -> requests.Session:
+        with self.__lock:
+            if self.__session is None:
+                self.__session = self.__cria_sessao()
+            return self.__session
+
+    def __cria_sessao(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = (
+            "keep-alive" if self.config.keep_alive else "close"
+        )
+        return session
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: JSONObject | None = None,
+    ) -> requests.Response:
+        return self.session.get(
+            url, headers=headers, params=params, timeout=self.timeout
+        )
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ):
+        self.close()
+
+
+class AsyncHttpTransport:
+    """Transporte HTTP assíncrono (não bloqueante) com pool de conexões keep-alive.
+
+    Cada event loop recebe o seu próprio cliente ``httpx.AsyncClient``, criado sob
+    demanda. As chamadas síncronas da biblioteca são executadas em um event loop
+    de fundo, mantido pelo transporte, de modo que conexões são reaproveitadas
+    entre chamadas e as funções síncronas podem ser usadas mesmo quando já existe
+    um event loop em execução (Jupyter, por exemplo).
+
+    Todas as requisições passam pelo ``RequestScheduler``, que limita a
+    concorrência global e a taxa de requisições por host. Com
+    ``TransportConfig.coalesce``, requisições idênticas simultâneas à API são
+    agrupadas pelo ``RequestCoalescer`` em uma única requisição.
+    """
+
+    def __init__(
+        self,
+        config: TransportConfig | None = None,
+        scheduler: RequestScheduler | None = None,
+        coalescer: RequestCoalescer | None = None,
+    ):
+        self.config = config or TransportConfig()
+        self.scheduler = scheduler or RequestScheduler()
+        self.coalescer = coalescer or RequestCoalescer()
+        self.__clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__loop_thread: Thread | None = None
+        self.__loop_pid: int | None = None
+        self.__lock = Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self.__clients.get(loop)
+        if client is None or client.is_closed:
+            client = self.__cria_cliente()
+            self.__clients[loop] = client
+        return client
+
+    def __cria_cliente(self) -> httpx.AsyncClient:
+        keepalive = self.config.pool_maxsize if self.config.keep_alive else 0
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.pool_maxsize,
+                max_keepalive_connections=keepalive,
+            ),
+            timeout=httpx.Timeout(
+                self.config.read_timeout, connect=self.config.connect_timeout
+            ),
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: JSONObject | None = None,
+        fairness_key: Hashable = None,
+    ) -> httpx.Response:
+        # Parâmetros None são omitidos, como no requests
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        async with self.scheduler.slot(url, fairness_key):
+            return await self.client.get(url, headers=headers, params=params)
+
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP associado ao event loop em execução"""
+
+        client = self.__clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def __background_loop(self) -> asyncio.AbstractEventLoop:
+        with self.__lock:
+            # Após um fork a thread do loop não existe no processo filho
+            if self.__loop is None or self.__loop_pid != os.getpid():
+                self.__loop = asyncio.new_event_loop()
+                self.__loop_thread = Thread(
+                    target=self.__loop.run_forever, name="api-hidro-loop", daemon=True
+                )
+                self.__loop_thread.start()
+                self.__loop_pid = os.getpid()
+            return self.__loop
+
+    def run[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Executa a corrotina no event loop de fundo do transporte e aguarda o resultado
+
+        Args:
+            coro (Coroutine): Corrotina a ser executada
+
+        Raises:
+            RuntimeError: Erro lançado caso seja chamado de dentro do próprio loop de
+                fundo, o que causaria um deadlock
+
+        Returns:
+            T: Resultado da corrotina
+        """
+
+        loop = self.__background_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coro.close()
+            raise RuntimeError(
+                "Funções síncronas não podem ser chamadas de dentro do event loop "
+                "do transporte. Utilize as funções de api_hidro.aio."
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result()
+        finally:
+            future.cancel()
+
+    def iterate[T](self, agen: AsyncGenerator[T, None]) -> Iterator[T]:
+        """Consome um gerador assíncrono no event loop de fundo do transporte
+
+        Cada item é obtido por uma chamada a run, de modo que apenas os itens já
+        consumidos são mantidos em memória. Caso o consumidor interrompa a
+        iteração, o gerador assíncrono é encerrado no loop de fundo.
+
+        Args:
+            agen (AsyncGenerator): Gerador assíncrono a ser consumido
+
+        Returns:
+            Iterator[T]: Iterador síncrono sobre os itens do gerador
+        """
+
+        async def proximo() -> T:
+            return await anext(agen)
+
+        async def encerra() -> None:
+            await agen.aclose()
+
+        try:
+            while True:
+                try:
+                    yield self.run(proximo())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(encerra())
+
+    def close(self) -> None:
+        """Fecha as conexões e encerra o event loop de fundo, caso exista"""
+
+        with self.__lock:
+            loop, thread = self.__loop, self.__loop_thread
+            self.__loop = self.__loop_thread = self.__loop_pid = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ):
+        await self.aclose()
+
+
+__default_transport: HttpTransport | None = None
+__default_async_transport: AsyncHttpTransport | None = None
+__default_transport_lock = Lock()
+
+
+def default_transport() -> HttpTransport:
+    """Retorna o transporte HTTP compartilhado do processo, criado sob demanda"""
+
+    global __default_transport
+    with __default_transport_lock:
+        if __default_transport is None:
+            __default_transport = HttpTransport()
+        return __default_transport
+
+
+def set_default_transport(transport: HttpTransport) -> None:
+    """Substitui o transporte HTTP compartilhado do processo
+
+    Args:
+        transport (HttpTransport): Novo transporte a ser usado por padrão
+    """
+
+    global __default_transport
+    with __default_transport_lock:
+        __default_transport = transport
+
+
+def default_async_transport() -> AsyncHttpTransport:
+    """Retorna o transporte HTTP assíncrono compartilhado do processo"""
+
+    global __default_async_transport
+    with __default_transport_lock:
+        if __default_async_transport is None:
+            __default_async_transport = AsyncHttpTransport()
+        return __default_async_transport
+
+
+def set_default_async_transport(transport: AsyncHttpTransport) -> None:
+    """Substitui o transporte HTTP assíncrono compartilhado do processo
+
+    Args:
+        transport (AsyncHttpTransport): Novo transporte a ser usado por padrão
+    """
+
+    global __default_async_transport
+    with __default_transport_lock:
+        __default_async_transport = transport
@@ -0,0 +1,298 @@
+from collections.abc import Sequence
+from functools import cache
+from operator import itemgetter
+from types import NoneType, UnionType
+from typing import Literal, TypeAliasType, Union, get_args, get_origin
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from api_hidro.data_types import PreferenciaConsistencia
+from api_hidro.models.api_response_models import JSONList
+from api_hidro.utils import as_dataframe
+
+# Tipos pandas (nullable) de cada tipo Python dos modelos
+DTYPES: dict[str, str] = {
+    "int": "Int64",
+    "float": "float64",
+    "bool": "boolean",
+    "datetime": "datetime64[us]",
+    "date": "datetime64[us]",
+    "str": "string",
+}
+
+# Representações de booleanos aceitas pela validação do Pydantic, de modo que
+# os DataFrames e os modelos concordam (1 e 0 são iguais a True e False). O
+# Pydantic ignora maiúsculas e minúsculas; aqui, apenas as grafias usuais
+_VERDADEIROS = [True, "1", "true", "True", "TRUE", "t", "T", "yes", "Yes", "YES"]
+_VERDADEIROS += ["y", "Y", "on", "On", "ON"]
+_FALSOS = [False, "0", "false", "False", "FALSE", "f", "F", "no", "No", "NO"]
+_FALSOS += ["n", "N", "off", "Off", "OFF"]
+_BOOLEANOS = pd.Index(_VERDADEIROS + _FALSOS, dtype=object)
+
+
+def __tipo_base(annotation: object) -> str:
+    if isinstance(annotation, TypeAliasType):
+        annotation = annotation.__value__
+
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        tipos = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return __tipo_base(tipos[0])
+    if origin is Literal:
+        return "int" if all(isinstance(v, int) for v in get_args(annotation)) else "str"
+
+    nome = getattr(annotation, "__name__", "str")
+    return nome if nome in DTYPES else "str"
+
+
+@cache
+def colunas(model: type[BaseModel]) -> dict[str, tuple[str, str]]:
+    """Esquema colunar de um modelo Pydantic
+
+    Returns:
+        dict[str, tuple[str, str]]: Para cada campo do modelo, o nome do campo na
+            resposta da API (alias) e o tipo base ('int', 'float', 'bool',
+            'datetime', 'date' ou 'str')
+    """
+
+    return {
+        nome: (field.alias or nome, __tipo_base(field.annotation))
+        for nome, field in model.model_fields.items()
+    }
+
+
+def __converte(valores: np.ndarray, tipo: str) -> pd.Series:
+    if tipo in ("int", "float"):
+        numeros = valores.copy()
+        numeros[pd.isna(numeros)] = np.nan
+        try:
+            coluna = pd.Series(numeros.astype(np.float64))
+        except (TypeError, ValueError):
+            # Valores não numéricos: conversão elemento a elemento, como nulos
+            coluna = pd.to_numeric(pd.Series(valores), errors="coerce")
+        if tipo == "int":
+            inteiros = coluna.where(coluna == np.floor(coluna))
+            return inteiros.astype("Int64")
+        return coluna.astype(np.float64)
+
+    if tipo == "bool":
+        # Uma única busca por hash: posição em _BOOLEANOS, ou -1 se inválido
+        posicoes = _BOOLEANOS.get_indexer(valores)
+        booleanos = pd.arrays.BooleanArray(posicoes < len(_VERDADEIROS), posicoes < 0)
+        return pd.Series(booleanos)
+
+    if tipo in ("datetime", "date"):
+        datas = pd.to_datetime(pd.Series(valores), errors="coerce", format="ISO8601")
+        if isinstance(datas.dtype, pd.DatetimeTZDtype):
+            datas = datas.dt.tz_localize(None)
+        datas = datas.astype(DTYPES[tipo])
+        return datas.dt.normalize() if tipo == "date" else datas
+
+    return pd.Series(valores, dtype="string")
+
+
+def __matriz(items: JSONList, chaves: list[str]) -> np.ndarray:
+    # Uma linha por item e uma coluna por chave, extraídas em C por itemgetter
+    matriz = np.empty((len(items), len(chaves)), dtype=object)
+    if not items or not chaves:
+        return matriz
+
+    extrai = itemgetter(*chaves)
+    try:
+        linhas = list(map(extrai, items))
+    except KeyError:
+        # Itens com chaves diferentes: as ausentes são preenchidas com None
+        padrao = dict.fromkeys(chaves)
+        linhas = [extrai(padrao | item) for item in items]
+
+    if len(chaves) == 1:
+        matriz[:, 0] = linhas
+    else:
+        matriz[:] = linhas
+    return matriz
+
+
+def items_to_dataframe(items: JSONList, model: type[BaseModel]) -> pd.DataFrame:
+    """Converte os itens JSON da API diretamente em um DataFrame tipado, sem
+    instanciar o modelo Pydantic de cada registro.
+
+    As colunas têm os nomes dos campos do modelo (como em ``model_dump()``) e os
+    tipos pandas correspondentes (``Int64``, ``float64``, ``boolean``,
+    ``datetime64`` e ``string``), com valores ausentes ou inválidos como nulos.
+    A conversão é feita coluna a coluna, de forma vetorizada, e os nomes da API
+    são localizados sem diferenciar maiúsculas de minúsculas.
+
+    Args:
+        items (JSONList): Itens da resposta da API
+        model (type[BaseModel]): Modelo que define as colunas e seus tipos
+
+    Returns:
+        pd.DataFrame: Um registro por linha, uma coluna por campo do modelo
+    """
+
+    chaves = list(set().union(*(item.keys() for item in items)))
+    matriz = __matriz(items, chaves)
+    posicoes: dict[str, list[int]] = {}
+    for posicao, chave in enumerate(chaves):
+        posicoes.setdefault(chave.lower(), []).append(posicao)
+
+    dados: dict[str, pd.Series] = {}
+    for nome, (alias, tipo) in colunas(model).items():
+        fontes = posicoes.get(alias.lower()) or posicoes.get(nome.lower())
+        if not fontes:
+            valores = np.full(len(items), None, dtype=object)
+        else:
+            valores = matriz[:, fontes[0]]
+            for fonte in fontes[1:]:
+                valores = np.where(pd.isna(valores), matriz[:, fonte], valores)
+        dados[nome] = __converte(valores, tipo)
+
+    return pd.DataFrame(dados, index=pd.RangeIndex(len(items)))
+
+
+def dataframe_to_models[M: BaseModel](df: pd.DataFrame, model: type[M]) -> list[M]:
+    """Converte um DataFrame de items_to_dataframe de volta em objetos do modelo.
+
+    Os objetos são criados com ``model_construct``, sem uma nova validação: o
+    DataFrame deve conter dados já convertidos por items_to_dataframe. Valores
+    nulos viram None e as colunas de datas do tipo ``date`` são convertidas.
+
+    Args:
+        df (pd.DataFrame): Dados com as colunas do modelo
+        model (type[M]): Modelo dos objetos
+
+    Returns:
+        list[M]: Um objeto por linha
+    """
+
+    registros = df.astype(object).where(df.notna(), None)
+    for nome, (_, tipo) in colunas(model).items():
+        if tipo == "date" and nome in registros.columns:
+            registros[nome] = [
+                None if valor is None else valor.date() for valor in registros[nome]
+            ]
+    return [
+        model.model_construct(**registro) for registro in registros.to_dict("records")
+    ]
+
+
+def serie_diaria(dados: pd.DataFrame | Sequence[BaseModel]) -> pd.DataFrame:
+    """Converte os dados mensais das séries históricas (um mês por linha, com as
+    colunas ``chuva_01``...``chuva_31``, ``cota_01``... ou ``vazao_01``... e os
+    respectivos ``_status``) em uma série diária contínua.
+
+    A transformação é vetorizada com NumPy: os 31 dias de cada mês formam uma
+    matriz, e os dias inexistentes (ex.: 30 de fevereiro) são descartados por
+    uma máscara calculada a partir do número de dias de cada mês.
+
+    Args:
+        dados (pd.DataFrame | Sequence[BaseModel]): DataFrame retornado por
+            serie_historica_*_df ou lista de DadosMesAnoChuva, DadosMesAnoCota
+            ou DadosMesAnoVazao
+
+    Raises:
+        ValueError: Erro lançado caso os dados não tenham as colunas diárias de
+            chuva, cota ou vazão
+
+    Returns:
+        pd.DataFrame: Um dia por linha, indexado pela data ('data'), com as
+            colunas 'codigoestacao', 'valor', 'status' e 'nivel_consistencia',
+            ordenado por estação, data e nível de consistência. Os dias de meses
+            ausentes nos dados não são incluídos.
+    """
+
+    df = dados if isinstance(dados, pd.DataFrame) else as_dataframe(dados)
+    prefixo = next(
+        (p for p in ("chuva", "cota", "vazao") if f"{p}_01" in df.columns), None
+    )
+    if prefixo is None:
+        raise ValueError(
+            "Os dados não possuem as colunas diárias de chuva, cota ou vazão"
+        )
+    # O nível de consistência é "nivelconsistencia" nas séries de cota
+    nivel = "nivelconsistencia" if prefixo == "cota" else "nivel_consistencia"
+
+    dias = [f"{prefixo}_{dia:02d}" for dia in range(1, 32)]
+    valores = df[dias].to_numpy(dtype=np.float64, na_value=np.nan)
+    status = df[[f"{dia}_status" for dia in dias]].astype("boolean")
+
+    meses = pd.to_datetime(df["data_hora_dado"]).to_numpy().astype("datetime64[M]")
+    inicio = meses.astype("datetime64[D]")
+    fim = (meses + np.timedelta64(1, "M")).astype("datetime64[D]")
+    dias_no_mes = (fim - inicio).astype(np.int64)
+    validos = np.arange(1, 32) <= dias_no_mes[:, None]
+    datas = inicio[:, None] + np.arange(31)
+
+    linhas = np.broadcast_to(np.arange(len(df))[:, None], validos.shape)[validos]
+    diaria = pd.DataFrame(
+        {
+            "codigoestacao": df["codigoestacao"].astype("Int64").array[linhas],
+            "valor": valores[validos],
+            "status": pd.arrays.BooleanArray(
+                status.to_numpy(dtype=bool, na_value=False)[validos],
+                status.isna().to_numpy()[validos],
+            ),
+            "nivel_consistencia": df[nivel].astype("Int64").array[linhas],
+        },
+        index=pd.DatetimeIndex(datas[validos], name="data"),
+    )
+
+    ordem = np.lexsort(
+        (
+            diaria["nivel_consistencia"].to_numpy(dtype=np.float64, na_value=np.nan),
+            diaria.index.to_numpy(),
+            diaria["codigoestacao"].to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+    )
+    return diaria.iloc[ordem]
+
+
+def deduplica_consistencia(
+    dados: pd.DataFrame, preferencia: PreferenciaConsistencia = "consistido"
+) -> pd.DataFrame:
+    """Mantém um único registro por estação e período quando a API retorna o
+    mesmo mês com dados brutos (nível de consistência 1) e consistidos (nível 2).
+
+    A seleção é vetorizada: os registros são ordenados por estação, período e
+    prioridade do nível (np.lexsort) e apenas o primeiro de cada grupo é mantido.
+
+    Args:
+        dados (pd.DataFrame): Dados mensais (serie_historica_*_df, agrupados por
+            estação e mês de 'data_hora_dado') ou diários (serie_diaria,
+            agrupados por estação e data do índice)
+        preferencia (PreferenciaConsistencia, optional): 'consistido' prefere o
+            nível 2, 'bruto' prefere o nível 1 e 'todos' mantém todos os
+            registros. Defaults to "consistido".
+
+    Returns:
+        pd.DataFrame: Registros selecionados, ordenados por estação e período
+    """
+
+    if preferencia == "todos":
+        return dados
+
+    mensal = "data_hora_dado" in dados.columns
+    nivel = (
+        "nivelconsistencia"
+        if "nivelconsistencia" in dados.columns
+        else "nivel_consistencia"
+    )
+    if mensal:
+        periodos = (
+            pd.to_datetime(dados["data_hora_dado"]).to_numpy().astype("datetime64[M]")
+        )
+    else:
+        periodos = pd.DatetimeIndex(dados.index).to_numpy().astype("datetime64[D]")
+    codigos = dados["codigoestacao"].to_numpy(dtype=np.float64, na_value=np.nan)
+    niveis = dados[nivel].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    prioridade = -niveis if preferencia == "consistido" else niveis
+    ordem = np.lexsort((prioridade, periodos, codigos))
+    codigos, periodos = codigos[ordem], periodos[ordem]
+    primeiro = np.ones(len(ordem), dtype=bool)
+    primeiro[1:] = (codigos[1:] != codigos[:-1]) | (periodos[1:] != periodos[:-1])
+
+    selecionados = dados.iloc[ordem[primeiro]]
+    return selecionados.reset_index(drop=True) if mensal else selecionados
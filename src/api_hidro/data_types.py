@@ -2,6 +2,7 @@ from typing import Literal, TypedDict
 
 type TipoTelemetrica = Literal["Detalhada", "Adotada"]
 type TipoFiltroData = Literal["DATA_LEITURA", "DATA_ULTIMA_ATUALIZACAO"]
+type PreferenciaConsistencia = Literal["consistido", "bruto", "todos"]
 type IntervaloDeBusca = Literal[
     "MINUTO_5",
     "MINUTO_10",
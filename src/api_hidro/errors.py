@@ -21,3 +21,16 @@ class InventoryNotFoundError(Exception):
 class TimeSerieNotFoundError(Exception):
     def __init__(self, message):
         self.message = message
+
+
+class IncompleteDataError(Exception):
+    """Erro lançado quando parte das requisições de uma consulta falha mesmo após
+    as novas tentativas. Os dados já obtidos são preservados em ``data`` e as
+    falhas, indexadas pela unidade da consulta (ano, dia ou bacia), em ``failures``,
+    permitindo repetir somente o que falhou.
+    """
+
+    def __init__(self, message, data=None, failures=None):
+        self.message = message
+        self.data = data if data is not None else []
+        self.failures = failures if failures is not None else {}
@@ -0,0 +1,285 @@
+import asyncio
+import json
+import sqlite3
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+from typing import Any, cast
+
+import pandas as pd
+
+from api_hidro import json_decoder
+from api_hidro.api_requests.hidro_inventario import (
+    retorna_inventario_atualizado_async,
+    retorna_inventario_completo_async,
+)
+from api_hidro.columnar import DTYPES, colunas, dataframe_to_models, items_to_dataframe
+from api_hidro.models.models import Inventario
+from api_hidro.token_authentication import TokenAuthHandler
+from api_hidro.utils import cache_home
+
+
+def default_snapshot_path() -> Path:
+    """Arquivo padrão do inventário local: $XDG_CACHE_HOME/api_hidro/inventario.sqlite3"""
+
+    return cache_home() / "inventario.sqlite3"
+
+
+def _serializa(df: pd.DataFrame) -> bytes:
+    # JSON por coluna, comprimido com zlib, como os demais caches da biblioteca:
+    # independe da versão do pandas e nunca executa código ao ser lido
+    dados: dict[str, list[Any]] = {}
+    for nome, serie in df.items():
+        if serie.dtype.kind == "M":
+            serie = serie.dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
+        dados[str(nome)] = serie.astype(object).where(serie.notna(), None).tolist()
+    return zlib.compress(json.dumps(dados, separators=(",", ":")).encode())
+
+
+def _desserializa(dados: bytes) -> pd.DataFrame:
+    colunas_salvas = json_decoder.loads(zlib.decompress(dados))
+    esquema = colunas(Inventario)
+    if set(colunas_salvas) != set(esquema):
+        raise ValueError("Esquema do inventário local diferente do atual")
+    return pd.DataFrame(
+        {
+            nome: pd.Series(colunas_salvas[nome], dtype=object).astype(DTYPES[tipo])
+            for nome, (_, tipo) in esquema.items()
+        }
+    )
+
+
+def _aplica_alteracoes(base: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    # Substitui apenas as estações novas ou com Data_Ultima_Atualizacao mais
+    # recente. Sem data anterior, não é possível comparar: a estação é substituída
+    delta = delta.drop_duplicates("codigoestacao", keep="last")
+    anteriores = delta["codigoestacao"].map(
+        base.drop_duplicates("codigoestacao").set_index("codigoestacao")[
+            "data_ultima_atualizacao"
+        ]
+    )
+    novas = ~delta["codigoestacao"].isin(base["codigoestacao"])
+    alteradas = delta[
+        novas
+        | anteriores.isna()
+        | (delta["data_ultima_atualizacao"] > anteriores).fillna(False)
+    ]
+    if alteradas.empty:
+        return base
+    mantidas = base[~base["codigoestacao"].isin(alteradas["codigoestacao"])]
+    return pd.concat([mantidas, alteradas], ignore_index=True)
+
+
+class InventorySnapshot:
+    """Cópia local, em SQLite, do inventário completo de estações, com política
+    de validade e atualização incremental.
+
+    O inventário é armazenado já convertido em colunas (o DataFrame de
+    inventario_completo_df, em JSON comprimido), de modo que a leitura local
+    leva uma fração de segundo, em vez do download e da validação das cerca de
+    30 mil estações das 9 bacias. Uma cópia local ilegível (corrompida ou de
+    outra versão da biblioteca) é descartada e obtida novamente por completo.
+    A cópia local é:
+
+    - usada sem consulta à API enquanto tiver menos de ``max_idade``;
+    - atualizada de forma incremental depois disso: são obtidas apenas as
+      estações atualizadas desde a última atualização (Data_Ultima_Atualizacao)
+      e substituídas apenas as que mudaram;
+    - obtida novamente por completo quando tiver mais de ``max_idade_completa``,
+      o que também remove as estações excluídas do inventário.
+
+    O arquivo pode ser compartilhado por vários processos.
+
+    Args:
+        path (str | Path | None, optional): Arquivo SQLite do inventário.
+            Defaults to default_snapshot_path().
+        max_idade (timedelta, optional): Idade máxima da cópia local sem
+            atualização. Defaults to 24 horas.
+        max_idade_completa (timedelta, optional): Idade máxima do último
+            download completo. Defaults to 30 dias.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_idade: timedelta = timedelta(hours=24),
+        max_idade_completa: timedelta = timedelta(days=30),
+    ):
+        self.path = Path(path) if path is not None else default_snapshot_path()
+        self.max_idade = max_idade
+        self.max_idade_completa = max_idade_completa
+        self.__lock = Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshot (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                dados BLOB NOT NULL,
+                atualizado REAL NOT NULL,
+                completo REAL NOT NULL
+            )
+            """
+        )
+
+    def __le(self) -> tuple[pd.DataFrame, float, float] | None:
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT dados, atualizado, completo FROM snapshot WHERE id = 1"
+            ).fetchone()
+        if row is None:
+            return None
+        dados, atualizado, completo = row
+        try:
+            return _desserializa(dados), atualizado, completo
+        except (ValueError, TypeError, KeyError, zlib.error):
+            # Arquivo corrompido, de outra versão ou de outro formato: o
+            # inventário é tratado como inexistente e obtido novamente
+            return None
+
+    def __grava(self, df: pd.DataFrame, atualizado: float, completo: float) -> None:
+        dados = _serializa(df)
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO snapshot (id, dados, atualizado, completo) "
+                "VALUES (1, ?, ?, ?)",
+                (dados, atualizado, completo),
+            )
+
+    def __atualiza_base(
+        self, base: pd.DataFrame, items: list[dict], atualizado: float, completo: float
+    ) -> pd.DataFrame:
+        df = _aplica_alteracoes(base, items_to_dataframe(items, Inventario))
+        self.__grava(df, atualizado, completo)
+        return df
+
+    def carrega(self) -> pd.DataFrame | None:
+        """Inventário local, sem consultar a API, ou None caso não exista"""
+
+        snapshot = self.__le()
+        return None if snapshot is None else snapshot[0]
+
+    def atualizado_em(self) -> datetime | None:
+        """Data e hora da última atualização da cópia local"""
+
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT atualizado FROM snapshot WHERE id = 1"
+            ).fetchone()
+        return None if row is None else datetime.fromtimestamp(row[0])
+
+    async def atualiza_async(
+        self, token_auth: TokenAuthHandler, completo: bool = False
+    ) -> pd.DataFrame:
+        """Versão assíncrona de atualiza"""
+
+        # A leitura, a conversão e a gravação das cerca de 30 mil estações são
+        # executadas em uma thread auxiliar, para não bloquear o event loop
+        inicio = time.time()
+        snapshot = None if completo else await asyncio.to_thread(self.__le)
+
+        if snapshot is None:
+            items = await retorna_inventario_completo_async(token_auth)
+            df = await asyncio.to_thread(
+                items_to_dataframe, cast(list[dict], items), Inventario
+            )
+            await asyncio.to_thread(self.__grava, df, inicio, inicio)
+            return df
+
+        base, atualizado, ultimo_completo = snapshot
+        # A API filtra por data (sem hora): um dia de margem evita perder
+        # atualizações feitas no mesmo dia da atualização anterior
+        desde = date.fromtimestamp(atualizado) - timedelta(days=1)
+        items = await retorna_inventario_atualizado_async(token_auth, desde.isoformat())
+        return await asyncio.to_thread(
+            self.__atualiza_base, base, cast(list[dict], items), inicio, ultimo_completo
+        )
+
+    def atualiza(
+        self, token_auth: TokenAuthHandler, completo: bool = False
+    ) -> pd.DataFrame:
+        """Atualiza a cópia local do inventário, independentemente da idade.
+
+        Args:
+            token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+            completo (bool, optional): Obtém o inventário completo em vez de
+                apenas as estações atualizadas. Defaults to False.
+
+        Raises:
+            IncompleteDataError: Erro lançado caso alguma bacia não seja obtida.
+                A cópia local não é alterada.
+
+        Returns:
+            pd.DataFrame: Inventário atualizado, uma estação por linha
+        """
+
+        return token_auth.async_transport.run(self.atualiza_async(token_auth, completo))
+
+    async def dataframe_async(self, token_auth: TokenAuthHandler) -> pd.DataFrame:
+        """Versão assíncrona de dataframe"""
+
+        snapshot = await asyncio.to_thread(self.__le)
+        if snapshot is None:
+            return await self.atualiza_async(token_auth, completo=True)
+
+        df, atualizado, completo = snapshot
+        agora = time.time()
+        if agora - completo > self.max_idade_completa.total_seconds():
+            return await self.atualiza_async(token_auth, completo=True)
+        if agora - atualizado > self.max_idade.total_seconds():
+            return await self.atualiza_async(token_auth)
+        return df
+
+    def dataframe(self, token_auth: TokenAuthHandler) -> pd.DataFrame:
+        """Inventário completo de acordo com a política de validade: a cópia
+        local, uma atualização incremental ou um novo download completo.
+
+        Args:
+            token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+
+        Raises:
+            IncompleteDataError: Erro lançado caso alguma bacia não seja obtida.
+
+        Returns:
+            pd.DataFrame: Inventário, uma estação por linha (como em
+                inventario_completo_df)
+        """
+
+        return token_auth.async_transport.run(self.dataframe_async(token_auth))
+
+    def inventario(self, token_auth: TokenAuthHandler) -> list[Inventario]:
+        """Inventário completo como objetos Inventario (ver dataframe).
+
+        Os objetos são criados a partir dos dados já validados, sem uma nova
+        validação, mas ainda assim a criação de dezenas de milhares de objetos é
+        mais lenta que o uso direto do DataFrame.
+
+        Args:
+            token_auth (TokenAuthHandler): Objeto da classe de autenticação de token.
+
+        Returns:
+            list[Inventario]: Inventário de todas as estações
+        """
+
+        return dataframe_to_models(self.dataframe(token_auth), Inventario)
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__conn.close()
+
+    def __enter__(self) -> "InventorySnapshot":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,106 @@
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+
+type Unidade = tuple[int, str, int]
+
+
+class JobManifest:
+    """Manifesto, em SQLite, das unidades de trabalho de uma carga em lote.
+
+    Cada unidade é um ano de uma estação para um tipo de série (código da
+    estação, tipo e ano). As unidades concluídas são gravadas à medida que
+    terminam, de modo que uma carga interrompida (queda do processo, falha de
+    autenticação, instabilidade da rede) continua de onde parou ao ser executada
+    novamente. As falhas são registradas com o número de tentativas e a última
+    mensagem de erro. O arquivo pode ser compartilhado por vários processos.
+
+    Args:
+        path (str | Path): Arquivo SQLite do manifesto.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = Lock()
+        self.__conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS unidade (
+                codigoestacao INTEGER NOT NULL,
+                tipo TEXT NOT NULL,
+                ano INTEGER NOT NULL,
+                concluida INTEGER NOT NULL DEFAULT 0,
+                registros INTEGER,
+                tentativas INTEGER NOT NULL DEFAULT 0,
+                erro TEXT,
+                atualizado REAL NOT NULL,
+                PRIMARY KEY (codigoestacao, tipo, ano)
+            )
+            """
+        )
+
+    def concluidas(self) -> set[Unidade]:
+        """Unidades (código da estação, tipo, ano) já concluídas"""
+
+        with self.__lock:
+            rows = self.__conn.execute(
+                "SELECT codigoestacao, tipo, ano FROM unidade WHERE concluida = 1"
+            ).fetchall()
+        return {(codigo, tipo, ano) for codigo, tipo, ano in rows}
+
+    def falhas(self) -> dict[Unidade, str]:
+        """Unidades com falha ainda não concluídas e a última mensagem de erro"""
+
+        with self.__lock:
+            rows = self.__conn.execute(
+                "SELECT codigoestacao, tipo, ano, erro FROM unidade "
+                "WHERE concluida = 0 AND erro IS NOT NULL"
+            ).fetchall()
+        return {(codigo, tipo, ano): erro for codigo, tipo, ano, erro in rows}
+
+    def conclui(self, unidade: Unidade, registros: int) -> None:
+        """Marca a unidade como concluída"""
+
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT INTO unidade (codigoestacao, tipo, ano, concluida, registros, "
+                "tentativas, atualizado) VALUES (?, ?, ?, 1, ?, 1, ?) "
+                "ON CONFLICT (codigoestacao, tipo, ano) DO UPDATE SET concluida = 1, "
+                "registros = excluded.registros, tentativas = tentativas + 1, "
+                "erro = NULL, atualizado = excluded.atualizado",
+                (*unidade, registros, time.time()),
+            )
+
+    def registra_falha(self, unidade: Unidade, erro: str) -> None:
+        """Registra a falha da unidade, que será repetida na próxima execução"""
+
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT INTO unidade (codigoestacao, tipo, ano, tentativas, erro, "
+                "atualizado) VALUES (?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT (codigoestacao, tipo, ano) DO UPDATE SET "
+                "tentativas = tentativas + 1, erro = excluded.erro, "
+                "atualizado = excluded.atualizado",
+                (*unidade, erro, time.time()),
+            )
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__conn.close()
+
+    def __enter__(self) -> "JobManifest":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,70 @@
+import json
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # extra "json" não instalado
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+type JSONDecoder = Callable[[bytes], Any]
+
+
+def __decodificador_padrao() -> tuple[str, JSONDecoder]:
+    if orjson is not None:
+        return "orjson", orjson.loads
+    if msgspec is not None:
+        return "msgspec", msgspec.json.Decoder().decode
+    return "json", json.loads
+
+
+__backend, __decoder = __decodificador_padrao()
+__lock = Lock()
+
+
+def loads(conteudo: bytes | str) -> Any:
+    """Decodifica um documento JSON com o decodificador selecionado.
+
+    O conteúdo é lido diretamente dos bytes da resposta, sem a conversão prévia
+    em texto feita por ``response.json()``. Por padrão, é usado o orjson ou o
+    msgspec, nessa ordem, caso estejam instalados (``pip install
+    api-hidro[json]``), e o módulo json da biblioteca padrão caso contrário. Os
+    três retornam os mesmos dicionários e listas.
+
+    Args:
+        conteudo (bytes | str): Documento JSON
+
+    Returns:
+        Any: Documento decodificado
+    """
+
+    return __decoder(conteudo)
+
+
+def json_backend() -> str:
+    """Nome do decodificador em uso: 'orjson', 'msgspec', 'json' ou 'custom'"""
+
+    return __backend
+
+
+def set_json_decoder(decoder: JSONDecoder | None) -> None:
+    """Substitui o decodificador JSON usado nas respostas da API e nos caches locais
+
+    Args:
+        decoder (JSONDecoder | None): Função que recebe os bytes de um documento
+            JSON e retorna o documento decodificado. None restaura o
+            decodificador padrão.
+    """
+
+    global __backend, __decoder
+    with __lock:
+        if decoder is None:
+            __backend, __decoder = __decodificador_padrao()
+        else:
+            __backend, __decoder = "custom", decoder
@@ -0,0 +1,251 @@
+import os
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+from pydantic import BaseModel
+
+from api_hidro import columnar
+from api_hidro.api_requests.hidro_serie import MODELOS_SERIE, TipoDeEstacao
+from api_hidro.models.api_response_models import JSONList
+from api_hidro.models.models import Inventario
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # extra "arrow" não instalado
+    pa = ds = pq = None
+
+type DadosTabela = pd.DataFrame | Sequence[BaseModel] | JSONList
+
+
+def _tabela(dados: DadosTabela, model: type[BaseModel]) -> pd.DataFrame:
+    # Converte os dados para as colunas e tipos do modelo, de modo que todos os
+    # arquivos de um tipo de série tenham o mesmo esquema
+    if not isinstance(dados, pd.DataFrame):
+        items = [
+            item.model_dump() if isinstance(item, BaseModel) else item for item in dados
+        ]
+        return columnar.items_to_dataframe(items, model)
+
+    esquema = columnar.colunas(model)
+    df = dados.reset_index(drop=True).reindex(columns=list(esquema))
+    return df.astype(
+        {nome: columnar.DTYPES[tipo] for nome, (_, tipo) in esquema.items()}
+    )
+
+
+def _selecao(model: type[BaseModel], colunas: Sequence[str] | None) -> list[str]:
+    nomes = list(columnar.colunas(model))
+    if colunas is None:
+        return nomes
+    desconhecidas = set(colunas) - set(nomes)
+    if desconhecidas:
+        raise ValueError(f"Colunas inexistentes: {sorted(desconhecidas)}")
+    return [nome for nome in nomes if nome in colunas]
+
+
+def _grava(df: pd.DataFrame, arquivo: Path) -> None:
+    # Grava em um arquivo temporário e o renomeia: leitores concorrentes nunca
+    # encontram um arquivo parcialmente escrito
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    temporario = arquivo.with_name(f".{arquivo.name}.{uuid.uuid4().hex}.tmp")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), temporario)
+    os.replace(temporario, arquivo)
+
+
+class ParquetStore:
+    """Armazenamento local, em Parquet, das séries históricas e do inventário.
+
+    As séries são gravadas em um dataset particionado no formato Hive
+    (``tipo=Vazao/codigoestacao=10100000/ano=2020/dados.parquet``), com as
+    colunas e os tipos dos modelos Pydantic (os mesmos de
+    serie_historica_*_df). Na leitura, os filtros por estação e período
+    descartam partições inteiras sem abri-las, os demais filtros são aplicados
+    aos metadados de cada arquivo (predicate pushdown) e apenas as colunas
+    solicitadas são lidas do disco.
+
+    Os arquivos podem ser lidos diretamente por outras ferramentas (pyarrow,
+    polars, DuckDB, Spark). Requer o pacote ``pyarrow``.
+
+    Args:
+        path (str | Path): Diretório raiz do armazenamento.
+
+    Raises:
+        ImportError: Erro lançado caso o pacote 'pyarrow' não esteja instalado
+    """
+
+    def __init__(self, path: str | Path):
+        if pa is None:
+            raise ImportError(
+                "O armazenamento em Parquet requer o pacote 'pyarrow': "
+                "pip install api-hidro[arrow]"
+            )
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def escreve_serie(self, tipo_estacao: TipoDeEstacao, dados: DadosTabela) -> int:
+        """Grava os dados mensais de uma série histórica.
+
+        Os registros são combinados com os já gravados na mesma partição
+        (estação e ano) pela chave data do dado e nível de consistência: os
+        registros novos substituem os antigos. Registros sem estação ou data são
+        descartados.
+
+        Args:
+            tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+            dados (DadosTabela): DataFrame de serie_historica_*_df, lista de
+                DadosMesAnoChuva, DadosMesAnoCota ou DadosMesAnoVazao ou itens
+                JSON da API
+
+        Returns:
+            int: Número de registros gravados
+        """
+
+        model = MODELOS_SERIE[tipo_estacao]
+        df = _tabela(dados, model)
+        df = df[df["codigoestacao"].notna() & df["data_hora_dado"].notna()]
+        nivel = next(nome for nome in df.columns if nome.startswith("nivel"))
+
+        gravados = 0
+        for (codigo, ano), novos in df.groupby(
+            [df["codigoestacao"], df["data_hora_dado"].dt.year], sort=False
+        ):
+            arquivo = (
+                self.path
+                / f"tipo={tipo_estacao}"
+                / f"codigoestacao={codigo}"
+                / f"ano={ano}"
+                / "dados.parquet"
+            )
+            if arquivo.exists():
+                antigos = _tabela(pq.read_table(arquivo).to_pandas(), model)
+                novos = pd.concat([antigos, novos], ignore_index=True)
+                novos = novos.drop_duplicates(["data_hora_dado", nivel], keep="last")
+
+            novos = novos.sort_values(["data_hora_dado", nivel], kind="stable")
+            _grava(novos.drop(columns="codigoestacao"), arquivo)
+            gravados += len(novos)
+
+        return gravados
+
+    def le_serie(
+        self,
+        tipo_estacao: TipoDeEstacao,
+        codigos: Sequence[int] | None = None,
+        data_inicial: str | None = None,
+        data_final: str | None = None,
+        colunas: Sequence[str] | None = None,
+        filtro: "ds.Expression | None" = None,
+    ) -> pd.DataFrame:
+        """Lê os dados mensais gravados de uma série histórica.
+
+        Args:
+            tipo_estacao (TipoDeEstacao): Tipos -> 'Chuva', 'Cotas', 'Vazao'
+            codigos (Sequence[int] | None, optional): Códigos das estações.
+                Defaults to todas.
+            data_inicial (str | None, optional): Data no formato YYYY-MM-DD.
+                Defaults to None.
+            data_final (str | None, optional): Data no formato YYYY-MM-DD.
+                Defaults to None.
+            colunas (Sequence[str] | None, optional): Colunas a serem lidas (nomes
+                dos campos do modelo). Defaults to todas.
+            filtro (ds.Expression | None, optional): Filtro adicional do
+                pyarrow, ex.: ``ds.field("maxima") > 100``. Defaults to None.
+
+        Raises:
+            ValueError: Erro lançado caso alguma coluna não exista no modelo
+
+        Returns:
+            pd.DataFrame: Um mês por linha, ordenado por estação e data
+        """
+
+        model = MODELOS_SERIE[tipo_estacao]
+        esquema = _selecao(model, colunas)
+
+        diretorio = self.path / f"tipo={tipo_estacao}"
+        if not diretorio.exists():
+            return columnar.items_to_dataframe([], model)[esquema]
+
+        condicoes = [] if filtro is None else [filtro]
+        if codigos is not None:
+            condicoes.append(ds.field("codigoestacao").isin(list(codigos)))
+        if data_inicial is not None:
+            inicio = datetime.strptime(data_inicial, "%Y-%m-%d")
+            condicoes += [
+                ds.field("ano") >= inicio.year,
+                ds.field("data_hora_dado") >= pa.scalar(inicio, pa.timestamp("us")),
+            ]
+        if data_final is not None:
+            fim = datetime.strptime(data_final, "%Y-%m-%d")
+            condicoes += [
+                ds.field("ano") <= fim.year,
+                ds.field("data_hora_dado") <= pa.scalar(fim, pa.timestamp("us")),
+            ]
+
+        expressao = None
+        for condicao in condicoes:
+            expressao = condicao if expressao is None else expressao & condicao
+
+        dataset = ds.dataset(
+            diretorio,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([("codigoestacao", pa.int64()), ("ano", pa.int32())]),
+                flavor="hive",
+            ),
+        )
+        ordem = ["codigoestacao", "data_hora_dado"]
+        lidas = list(dict.fromkeys([*esquema, *ordem]))
+        df = dataset.to_table(columns=lidas, filter=expressao).to_pandas()
+        df = _tabela(df, model).sort_values(ordem, kind="stable")
+        return df[esquema].reset_index(drop=True)
+
+    def escreve_inventario(self, dados: DadosTabela) -> int:
+        """Grava o inventário de estações, substituindo o inventário anterior
+
+        Args:
+            dados (DadosTabela): DataFrame de inventario_completo_df, lista de
+                Inventario ou itens JSON da API
+
+        Returns:
+            int: Número de estações gravadas
+        """
+
+        df = _tabela(dados, Inventario)
+        _grava(df, self.path / "inventario" / "dados.parquet")
+        return len(df)
+
+    def le_inventario(
+        self,
+        colunas: Sequence[str] | None = None,
+        filtro: "ds.Expression | None" = None,
+    ) -> pd.DataFrame:
+        """Lê o inventário de estações gravado
+
+        Args:
+            colunas (Sequence[str] | None, optional): Colunas a serem lidas (nomes
+                dos campos de Inventario). Defaults to todas.
+            filtro (ds.Expression | None, optional): Filtro do pyarrow, ex.:
+                ``ds.field("uf_estacao") == "MG"``. Defaults to None.
+
+        Raises:
+            ValueError: Erro lançado caso alguma coluna não exista no modelo
+            FileNotFoundError: Erro lançado caso o inventário não tenha sido
+                gravado
+
+        Returns:
+            pd.DataFrame: Uma estação por linha
+        """
+
+        arquivo = self.path / "inventario" / "dados.parquet"
+        if not arquivo.exists():
+            raise FileNotFoundError(f"Inventário não encontrado em {arquivo}")
+
+        esquema = _selecao(Inventario, colunas)
+        dataset = ds.dataset(arquivo, format="parquet")
+        df = dataset.to_table(columns=esquema, filter=filtro).to_pandas()
+        return _tabela(df, Inventario)[esquema]
@@ -0,0 +1,182 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+
+import pandas as pd
+from pydantic import BaseModel
+
+from api_hidro import json_decoder
+from api_hidro.columnar import deduplica_consistencia, items_to_dataframe
+from api_hidro.data_types import PreferenciaConsistencia
+
+try:
+    import pyarrow as pa
+except ImportError:  # extra "arrow" não instalado
+    pa = None
+
+
+def pagina_dataframe(
+    conteudo: bytes,
+    model: type[BaseModel],
+    validar: bool = True,
+    consistencia: PreferenciaConsistencia = "todos",
+) -> pd.DataFrame:
+    """Decodifica, valida e converte em colunas uma resposta da API.
+
+    Args:
+        conteudo (bytes): Corpo da resposta da API (JSON)
+        model (type[BaseModel]): Modelo dos itens da resposta
+        validar (bool, optional): Valida cada item com o modelo Pydantic antes da
+            conversão. Defaults to True.
+        consistencia (PreferenciaConsistencia, optional): Seleção do nível de
+            consistência (ver columnar.deduplica_consistencia). Defaults to
+            "todos".
+
+    Raises:
+        pydantic.ValidationError: Erro lançado caso algum item seja inválido
+
+    Returns:
+        pd.DataFrame: Itens da resposta, uma coluna por campo do modelo
+    """
+
+    items = json_decoder.loads(conteudo).get("items") or []
+    if validar:
+        for item in items:
+            model.model_validate(item, by_alias=True)
+
+    df = items_to_dataframe(items, model)
+    if consistencia != "todos":
+        df = deduplica_consistencia(df, consistencia)
+    return df
+
+
+def converte_pagina(
+    conteudo: bytes,
+    model: type[BaseModel],
+    validar: bool = True,
+    consistencia: PreferenciaConsistencia = "todos",
+) -> bytes | pd.DataFrame:
+    """Decodifica, valida e converte em colunas uma resposta da API (ver
+    pagina_dataframe).
+
+    Executada nos processos do ProcessPoolParser. Quando o pyarrow está
+    instalado, o resultado é serializado no formato Arrow IPC, mais compacto e
+    rápido de transferir entre processos que um DataFrame serializado com pickle.
+
+    Args:
+        conteudo (bytes): Corpo da resposta da API (JSON)
+        model (type[BaseModel]): Modelo dos itens da resposta
+        validar (bool, optional): Valida cada item com o modelo Pydantic antes da
+            conversão. Defaults to True.
+        consistencia (PreferenciaConsistencia, optional): Seleção do nível de
+            consistência (ver columnar.deduplica_consistencia). Defaults to
+            "todos".
+
+    Raises:
+        pydantic.ValidationError: Erro lançado caso algum item seja inválido
+
+    Returns:
+        bytes | pd.DataFrame: DataFrame no formato Arrow IPC, ou o próprio
+            DataFrame caso o pyarrow não esteja instalado
+    """
+
+    df = pagina_dataframe(conteudo, model, validar, consistencia)
+    if pa is None:
+        return df
+
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, tabela.schema) as writer:
+        writer.write_table(tabela)
+    return sink.getvalue().to_pybytes()
+
+
+def le_pagina(resultado: bytes | pd.DataFrame) -> pd.DataFrame:
+    """Converte o resultado de converte_pagina em DataFrame"""
+
+    if isinstance(resultado, pd.DataFrame):
+        return resultado
+    if pa is None:
+        raise ImportError(
+            "A leitura de resultados Arrow requer o pacote 'pyarrow': "
+            "pip install api-hidro[arrow]"
+        )
+    return pa.ipc.open_stream(resultado).read_pandas()
+
+
+class ProcessPoolParser:
+    """Etapa de decodificação, validação e conversão em colunas executada em um
+    pool de processos.
+
+    Em downloads grandes, o gargalo deixa de ser a rede e passa a ser a CPU:
+    decodificar o JSON, validar modelos de mais de 70 campos e converter datas,
+    tudo sob o GIL. O ProcessPoolParser envia as respostas da API, ainda em
+    bytes, para processos auxiliares e recebe DataFrames (em Arrow IPC, caso o
+    pyarrow esteja instalado), de modo que a vazão aumenta com o número de
+    núcleos. As requisições continuam no event loop do processo principal.
+
+    Args:
+        max_workers (int | None, optional): Número de processos. Defaults to o
+            número de CPUs.
+        validar (bool, optional): Valida cada item com o modelo Pydantic.
+            Defaults to True.
+        mp_context (multiprocessing.context.BaseContext | None, optional):
+            Contexto de multiprocessing dos processos auxiliares. Defaults to
+            "spawn", que não copia as threads do transporte para os processos.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        validar: bool = True,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        self.validar = validar
+        self.__executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context or multiprocessing.get_context("spawn"),
+        )
+
+    async def converte(
+        self,
+        conteudo: bytes,
+        model: type[BaseModel],
+        consistencia: PreferenciaConsistencia = "todos",
+    ) -> pd.DataFrame:
+        """Converte uma resposta da API em DataFrame em um processo auxiliar
+
+        Args:
+            conteudo (bytes): Corpo da resposta da API (JSON)
+            model (type[BaseModel]): Modelo dos itens da resposta
+            consistencia (PreferenciaConsistencia, optional): Seleção do nível de
+                consistência. Defaults to "todos".
+
+        Returns:
+            pd.DataFrame: Itens da resposta, uma coluna por campo do modelo
+        """
+
+        loop = asyncio.get_running_loop()
+        resultado = await loop.run_in_executor(
+            self.__executor,
+            converte_pagina,
+            conteudo,
+            model,
+            self.validar,
+            consistencia,
+        )
+        return le_pagina(resultado)
+
+    def close(self) -> None:
+        self.__executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ProcessPoolParser":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,223 @@
+import json
+import sqlite3
+import time
+import zlib
+from datetime import date, timedelta
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+
+from api_hidro import json_decoder
+from api_hidro.models.api_response_models import JSONList
+from api_hidro.utils import cache_home
+
+# Tamanho máximo padrão do cache em disco (500 MB)
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+
+def default_cache_path() -> Path:
+    """Arquivo padrão do cache de séries: $XDG_CACHE_HOME/api_hidro/series.sqlite3"""
+
+    return cache_home() / "series.sqlite3"
+
+
+def _consistido(item: dict) -> bool:
+    # O campo é "Nivel_Consistencia" (chuva e vazão) ou "Nivelconsistencia" (cota)
+    for chave, valor in item.items():
+        if chave.replace("_", "").lower() == "nivelconsistencia":
+            return str(valor) == "2"
+    return False
+
+
+class SerieCache:
+    """Cache local, em SQLite, das respostas anuais das séries históricas.
+
+    Cada entrada corresponde a um ano de uma estação em um endpoint
+    (``HidroSerieChuva``, ``HidroSerieCotas``, ``HidroSerieVazao``) e tipo de
+    filtro de data. O prazo de validade depende do ano:
+
+    - anos encerrados com todos os dados consistidos (nível de consistência 2)
+      quase nunca mudam e usam ``ttl_consistido``;
+    - anos encerrados com dados brutos (nível 1) ou sem dados usam
+      ``ttl_bruto``;
+    - o ano corrente usa ``ttl_ano_corrente``.
+
+    Quando o tamanho total ultrapassa ``max_bytes``, as entradas acessadas há
+    mais tempo são removidas (LRU). O arquivo pode ser compartilhado por vários
+    processos.
+
+    Args:
+        path (str | Path | None, optional): Arquivo SQLite do cache. Defaults to
+            default_cache_path().
+        max_bytes (int, optional): Tamanho máximo, em bytes, dos dados
+            armazenados. Defaults to DEFAULT_MAX_BYTES.
+        ttl_consistido (timedelta, optional): Validade de anos encerrados e
+            consistidos. Defaults to 180 dias.
+        ttl_bruto (timedelta, optional): Validade de anos encerrados com dados
+            brutos. Defaults to 7 dias.
+        ttl_ano_corrente (timedelta, optional): Validade do ano corrente.
+            Defaults to 6 horas.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_consistido: timedelta = timedelta(days=180),
+        ttl_bruto: timedelta = timedelta(days=7),
+        ttl_ano_corrente: timedelta = timedelta(hours=6),
+    ):
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.max_bytes = max_bytes
+        self.ttl_consistido = ttl_consistido
+        self.ttl_bruto = ttl_bruto
+        self.ttl_ano_corrente = ttl_ano_corrente
+        self.__lock = Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS serie (
+                endpoint TEXT NOT NULL,
+                codigoestacao INTEGER NOT NULL,
+                tipo_filtro TEXT NOT NULL,
+                ano INTEGER NOT NULL,
+                dados BLOB NOT NULL,
+                tamanho INTEGER NOT NULL,
+                expira REAL NOT NULL,
+                acesso REAL NOT NULL,
+                PRIMARY KEY (endpoint, codigoestacao, tipo_filtro, ano)
+            )
+            """
+        )
+        self.__conn.execute("CREATE INDEX IF NOT EXISTS serie_acesso ON serie (acesso)")
+
+    def ttl(self, ano: int, items: JSONList) -> timedelta:
+        """Validade da entrada de acordo com o ano e o nível de consistência"""
+
+        if ano >= date.today().year:
+            return self.ttl_ano_corrente
+        if items and all(_consistido(item) for item in items):
+            return self.ttl_consistido
+        return self.ttl_bruto
+
+    def get(
+        self, endpoint: str, codigoestacao: int, tipo_filtro: str, ano: int
+    ) -> JSONList | None:
+        """Retorna os dados do ano armazenados no cache
+
+        Returns:
+            JSONList | None: Itens da resposta da API, ou None caso a entrada não
+                exista ou esteja expirada
+        """
+
+        chave = (endpoint, codigoestacao, tipo_filtro, ano)
+        agora = time.time()
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT dados, expira FROM serie WHERE endpoint = ? "
+                "AND codigoestacao = ? AND tipo_filtro = ? AND ano = ?",
+                chave,
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= agora:
+                self.__conn.execute(
+                    "DELETE FROM serie WHERE endpoint = ? AND codigoestacao = ? "
+                    "AND tipo_filtro = ? AND ano = ?",
+                    chave,
+                )
+                return None
+            self.__conn.execute(
+                "UPDATE serie SET acesso = ? WHERE endpoint = ? AND codigoestacao = ? "
+                "AND tipo_filtro = ? AND ano = ?",
+                (agora, *chave),
+            )
+        return json_decoder.loads(zlib.decompress(row[0]))
+
+    def put(
+        self,
+        endpoint: str,
+        codigoestacao: int,
+        tipo_filtro: str,
+        ano: int,
+        items: JSONList,
+    ) -> None:
+        """Armazena os dados do ano, removendo as entradas menos usadas caso o
+        tamanho máximo seja ultrapassado"""
+
+        dados = zlib.compress(json.dumps(items, separators=(",", ":")).encode())
+        if len(dados) > self.max_bytes:
+            return
+        agora = time.time()
+        expira = agora + self.ttl(ano, items).total_seconds()
+        with self.__lock:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO serie VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    endpoint,
+                    codigoestacao,
+                    tipo_filtro,
+                    ano,
+                    dados,
+                    len(dados),
+                    expira,
+                    agora,
+                ),
+            )
+            self.__evict()
+
+    def __evict(self) -> None:
+        (total,) = self.__conn.execute(
+            "SELECT COALESCE(SUM(tamanho), 0) FROM serie"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        excesso = total - self.max_bytes
+        removidas: list[tuple] = []
+        for *chave, tamanho in self.__conn.execute(
+            "SELECT endpoint, codigoestacao, tipo_filtro, ano, tamanho FROM serie "
+            "ORDER BY acesso"
+        ).fetchall():
+            removidas.append(tuple(chave))
+            excesso -= tamanho
+            if excesso <= 0:
+                break
+        self.__conn.executemany(
+            "DELETE FROM serie WHERE endpoint = ? AND codigoestacao = ? "
+            "AND tipo_filtro = ? AND ano = ?",
+            removidas,
+        )
+
+    @property
+    def size(self) -> int:
+        """Tamanho total, em bytes, dos dados armazenados"""
+
+        with self.__lock:
+            (total,) = self.__conn.execute(
+                "SELECT COALESCE(SUM(tamanho), 0) FROM serie"
+            ).fetchone()
+        return total
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__conn.execute("DELETE FROM serie")
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__conn.close()
+
+    def __enter__(self) -> "SerieCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
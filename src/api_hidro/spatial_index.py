@@ -0,0 +1,194 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from api_hidro.models.models import Inventario
+
+# Raio médio da Terra, em km
+RAIO_TERRA_KM = 6371.0088
+
+
+def haversine(
+    lat1: float | np.ndarray,
+    lon1: float | np.ndarray,
+    lat2: float | np.ndarray,
+    lon2: float | np.ndarray,
+) -> np.ndarray:
+    """Distância, em km, entre pontos da superfície da Terra (fórmula de
+    haversine), calculada de forma vetorizada.
+
+    Args:
+        lat1 (float | np.ndarray): Latitude(s) do primeiro ponto, em graus
+        lon1 (float | np.ndarray): Longitude(s) do primeiro ponto, em graus
+        lat2 (float | np.ndarray): Latitude(s) do segundo ponto, em graus
+        lon2 (float | np.ndarray): Longitude(s) do segundo ponto, em graus
+
+    Returns:
+        np.ndarray: Distância(s) em km
+    """
+
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * RAIO_TERRA_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class SpatialIndex:
+    """Índice espacial das coordenadas das estações do inventário.
+
+    As estações são distribuídas em uma grade regular de latitude e longitude
+    (células de ``celula`` graus) e ordenadas pela célula, de modo que as
+    estações de uma linha de células contígua ocupam uma faixa contínua dos
+    arrays. Uma consulta seleciona apenas as células que cobrem a região de
+    busca e calcula as distâncias das estações candidatas de uma só vez
+    (haversine vetorizado com NumPy).
+
+    Todas as consultas retornam códigos de estação, que podem ser usados
+    diretamente em bulk_serie_historica. Para restringir o índice a um tipo de
+    estação, construa-o a partir de uma seleção, por exemplo
+    ``SpatialIndex(catalogo.busca(tipo_estacao="Fluviometrica"))``.
+
+    Args:
+        estacoes (Iterable[Inventario]): Estações do inventário
+        celula (float, optional): Tamanho da célula da grade, em graus.
+            Defaults to 0.5.
+    """
+
+    def __init__(self, estacoes: Iterable[Inventario], celula: float = 0.5):
+        estacoes = list(estacoes)
+        self.celula = celula
+        self.__colunas = int(np.ceil(360 / celula)) + 1
+
+        latitudes = np.array([e.latitude for e in estacoes], dtype=np.float64)
+        longitudes = np.array([e.longitude for e in estacoes], dtype=np.float64)
+        codigos = np.array([e.codigoestacao for e in estacoes], dtype=np.int64)
+
+        chaves = self.__linha(latitudes) * self.__colunas + self.__coluna(longitudes)
+        ordem = np.argsort(chaves, kind="stable")
+        self.__chaves = chaves[ordem]
+        self.__latitudes = latitudes[ordem]
+        self.__longitudes = longitudes[ordem]
+        self.__codigos = codigos[ordem]
+
+    def __len__(self) -> int:
+        return len(self.__codigos)
+
+    def __linha(self, latitude: float | np.ndarray) -> np.ndarray:
+        return np.floor((np.clip(latitude, -90, 90) + 90) / self.celula).astype(
+            np.int64
+        )
+
+    def __coluna(self, longitude: float | np.ndarray) -> np.ndarray:
+        return np.floor((np.clip(longitude, -180, 180) + 180) / self.celula).astype(
+            np.int64
+        )
+
+    def __candidatos(
+        self, lat_min: float, lon_min: float, lat_max: float, lon_max: float
+    ) -> np.ndarray:
+        # Posições das estações nas células que cobrem o retângulo
+        coluna_min, coluna_max = self.__coluna(lon_min), self.__coluna(lon_max)
+        linhas = np.arange(self.__linha(lat_min), self.__linha(lat_max) + 1)
+        if not len(linhas):
+            return np.empty(0, dtype=np.int64)
+        inicios = np.searchsorted(
+            self.__chaves, linhas * self.__colunas + coluna_min, side="left"
+        )
+        fins = np.searchsorted(
+            self.__chaves, linhas * self.__colunas + coluna_max, side="right"
+        )
+        return np.concatenate(
+            [np.arange(inicio, fim) for inicio, fim in zip(inicios, fins)]
+        )
+
+    def __no_raio(
+        self, latitude: float, longitude: float, raio_km: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        delta_lat = np.degrees(raio_km / RAIO_TERRA_KM)
+        lat_min, lat_max = latitude - delta_lat, latitude + delta_lat
+        cosseno = np.cos(np.radians(min(max(abs(lat_min), abs(lat_max)), 90.0)))
+        delta_lon = delta_lat / cosseno if cosseno > 0 else np.inf
+        lon_min, lon_max = longitude - delta_lon, longitude + delta_lon
+        if lat_min <= -90 or lat_max >= 90 or lon_min < -180 or lon_max > 180:
+            # Círculos que alcançam os polos ou o antimeridiano: todas as longitudes
+            lon_min, lon_max = -180.0, 180.0
+
+        posicoes = self.__candidatos(lat_min, lon_min, lat_max, lon_max)
+        distancias = haversine(
+            latitude, longitude, self.__latitudes[posicoes], self.__longitudes[posicoes]
+        )
+        dentro = distancias <= raio_km
+        posicoes, distancias = posicoes[dentro], distancias[dentro]
+        ordem = np.argsort(distancias, kind="stable")
+        return posicoes[ordem], distancias[ordem]
+
+    def no_raio(self, latitude: float, longitude: float, raio_km: float) -> list[int]:
+        """Estações a até ``raio_km`` do ponto
+
+        Args:
+            latitude (float): Latitude do ponto, em graus
+            longitude (float): Longitude do ponto, em graus
+            raio_km (float): Raio de busca, em km
+
+        Returns:
+            list[int]: Códigos das estações, da mais próxima à mais distante
+        """
+
+        posicoes, _ = self.__no_raio(latitude, longitude, raio_km)
+        return self.__codigos[posicoes].tolist()
+
+    def no_retangulo(
+        self, lat_min: float, lon_min: float, lat_max: float, lon_max: float
+    ) -> list[int]:
+        """Estações dentro do retângulo de coordenadas (limites inclusive)
+
+        Args:
+            lat_min (float): Latitude mínima, em graus
+            lon_min (float): Longitude mínima, em graus
+            lat_max (float): Latitude máxima, em graus
+            lon_max (float): Longitude máxima, em graus
+
+        Returns:
+            list[int]: Códigos das estações, ordenados por célula da grade
+        """
+
+        posicoes = self.__candidatos(lat_min, lon_min, lat_max, lon_max)
+        latitudes = self.__latitudes[posicoes]
+        longitudes = self.__longitudes[posicoes]
+        dentro = (
+            (latitudes >= lat_min)
+            & (latitudes <= lat_max)
+            & (longitudes >= lon_min)
+            & (longitudes <= lon_max)
+        )
+        return self.__codigos[posicoes[dentro]].tolist()
+
+    def mais_proximas(self, latitude: float, longitude: float, k: int = 1) -> list[int]:
+        """As ``k`` estações mais próximas do ponto.
+
+        A busca começa pelas células vizinhas ao ponto e dobra o raio até
+        encontrar ``k`` estações: como todas as estações fora do raio estão mais
+        distantes que as de dentro, o resultado é exato.
+
+        Args:
+            latitude (float): Latitude do ponto, em graus
+            longitude (float): Longitude do ponto, em graus
+            k (int, optional): Número de estações. Defaults to 1.
+
+        Returns:
+            list[int]: Códigos das estações, da mais próxima à mais distante
+        """
+
+        if k <= 0 or not len(self):
+            return []
+
+        raio_km = np.radians(self.celula) * RAIO_TERRA_KM
+        while True:
+            posicoes, _ = self.__no_raio(latitude, longitude, raio_km)
+            if len(posicoes) >= k or raio_km > np.pi * RAIO_TERRA_KM:
+                break
+            raio_km *= 2
+
+        return self.__codigos[posicoes[:k]].tolist()
@@ -0,0 +1,166 @@
+from collections.abc import Collection, Iterable, Iterator
+
+import numpy as np
+
+from api_hidro.models.models import Inventario
+
+# Campos com índice hash (valor -> posições das estações)
+CAMPOS_HASH = ("uf_estacao", "codigobacia", "sub_bacia_codigo", "tipo_estacao")
+
+# Campos booleanos com índice bitmap
+CAMPOS_BITMAP = tuple(
+    nome for nome, campo in Inventario.model_fields.items() if campo.annotation is bool
+)
+
+type Criterio = object | Collection[object]
+
+
+class StationCatalog:
+    """Catálogo em memória do inventário de estações, com índices para consultas.
+
+    A busca por código da estação é feita por um dicionário, em O(1). Os campos
+    ``uf_estacao``, ``codigobacia``, ``sub_bacia_codigo`` e ``tipo_estacao``
+    possuem índices hash (valor -> posições das estações) e os campos booleanos
+    (``operando`` e ``tipo_estacao_*``) possuem índices bitmap (um array
+    booleano do NumPy por campo). Uma consulta com vários critérios é a
+    interseção (AND) vetorizada das máscaras de cada critério, sem percorrer a
+    lista de estações.
+
+    O catálogo pode ser serializado com pickle para ser compartilhado com
+    processos auxiliares.
+
+    Args:
+        estacoes (Iterable[Inventario]): Estações do inventário, por exemplo o
+            retorno de inventario_completo
+    """
+
+    def __init__(self, estacoes: Iterable[Inventario]):
+        self.__estacoes = tuple(estacoes)
+        self.__codigos = np.array(
+            [estacao.codigoestacao for estacao in self.__estacoes], dtype=np.int64
+        )
+        self.__posicoes = {
+            codigo: posicao for posicao, codigo in enumerate(self.__codigos.tolist())
+        }
+
+        indices: dict[str, dict[object, list[int]]] = {
+            campo: {} for campo in CAMPOS_HASH
+        }
+        for posicao, estacao in enumerate(self.__estacoes):
+            for campo, indice in indices.items():
+                indice.setdefault(getattr(estacao, campo), []).append(posicao)
+        self.__hash = {
+            campo: {
+                valor: np.array(posicoes, dtype=np.int32)
+                for valor, posicoes in indice.items()
+            }
+            for campo, indice in indices.items()
+        }
+
+        self.__bitmaps = {
+            campo: np.fromiter(
+                (getattr(estacao, campo) for estacao in self.__estacoes),
+                dtype=bool,
+                count=len(self.__estacoes),
+            )
+            for campo in CAMPOS_BITMAP
+        }
+
+    def __len__(self) -> int:
+        return len(self.__estacoes)
+
+    def __iter__(self) -> Iterator[Inventario]:
+        return iter(self.__estacoes)
+
+    def __contains__(self, codigoestacao: object) -> bool:
+        return codigoestacao in self.__posicoes
+
+    def __getitem__(self, codigoestacao: int) -> Inventario:
+        return self.__estacoes[self.__posicoes[codigoestacao]]
+
+    def get(self, codigoestacao: int) -> Inventario | None:
+        """Estação com o código informado, ou None caso não exista"""
+
+        posicao = self.__posicoes.get(codigoestacao)
+        return None if posicao is None else self.__estacoes[posicao]
+
+    def valores(self, campo: str) -> list[object]:
+        """Valores distintos de um campo com índice hash
+
+        Args:
+            campo (str): Um dos campos de CAMPOS_HASH
+
+        Raises:
+            ValueError: Erro lançado caso o campo não possua índice hash
+
+        Returns:
+            list[object]: Valores distintos do campo
+        """
+
+        if campo not in self.__hash:
+            raise ValueError(f"O campo '{campo}' não possui índice hash")
+        return list(self.__hash[campo])
+
+    def __mascara(self, criterios: dict[str, Criterio]) -> np.ndarray:
+        mascara = np.ones(len(self.__estacoes), dtype=bool)
+        for campo, valor in criterios.items():
+            if valor is None:
+                continue
+            if campo in self.__bitmaps:
+                bitmap = self.__bitmaps[campo]
+                mascara &= bitmap if valor else ~bitmap
+            elif campo in self.__hash:
+                indice = self.__hash[campo]
+                valores = (
+                    valor
+                    if isinstance(valor, Collection) and not isinstance(valor, str)
+                    else [valor]
+                )
+                selecao = np.zeros(len(self.__estacoes), dtype=bool)
+                for item in valores:
+                    posicoes = indice.get(item)
+                    if posicoes is not None:
+                        selecao[posicoes] = True
+                mascara &= selecao
+            else:
+                raise ValueError(f"O campo '{campo}' não possui índice")
+        return mascara
+
+    def busca(self, **criterios: Criterio) -> list[Inventario]:
+        """Estações que atendem a todos os critérios.
+
+        Os critérios são os campos de CAMPOS_HASH, com um valor ou uma coleção
+        de valores aceitos, e os campos de CAMPOS_BITMAP, com True ou False.
+        Critérios com valor None são ignorados.
+
+        Exemplo: ``catalogo.busca(uf_estacao=["MG", "SP"], operando=True,
+        tipo_estacao_telemetrica=True)``
+
+        Raises:
+            ValueError: Erro lançado caso algum campo não possua índice
+
+        Returns:
+            list[Inventario]: Estações selecionadas, na ordem do inventário
+        """
+
+        posicoes = np.flatnonzero(self.__mascara(criterios))
+        return [self.__estacoes[posicao] for posicao in posicoes]
+
+    def codigos(self, **criterios: Criterio) -> list[int]:
+        """Códigos das estações que atendem a todos os critérios (ver busca).
+
+        O resultado pode ser usado diretamente em bulk_serie_historica.
+
+        Raises:
+            ValueError: Erro lançado caso algum campo não possua índice
+
+        Returns:
+            list[int]: Códigos das estações selecionadas
+        """
+
+        return self.__codigos[self.__mascara(criterios)].tolist()
+
+    def conta(self, **criterios: Criterio) -> int:
+        """Número de estações que atendem a todos os critérios (ver busca)"""
+
+        return int(np.count_nonzero(self.__mascara(criterios)))
@@ -0,0 +1,139 @@
+import json
+import sqlite3
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+from threading import Lock
+from types import TracebackType
+
+from api_hidro.models.api_response_models import JSONList
+
+
+class SyncStore:
+    """Armazenamento local, em SQLite, das séries sincronizadas incrementalmente.
+
+    Os registros de cada endpoint e estação são gravados pela chave primária do
+    registro (por exemplo, data do dado e nível de consistência), de modo que
+    registros corrigidos pela ANA substituem a versão anterior. Para cada
+    endpoint e estação é mantida a marca d'água (high-water mark): a data até a
+    qual as alterações já foram sincronizadas.
+
+    Args:
+        path (str | Path): Arquivo SQLite do armazenamento.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = Lock()
+        self.__conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS registro (
+                endpoint TEXT NOT NULL,
+                codigoestacao INTEGER NOT NULL,
+                chave TEXT NOT NULL,
+                dados TEXT NOT NULL,
+                PRIMARY KEY (endpoint, codigoestacao, chave)
+            );
+            CREATE TABLE IF NOT EXISTS marca_dagua (
+                endpoint TEXT NOT NULL,
+                codigoestacao INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (endpoint, codigoestacao)
+            );
+            """
+        )
+
+    def watermark(self, endpoint: str, codigoestacao: int) -> date | None:
+        """Data até a qual as alterações da estação já foram sincronizadas
+
+        Returns:
+            date | None: Marca d'água, ou None caso a estação nunca tenha sido
+                sincronizada
+        """
+
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT data FROM marca_dagua WHERE endpoint = ? AND codigoestacao = ?",
+                (endpoint, codigoestacao),
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def merge(
+        self,
+        endpoint: str,
+        codigoestacao: int,
+        items: JSONList,
+        chave: Sequence[str],
+        watermark: date | None,
+    ) -> int:
+        """Grava os registros, substituindo os de mesma chave, e avança a marca
+        d'água em uma única transação
+
+        Args:
+            endpoint (str): Nome do endpoint (ex.: 'HidroSerieVazao')
+            codigoestacao (int): Código da estação
+            items (JSONList): Registros retornados pela API
+            chave (Sequence[str]): Campos que formam a chave primária do registro
+            watermark (date | None): Nova marca d'água da estação. None mantém a
+                marca d'água atual (sincronização incompleta)
+
+        Returns:
+            int: Número de registros gravados
+        """
+
+        rows = [
+            (
+                endpoint,
+                codigoestacao,
+                "|".join(str(item.get(campo)) for campo in chave),
+                json.dumps(item, separators=(",", ":")),
+            )
+            for item in items
+        ]
+        with self.__lock:
+            self.__conn.execute("BEGIN")
+            try:
+                self.__conn.executemany(
+                    "INSERT OR REPLACE INTO registro VALUES (?, ?, ?, ?)", rows
+                )
+                if watermark is not None:
+                    self.__conn.execute(
+                        "INSERT OR REPLACE INTO marca_dagua VALUES (?, ?, ?)",
+                        (endpoint, codigoestacao, watermark.isoformat()),
+                    )
+                self.__conn.execute("COMMIT")
+            except BaseException:
+                self.__conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def records(self, endpoint: str, codigoestacao: int) -> JSONList:
+        """Retorna os registros armazenados da estação, ordenados pela chave"""
+
+        with self.__lock:
+            rows = self.__conn.execute(
+                "SELECT dados FROM registro WHERE endpoint = ? AND codigoestacao = ? "
+                "ORDER BY chave",
+                (endpoint, codigoestacao),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__conn.close()
+
+    def __enter__(self) -> "SyncStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
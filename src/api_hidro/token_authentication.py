@@ -1,11 +1,31 @@
+import asyncio
+import itertools
+import weakref
 from datetime import datetime, timedelta
+from threading import Lock, Timer
 from types import TracebackType
+from typing import cast
 
-import requests
 from pydantic.main import BaseModel
 from pydantic.types import SecretStr
 
+from api_hidro.api_requests.sync_request import http_get_sync
+from api_hidro.api_requests.transport import (
+    AsyncHttpTransport,
+    HttpTransport,
+    default_async_transport,
+    default_transport,
+)
+from api_hidro.token_cache import FileTokenCache
+
 EXPIRATION_MINUTES = 30
+# Antecedência, em minutos, da renovação do token em segundo plano
+RENEWAL_MARGIN_MINUTES = 5
+# Espera, em segundos, antes de repetir uma renovação em segundo plano que falhou
+RENEWAL_RETRY_SECONDS = 30
+
+# Identificadores dos handlers: ao contrário de id(), nunca são reutilizados
+_handler_ids = itertools.count()
 
 
 class AuthCredentials(BaseModel):
@@ -14,10 +34,48 @@ class AuthCredentials(BaseModel):
 
 
 class TokenAuthHandler:
-    def __init__(self, auth_credentials: AuthCredentials):
+    """Gerencia o token de autenticação da API HIDRO.
+
+    O token é compartilhado por todas as requisições e pode ser obtido de várias
+    threads e tarefas assíncronas simultaneamente: quando expirado, apenas uma
+    delas solicita um novo token enquanto as demais aguardam (single-flight).
+    O primeiro token é obtido apenas no primeiro uso, e não na criação do objeto.
+    Com ``auto_renew``, o token é renovado em segundo plano
+    ``RENEWAL_MARGIN_MINUTES`` antes de expirar, de modo que as requisições não
+    esperam pelo endpoint de autenticação.
+
+    Args:
+        auth_credentials (AuthCredentials): Login e senha de acesso à API.
+        transport (HttpTransport | None, optional): Transporte síncrono. Defaults to
+            o transporte compartilhado do processo.
+        async_transport (AsyncHttpTransport | None, optional): Transporte
+            assíncrono. Defaults to o transporte assíncrono compartilhado do processo.
+        auto_renew (bool, optional): Renova o token em segundo plano antes da
+            expiração. Defaults to True.
+        token_cache (FileTokenCache | None, optional): Cache em disco do token,
+            compartilhado entre os processos que utilizam o mesmo login. Defaults
+            to None.
+    """
+
+    def __init__(
+        self,
+        auth_credentials: AuthCredentials,
+        transport: HttpTransport | None = None,
+        async_transport: AsyncHttpTransport | None = None,
+        auto_renew: bool = True,
+        token_cache: FileTokenCache | None = None,
+    ):
         self.__auth_credentials = auth_credentials
-        self.__token_auth = self.get_api_token()
-        self.time_expire = datetime.now() + timedelta(minutes=EXPIRATION_MINUTES)
+        self.transport = transport or default_transport()
+        self.async_transport = async_transport or default_async_transport()
+        self.auto_renew = auto_renew
+        self.token_cache = token_cache
+        self.handler_id = next(_handler_ids)
+        self.__lock = Lock()
+        self.__timer: Timer | None = None
+        self.__closed = False
+        self.__token_auth: str | None = None
+        self.time_expire = datetime.min
 
     def __get_credentials(self) -> tuple[str, str]:
         api_login = self.__auth_credentials.login.get_secret_value()
@@ -34,23 +92,115 @@ class TokenAuthHandler:
             "https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/OAUth/v1"
         )
         headers = {"accept": "*/*", "Identificador": api_login, "Senha": api_password}
-        response = requests.get(url_oauth, headers=headers)
-        if response.status_code != 200:
-            response.raise_for_status()
+        data = http_get_sync(url_oauth, headers, {}, self.transport)
 
-        token_auth = response.json()["items"]["tokenautenticacao"]
+        token_auth = data["items"]["tokenautenticacao"]
         # os.environ["API_TOKEN_HIDRO"] = token_auth
 
         return token_auth
 
+    @property
+    def expired(self) -> bool:
+        return datetime.now() > self.time_expire
+
     def refresh_token(self) -> None:
-        self.__token_auth = self.get_api_token()
-        self.time_expire = datetime.now() + timedelta(minutes=EXPIRATION_MINUTES)
+        """Obtém um novo token, ainda que o atual não tenha expirado"""
+
+        with self.__lock:
+            self.__refresh()
+
+    def __refresh(self) -> None:
+        if self.token_cache is None:
+            self.__set_token(self.get_api_token(), self.__new_expiration())
+            return
+
+        login, _ = self.__get_credentials()
+        with self.token_cache.lock(login):
+            cached = self.token_cache.load(login)
+            # Reutiliza o token obtido por outro processo, exceto o que está sendo
+            # substituído (expirado ou recusado pela API)
+            if (
+                cached is not None
+                and cached[0] != self.__token_auth
+                and cached[1] - datetime.now()
+                > timedelta(minutes=RENEWAL_MARGIN_MINUTES)
+            ):
+                self.__set_token(*cached)
+                return
+
+            token, expires = self.get_api_token(), self.__new_expiration()
+            self.token_cache.store(login, token, expires)
+            self.__set_token(token, expires)
+
+    def __new_expiration(self) -> datetime:
+        return datetime.now() + timedelta(minutes=EXPIRATION_MINUTES)
+
+    def __set_token(self, token: str, expires: datetime) -> None:
+        self.__token_auth = token
+        self.time_expire = expires
+        renewal = expires - timedelta(minutes=RENEWAL_MARGIN_MINUTES)
+        self.__schedule_renewal(max(0.0, (renewal - datetime.now()).total_seconds()))
+
+    def __schedule_renewal(self, seconds: float) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if not self.auto_renew or self.__closed:
+            return
+        # O timer guarda apenas uma referência fraca, para não manter o handler vivo
+        self.__timer = Timer(seconds, _renew_in_background, (weakref.ref(self),))
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def _renew(self) -> None:
+        with self.__lock:
+            if self.__closed:
+                return
+            try:
+                self.__refresh()
+            except (OSError, ValueError, KeyError):
+                # Falha de rede ou de HTTP (requests.RequestException é um
+                # OSError) ou resposta inválida: o token atual continua válido
+                # até expirar; tenta novamente depois
+                self.__schedule_renewal(RENEWAL_RETRY_SECONDS)
+
+    def get_token(self) -> str:
+        """Retorna o token atual, renovando-o caso esteja expirado
+
+        Returns:
+            str: Token de autenticação
+        """
 
-    def __enter__(self):
-        if datetime.now() > self.time_expire:
-            self.refresh_token()
-        return self.__token_auth
+        if self.expired:
+            with self.__lock:
+                # Outra thread pode ter renovado o token enquanto esta aguardava
+                if self.expired:
+                    self.__refresh()
+        return cast(str, self.__token_auth)
+
+    def invalidate(self, stale_token: str) -> None:
+        """Marca o token como expirado após a API recusá-lo (HTTP 401)
+
+        O token só é invalidado se ainda for o token recusado: quando várias
+        requisições simultâneas recebem 401, o token é renovado uma única vez.
+
+        Args:
+            stale_token (str): Token recusado pela API
+        """
+
+        with self.__lock:
+            if self.__token_auth == stale_token:
+                self.time_expire = datetime.min
+
+    def close(self) -> None:
+        """Interrompe a renovação do token em segundo plano"""
+
+        with self.__lock:
+            self.__closed = True
+            self.__schedule_renewal(0)
+
+    def __enter__(self) -> str:
+        return self.get_token()
 
     def __exit__(
         self,
@@ -58,3 +208,22 @@ class TokenAuthHandler:
         exc_value: BaseException | None = None,
         traceback: TracebackType | None = None,
     ): ...
+
+    async def __aenter__(self) -> str:
+        if self.expired:
+            # A obtenção do token é síncrona: executa fora do event loop
+            return await asyncio.to_thread(self.get_token)
+        return cast(str, self.__token_auth)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ): ...
+
+
+def _renew_in_background(ref: "weakref.ref[TokenAuthHandler]") -> None:
+    token_auth = ref()
+    if token_auth is not None:
+        token_auth._renew()
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from api_hidro.utils import cache_home
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def default_cache_dir() -> Path:
+    """Diretório padrão do cache de tokens: $XDG_CACHE_HOME/api_hidro/tokens"""
+
+    return cache_home() / "tokens"
+
+
+class FileTokenCache:
+    """Cache em disco do token de autenticação, compartilhado entre processos.
+
+    Cada login possui um arquivo, nomeado pelo hash SHA-256 do login e criado com
+    permissão 0600, contendo o token e sua data de expiração. Processos de um
+    mesmo servidor (workers, tarefas de cron, CLIs) reutilizam assim um token
+    ainda válido em vez de solicitar um novo token a cada execução. A renovação
+    é serializada por um lock de arquivo, de modo que apenas um processo acessa o
+    endpoint de autenticação por vez.
+
+    Opcionalmente, o conteúdo é criptografado com Fernet (extra ``crypto``:
+    ``pip install api-hidro[crypto]``).
+
+    Args:
+        path (str | Path | None, optional): Diretório do cache. Defaults to
+            default_cache_dir().
+        encryption_key (str | bytes | None, optional): Chave Fernet
+            (``Fernet.generate_key()``) para criptografar o token. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        encryption_key: str | bytes | None = None,
+    ):
+        self.path = Path(path) if path is not None else default_cache_dir()
+        self.__fernet = None
+        # Arquivo ausente, corrompido ou de outro formato: o token é obtido
+        # novamente. Os demais erros não são ocultados
+        self.__erros_leitura: tuple[type[Exception], ...] = (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+        )
+        if encryption_key is not None:
+            try:
+                from cryptography.fernet import Fernet, InvalidToken
+            except ImportError as exc:
+                raise ImportError(
+                    "A criptografia do cache de tokens requer o pacote "
+                    "'cryptography': pip install api-hidro[crypto]"
+                ) from exc
+            self.__fernet = Fernet(encryption_key)
+            # Token criptografado com outra chave
+            self.__erros_leitura += (InvalidToken,)
+
+    def __file(self, login: str, suffix: str) -> Path:
+        digest = hashlib.sha256(login.encode()).hexdigest()
+        return self.path / f"{digest}{suffix}"
+
+    def load(self, login: str) -> tuple[str, datetime] | None:
+        """Retorna o token armazenado para o login e sua data de expiração
+
+        Args:
+            login (str): Login de acesso à API
+
+        Returns:
+            tuple[str, datetime] | None: Token e data de expiração, ou None caso
+                não exista token armazenado ou o arquivo seja inválido
+        """
+
+        try:
+            content = self.__file(login, ".token").read_bytes()
+            if self.__fernet is not None:
+                content = self.__fernet.decrypt(content)
+            data = json.loads(content)
+            return data["token"], datetime.fromisoformat(data["expires"])
+        except self.__erros_leitura:
+            return None
+
+    def store(self, login: str, token: str, expires: datetime) -> None:
+        """Armazena o token do login com permissão 0600
+
+        Args:
+            login (str): Login de acesso à API
+            token (str): Token de autenticação
+            expires (datetime): Data de expiração do token
+        """
+
+        self.path.mkdir(parents=True, exist_ok=True, mode=0o700)
+        content = json.dumps({"token": token, "expires": expires.isoformat()}).encode()
+        if self.__fernet is not None:
+            content = self.__fernet.encrypt(content)
+
+        # Escrita atômica: outros processos nunca leem um arquivo incompleto
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            os.chmod(tmp, 0o600)
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp, self.__file(login, ".token"))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def lock(self, login: str) -> Iterator[None]:
+        """Lock exclusivo entre processos para a renovação do token do login"""
+
+        if fcntl is None:
+            yield
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd = os.open(self.__file(login, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
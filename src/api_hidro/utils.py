@@ -1,8 +1,24 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from itertools import islice
+from pathlib import Path
 from typing import Sequence
 
+import httpx
 import pandas as pd
 from pydantic import BaseModel
 
+from api_hidro.errors import IncompleteDataError
+
+
+def cache_home() -> Path:
+    """Diretório base dos caches locais da biblioteca: $XDG_CACHE_HOME/api_hidro"""
+
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "api_hidro"
+    )
+
 
 def flatten_concatenation[T](matrix: Sequence[Sequence[T]]) -> list[T]:
     flat_list: list[T] = []
@@ -11,6 +27,104 @@ def flatten_concatenation[T](matrix: Sequence[Sequence[T]]) -> list[T]:
     return flat_list
 
 
+def split_failures[K, T](
+    keys: Sequence[K], results: Sequence[T | BaseException]
+) -> tuple[dict[K, T], dict[K, Exception]]:
+    """Separa os resultados de um asyncio.gather(..., return_exceptions=True)
+    em sucessos e falhas, indexados pelas chaves correspondentes"""
+
+    successes: dict[K, T] = {}
+    failures: dict[K, Exception] = {}
+    for key, result in zip(keys, results):
+        if isinstance(result, Exception):
+            failures[key] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            successes[key] = result
+    return successes, failures
+
+
+# Falhas de uma requisição registradas por chave em gather_bounded: rede e HTTP
+# (httpx e requests, cujas exceções são OSError), respostas inválidas
+# (ValueError, inclusive pydantic.ValidationError) e dados incompletos. Os
+# demais erros, de programação, são propagados
+FALHAS_DE_REQUISICAO: tuple[type[Exception], ...] = (
+    httpx.HTTPError,
+    OSError,
+    ValueError,
+    KeyError,
+    IncompleteDataError,
+)
+
+
+async def gather_bounded[K, T](
+    keys: Sequence[K], func: Callable[[K], Awaitable[T]], limit: int
+) -> tuple[dict[K, T], dict[K, Exception]]:
+    """Executa func para cada chave com no máximo ``limit`` corrotinas ativas.
+
+    Ao contrário de asyncio.gather, as corrotinas são criadas à medida que os
+    workers ficam livres, de modo que períodos longos (milhares de requisições)
+    não mantêm todas as tarefas pendentes em memória.
+
+    Returns:
+        tuple[dict[K, T], dict[K, Exception]]: Sucessos e falhas, indexados pelas
+            chaves e na ordem de ``keys``
+    """
+
+    results: dict[K, T | Exception] = {}
+    pendentes = iter(keys)
+
+    async def worker() -> None:
+        for key in pendentes:
+            try:
+                results[key] = await func(key)
+            except FALHAS_DE_REQUISICAO as exc:
+                results[key] = exc
+
+    await asyncio.gather(*[worker() for _ in range(max(1, min(limit, len(keys))))])
+    return split_failures(keys, [results[key] for key in keys])
+
+
+async def as_completed_bounded[K, T](
+    keys: Sequence[K], func: Callable[[K], Awaitable[T]], limit: int
+) -> AsyncIterator[tuple[K, T | Exception]]:
+    """Executa func para cada chave com no máximo ``limit`` tarefas ativas e
+    produz os resultados (ou exceções) à medida que são concluídos.
+
+    Uma nova tarefa só é iniciada depois que o resultado de outra é entregue ao
+    consumidor, de modo que, mesmo que o consumidor seja lento, no máximo
+    ``limit`` resultados ficam em memória. Caso a iteração seja interrompida, as
+    tarefas pendentes são canceladas.
+    """
+
+    pendentes = iter(keys)
+    tasks: dict[asyncio.Future[T], K] = {}
+
+    def inicia(quantidade: int) -> None:
+        for key in islice(pendentes, quantidade):
+            tasks[asyncio.ensure_future(func(key))] = key
+
+    inicia(max(1, limit))
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = tasks.pop(task)
+                exc = task.exception()
+                if exc is None:
+                    yield key, task.result()
+                elif isinstance(exc, Exception):
+                    yield key, exc
+                else:
+                    raise exc
+                # A substituta só é iniciada após a entrega do resultado
+                inicia(1)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 def as_dataframe(hidro_serie: Sequence[BaseModel] | Sequence[dict]) -> pd.DataFrame:
     serie: list[dict] = []
 
@@ -0,0 +1,70 @@
+import json
+
+import httpx
+import pytest
+
+from api_hidro.api_requests.transport import AsyncHttpTransport, HttpTransport
+from api_hidro.token_authentication import AuthCredentials, TokenAuthHandler
+
+
+class FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return {"items": {"tokenautenticacao": "fake-token"}}
+
+    @property
+    def content(self):
+        return json.dumps(self.json()).encode()
+
+
+class FakeTransport(HttpTransport):
+    """Transporte síncrono que apenas devolve um token fixo"""
+
+    def __init__(self):
+        super().__init__()
+        self.urls: list[str] = []
+
+    def get(self, url, headers=None, params=None):
+        self.urls.append(url)
+        return FakeResponse()
+
+
+class FakeAsyncTransport(AsyncHttpTransport):
+    """Transporte assíncrono que responde a partir de uma função (url, params) -> items"""
+
+    def __init__(self, responde):
+        super().__init__()
+        self.responde = responde
+        self.chamadas: list[tuple[str, dict]] = []
+
+    async def get(self, url, headers=None, params=None, fairness_key=None):
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        self.chamadas.append((url, params))
+        resposta = self.responde(url, params)
+        if isinstance(resposta, httpx.Response):
+            return resposta
+        return httpx.Response(
+            200,
+            json={"status": "OK", "code": 200, "message": "", "items": resposta},
+            request=httpx.Request("GET", url),
+        )
+
+
+@pytest.fixture
+def make_token_auth():
+    handlers: list[TokenAuthHandler] = []
+
+    def factory(responde) -> TokenAuthHandler:
+        token_auth = TokenAuthHandler(
+            AuthCredentials(login="login", password="senha"),
+            transport=FakeTransport(),
+            async_transport=FakeAsyncTransport(responde),
+        )
+        handlers.append(token_auth)
+        return token_auth
+
+    yield factory
+    for token_auth in handlers:
+        token_auth.close()
+        token_auth.async_transport.close()
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from api_hidro import aio
+from api_hidro.api_requests import hidro_serie as hs
+
+
+def responde_ano(url, params):
+    return [{"ano": params["Data Inicial (yyyy-MM-dd)"][:4]}]
+
+
+def test_aio_runs_inside_running_event_loop(make_token_auth):
+    token_auth = make_token_auth(responde_ano)
+
+    async def main():
+        return await asyncio.gather(
+            aio.retorna_serie_historica(
+                token_auth, 1, "Vazao", "2020-01-01", "2022-12-31"
+            ),
+            aio.retorna_serie_historica(
+                token_auth, 2, "Vazao", "2020-01-01", "2021-12-31"
+            ),
+        )
+
+    serie_1, serie_2 = asyncio.run(main())
+    assert [item["ano"] for item in serie_1] == ["2020", "2021", "2022"]
+    assert len(serie_2) == 2
+    assert len(token_auth.async_transport.chamadas) == 5
+
+
+def test_sync_wrapper_works_inside_running_event_loop(make_token_auth):
+    token_auth = make_token_auth(responde_ano)
+
+    async def main():
+        return hs.retorna_serie_historica(
+            token_auth, 1, "Chuva", "2020-01-01", "2020-12-31"
+        )
+
+    assert asyncio.run(main()) == [{"ano": "2020"}]
+
+
+def test_sync_wrapper_inside_transport_loop_raises(make_token_auth):
+    token_auth = make_token_auth(responde_ano)
+
+    async def chama_sincrono():
+        hs.retorna_serie_historica(token_auth, 1, "Chuva", "2020-01-01", "2020-12-31")
+
+    with pytest.raises(RuntimeError):
+        token_auth.async_transport.run(chama_sincrono())
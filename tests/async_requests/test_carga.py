@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from api_hidro.api_requests import hidro_carga as hc
+from api_hidro.errors import IncompleteDataError
+from api_hidro.job_manifest import JobManifest
+from api_hidro.sync_store import SyncStore
+
+
+def item(codigo, ano, mes=1):
+    return {
+        "codigoestacao": codigo,
+        "Data_Hora_Dado": f"{ano}-{mes:02d}-01 00:00:00.0",
+        "Nivel_Consistencia": "2",
+    }
+
+
+def test_carga_resumes_from_manifest(make_token_auth, tmp_path):
+    falhar = {(2, "2021")}
+
+    def responde(url, params):
+        codigo = params["Código da Estação"]
+        ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+        if (codigo, ano) in falhar:
+            raise RuntimeError("rede")
+        return [item(codigo, ano, mes) for mes in (1, 2)]
+
+    token_auth = make_token_auth(responde)
+    with (
+        JobManifest(tmp_path / "manifest.sqlite3") as manifest,
+        SyncStore(tmp_path / "store.sqlite3") as store,
+    ):
+        with pytest.raises(IncompleteDataError) as exc_info:
+            hc.executa_carga_historica(
+                token_auth,
+                manifest,
+                store,
+                [1, 2],
+                ["Vazao"],
+                "2020-01-01",
+                "2021-12-31",
+            )
+        assert list(exc_info.value.failures) == [(2, "Vazao", 2021)]
+        assert list(manifest.falhas()) == [(2, "Vazao", 2021)]
+        assert len(manifest.concluidas()) == 3
+
+        falhar.clear()
+        chamadas = len(token_auth.async_transport.chamadas)
+        progresso = []
+        feitas = hc.executa_carga_historica(
+            token_auth,
+            manifest,
+            store,
+            [1, 2],
+            ["Vazao"],
+            "2020-01-01",
+            "2021-12-31",
+            progresso=progresso.append,
+        )
+
+        assert feitas == 1
+        assert len(token_auth.async_transport.chamadas) == chamadas + 1
+        assert progresso[-1].concluidos == progresso[-1].total == 4
+        assert manifest.falhas() == {}
+        assert len(store.records("HidroSerieVazao", 2)) == 4
+
+
+def test_carga_shards_by_station_code(make_token_auth, tmp_path):
+    token_auth = make_token_auth(lambda url, params: [])
+    with (
+        JobManifest(tmp_path / "manifest.sqlite3") as manifest,
+        SyncStore(tmp_path / "store.sqlite3") as store,
+    ):
+        for shard in range(3):
+            hc.executa_carga_historica(
+                token_auth,
+                manifest,
+                store,
+                [10, 11, 12, 13],
+                ["Chuva", "Cotas"],
+                "2020-01-01",
+                "2020-12-31",
+                shard=shard,
+                num_shards=3,
+            )
+            estacoes = {codigo for codigo, _, _ in manifest.concluidas()}
+            assert all(codigo % 3 <= shard for codigo in estacoes)
+
+        assert len(manifest.concluidas()) == 8
+
+        with pytest.raises(ValueError):
+            hc.executa_carga_historica(
+                token_auth,
+                manifest,
+                store,
+                [1],
+                ["Chuva"],
+                "2020-01-01",
+                "2020-12-31",
+                shard=3,
+                num_shards=3,
+            )
+
+
+def test_carga_accesses_manifest_and_store_outside_the_event_loop(
+    make_token_auth, tmp_path
+):
+    def responde(url, params):
+        if params["Código da Estação"] == 2:
+            raise RuntimeError("rede")
+        return [item(1, 2020)]
+
+    token_auth = make_token_auth(responde)
+    no_event_loop = []
+
+    def registra(metodo):
+        def chamada(self, *args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                no_event_loop.append((metodo.__name__, True))
+            except RuntimeError:
+                no_event_loop.append((metodo.__name__, False))
+            return metodo(self, *args, **kwargs)
+
+        return chamada
+
+    class Manifest(JobManifest):
+        concluidas = registra(JobManifest.concluidas)
+        conclui = registra(JobManifest.conclui)
+        registra_falha = registra(JobManifest.registra_falha)
+
+    class Store(SyncStore):
+        merge = registra(SyncStore.merge)
+
+    with (
+        Manifest(tmp_path / "manifest.sqlite3") as manifest,
+        Store(tmp_path / "store.sqlite3") as store,
+    ):
+        with pytest.raises(IncompleteDataError):
+            hc.executa_carga_historica(
+                token_auth,
+                manifest,
+                store,
+                [1, 2],
+                ["Vazao"],
+                "2020-01-01",
+                "2020-12-31",
+            )
+
+    assert sorted(no_event_loop) == [
+        ("conclui", False),
+        ("concluidas", False),
+        ("merge", False),
+        ("registra_falha", False),
+    ]
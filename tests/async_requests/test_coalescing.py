@@ -0,0 +1,217 @@
+import asyncio
+import gc
+import threading
+import time
+
+import httpx
+import pytest
+
+from api_hidro.api_requests.async_request import api_get_async, api_get_bytes_async
+from api_hidro.api_requests.coalescing import RequestCoalescer, chave_requisicao
+from api_hidro.api_requests.transport import TransportConfig
+from api_hidro.token_authentication import AuthCredentials, TokenAuthHandler
+
+URL = "https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroSerieVazao/v1"
+
+
+def test_chave_requisicao_ignora_ordem_e_none():
+    assert chave_requisicao("json", URL, {"a": 1, "b": 2, "c": None}) == (
+        chave_requisicao("json", URL, {"b": 2, "a": 1})
+    )
+    assert chave_requisicao("json", URL, {"a": 1}) != chave_requisicao(
+        "bytes", URL, {"a": 1}
+    )
+
+
+def test_api_get_async_agrupa_requisicoes_identicas(make_token_auth):
+    token_auth = make_token_auth(lambda url, params: [{"codigo": params["codigo"]}])
+
+    async def main():
+        return await asyncio.gather(
+            *(api_get_async(token_auth, URL, {"codigo": 1}) for _ in range(10)),
+            api_get_async(token_auth, URL, {"codigo": 2}),
+            api_get_bytes_async(token_auth, URL, {"codigo": 1}),
+        )
+
+    *respostas, outra, conteudo = token_auth.async_transport.run(main())
+
+    # Uma requisição para cada chave: json do código 1 e 2 e bytes do código 1
+    codigos = [params["codigo"] for _, params in token_auth.async_transport.chamadas]
+    assert sorted(codigos) == [1, 1, 2]
+    # Cada chamador recebe a sua própria cópia dos itens
+    assert all(resposta == respostas[0] for resposta in respostas)
+    respostas[0]["items"][0]["codigo"] = 99
+    respostas[0]["items"].append({"codigo": 3})
+    assert respostas[1]["items"] == [{"codigo": 1}]
+    assert outra["items"] == [{"codigo": 2}]
+    assert isinstance(conteudo, bytes)
+
+
+def test_api_get_async_sem_agrupamento(make_token_auth):
+    token_auth = make_token_auth(lambda url, params: [])
+    token_auth.async_transport.config = TransportConfig(coalesce=False)
+
+    async def main():
+        await asyncio.gather(
+            *(api_get_async(token_auth, URL, {"codigo": 1}) for _ in range(3))
+        )
+
+    token_auth.async_transport.run(main())
+
+    assert len(token_auth.async_transport.chamadas) == 3
+
+
+def test_erro_compartilhado_e_nao_armazenado(make_token_auth):
+    def responde(url, params):
+        return httpx.Response(404, request=httpx.Request("GET", url))
+
+    token_auth = make_token_auth(responde)
+    token_auth.async_transport.coalescer = RequestCoalescer(ttl=60)
+
+    async def main():
+        return await asyncio.gather(
+            *(api_get_async(token_auth, URL, {"codigo": 1}) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    resultados = token_auth.async_transport.run(main())
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in resultados)
+    assert len(token_auth.async_transport.chamadas) == 1
+
+    token_auth.async_transport.run(main())
+    assert len(token_auth.async_transport.chamadas) == 2
+
+
+def test_cache_com_ttl():
+    coalescer = RequestCoalescer(ttl=0.05, maxsize=2)
+    chamadas = []
+
+    def func(valor):
+        def chamada():
+            chamadas.append(valor)
+            return valor
+
+        return chamada
+
+    assert coalescer.call("a", func(1)) == 1
+    assert coalescer.call("a", func(2)) == 1
+    assert chamadas == [1]
+
+    coalescer.call("b", func(3))
+    coalescer.call("c", func(4))
+    assert len(coalescer) == 2
+    assert coalescer.call("a", func(5)) == 5  # removida pelo LRU
+
+    time.sleep(0.06)
+    assert coalescer.call("a", func(6)) == 6
+    assert chamadas == [1, 3, 4, 5, 6]
+
+
+def test_call_agrupa_threads():
+    coalescer = RequestCoalescer()
+    liberada = threading.Event()
+    chamadas = []
+
+    def chamada():
+        chamadas.append(1)
+        liberada.wait(5)
+        return object()
+
+    resultados = []
+    threads = [
+        threading.Thread(target=lambda: resultados.append(coalescer.call("a", chamada)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    liberada.set()
+    for thread in threads:
+        thread.join()
+
+    assert chamadas == [1]
+    assert len(resultados) == 5
+    assert all(resultado is resultados[0] for resultado in resultados)
+    # Sem ttl, nada é mantido após a conclusão
+    assert len(coalescer) == 0
+
+
+def test_cancelamento_nao_afeta_as_demais():
+    coalescer = RequestCoalescer()
+
+    async def lenta():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def main():
+        primeira = asyncio.ensure_future(coalescer.call_async("a", lenta))
+        segunda = asyncio.ensure_future(coalescer.call_async("a", lenta))
+        await asyncio.sleep(0)
+        primeira.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await primeira
+        return await segunda
+
+    assert asyncio.run(main()) == "ok"
+
+
+def test_falha_de_autenticacao_nao_afeta_outro_handler(make_token_auth):
+    token_auth = make_token_auth(lambda url, params: [{"codigo": 1}])
+    recusado = make_token_auth(lambda url, params: [])
+    # Os dois handlers compartilham o transporte, como no transporte padrão
+    recusado.async_transport = token_auth.async_transport
+
+    def falha_token():
+        raise RuntimeError("senha incorreta")
+
+    recusado.get_api_token = falha_token
+
+    async def main():
+        return await asyncio.gather(
+            api_get_async(recusado, URL, {"codigo": 1}),
+            api_get_async(token_auth, URL, {"codigo": 1}),
+            return_exceptions=True,
+        )
+
+    falha, resposta = token_auth.async_transport.run(main())
+
+    assert isinstance(falha, RuntimeError)
+    assert resposta["items"] == [{"codigo": 1}]
+
+
+def test_cache_entrega_copias(make_token_auth):
+    token_auth = make_token_auth(lambda url, params: [{"codigo": 1}])
+    token_auth.async_transport.coalescer = RequestCoalescer(ttl=60)
+
+    primeira = token_auth.async_transport.run(api_get_async(token_auth, URL, {}))
+    primeira["items"][0]["codigo"] = 99
+    segunda = token_auth.async_transport.run(api_get_async(token_auth, URL, {}))
+
+    assert len(token_auth.async_transport.chamadas) == 1
+    assert segunda["items"] == [{"codigo": 1}]
+
+
+def test_cache_nao_e_herdado_por_novo_handler(make_token_auth):
+    token_auth = make_token_auth(lambda url, params: [{"codigo": 1}])
+    transporte = token_auth.async_transport
+    transporte.coalescer = RequestCoalescer(ttl=60)
+
+    def novo_handler() -> TokenAuthHandler:
+        return TokenAuthHandler(
+            AuthCredentials(login="outro", password="senha"),
+            transport=token_auth.transport,
+            async_transport=transporte,
+            auto_renew=False,
+        )
+
+    # Handlers criados e descartados em sequência costumam ocupar o mesmo
+    # endereço de memória (o mesmo id()); nenhum recebe as respostas obtidas
+    # com as credenciais dos anteriores
+    for _ in range(5):
+        handler = novo_handler()
+        transporte.run(api_get_async(handler, URL, {}))
+        handler.close()
+        del handler
+        gc.collect()
+
+    assert len(transporte.chamadas) == 5
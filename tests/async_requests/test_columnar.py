@@ -0,0 +1,179 @@
+import pandas as pd
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from api_hidro.api_requests import hidro_serie as hs
+from api_hidro.columnar import (
+    colunas,
+    deduplica_consistencia,
+    items_to_dataframe,
+    serie_diaria,
+)
+from api_hidro.errors import TimeSerieNotFoundError
+from api_hidro.models.models import DadosMesAnoVazao, Inventario
+
+
+def item_vazao(ano: int, mes: int, **campos) -> dict:
+    item = {
+        "codigoestacao": "10100000",
+        "Data_Hora_Dado": f"{ano}-{mes:02d}-01 00:00:00.0",
+        "Data_Ultima_Alteracao": "2021-06-10 12:30:00.0",
+        "Dia_Maxima": "3",
+        "Maxima": "15.5",
+        "Maxima_Status": "1",
+        "Dia_Minima": "20",
+        "Media": "10.0",
+        "Media_Anual": None,
+        "Media_Anual_Status": None,
+        "Media_Status": "1",
+        "Mediadiaria": "0",
+        "Metodo_Obtencao_Vazoes": "1",
+        "Minima": "5.25",
+        "Minima_Status": "0",
+        "Nivel_Consistencia": "2",
+    }
+    for dia in range(1, 32):
+        item[f"Vazao_{dia:02d}"] = str(dia) if dia <= 28 else None
+        item[f"Vazao_{dia:02d}_Status"] = "1" if dia <= 28 else None
+    item.update(campos)
+    return item
+
+
+def test_colunas_follow_model_fields():
+    esquema = colunas(Inventario)
+
+    assert list(esquema) == list(Inventario.model_fields)
+    assert esquema["uf_estacao"] == ("UF_Estacao", "str")
+    assert esquema["operando"] == ("Operando", "bool")
+    assert esquema["codigobacia"] == ("codigobacia", "int")
+    assert esquema["data_periodo_escala_fim"][1] == "date"
+
+
+def test_items_to_dataframe_matches_pydantic_values():
+    items = [item_vazao(2020, 1), item_vazao(2020, 2, Maxima_Status="0")]
+
+    df = items_to_dataframe(items, DadosMesAnoVazao)
+    esperado = [DadosMesAnoVazao.model_validate(item).model_dump() for item in items]
+
+    assert df["codigoestacao"].dtype == "Int64"
+    assert df["maxima_status"].dtype == "boolean"
+    assert df["data_hora_dado"].dtype.kind == "M"
+    assert df.astype(object).where(df.notna(), None).to_dict("records") == esperado
+
+
+def test_items_to_dataframe_coerces_invalid_and_missing_values():
+    items = [
+        {"Codigoestacao": "x", "Maxima": "", "Maxima_Status": True},
+        {"codigoestacao": 7, "Maxima": 1, "Maxima_Status": "falso?"},
+    ]
+
+    df = items_to_dataframe(items, DadosMesAnoVazao)
+
+    assert df["codigoestacao"].isna().tolist() == [True, False]
+    assert df["maxima"].isna().tolist() == [True, False]
+    assert df["maxima_status"].tolist()[0] is True
+    assert df["maxima_status"].isna().tolist() == [False, True]
+    assert df["vazao_31"].isna().all()
+
+
+@pytest.mark.parametrize(
+    "valor",
+    [True, False, 1, 0, 1.0, 0.0, "1", "0", "true", "False", "TRUE", "t", "F"]
+    + ["yes", "No", "Y", "n", "on", "OFF", "S", "s", "1.0", "0.0", "2", "sim"],
+)
+def test_bool_conversion_matches_pydantic(valor):
+    df = items_to_dataframe([{"Maxima_Status": valor}], DadosMesAnoVazao)
+    try:
+        esperado = TypeAdapter(bool).validate_python(valor)
+    except ValidationError:
+        esperado = None
+
+    convertido = df["maxima_status"][0]
+    assert (None if pd.isna(convertido) else convertido) == esperado
+
+
+def test_serie_historica_df(make_token_auth):
+    def responde(url, params):
+        ano = int(params["Data Inicial (yyyy-MM-dd)"][:4])
+        return [item_vazao(ano, mes) for mes in (1, 2)]
+
+    token_auth = make_token_auth(responde)
+    df = hs.serie_historica_vazao_df(token_auth, 1, "2019-01-01", "2020-12-31")
+
+    assert len(df) == 4
+    assert sorted(df["data_hora_dado"].dt.year.unique().tolist()) == [2019, 2020]
+
+    with pytest.raises(TimeSerieNotFoundError):
+        hs.serie_historica_chuva_df(
+            make_token_auth(lambda url, params: []), 1, "2020-01-01", "2020-12-31"
+        )
+
+
+def test_serie_diaria_drops_invalid_days():
+    items = [item_vazao(2020, 2), item_vazao(2021, 2), item_vazao(2020, 1)]
+    df = items_to_dataframe(items, DadosMesAnoVazao)
+
+    diaria = serie_diaria(df)
+
+    assert len(diaria) == 29 + 28 + 31
+    assert diaria.index.is_monotonic_increasing
+    assert diaria.index[0] == pd.Timestamp("2020-01-01")
+    assert "2021-02-29" not in diaria.index.strftime("%Y-%m-%d")
+    fevereiro = diaria.loc["2020-02"]
+    assert fevereiro["valor"].tolist()[:28] == [float(dia) for dia in range(1, 29)]
+    assert pd.isna(fevereiro["valor"].iloc[28])
+    assert fevereiro["status"].isna().tolist() == [False] * 28 + [True]
+    assert (diaria["nivel_consistencia"] == 2).all()
+
+
+def test_serie_diaria_accepts_models():
+    items = [item_vazao(2020, mes) for mes in (3, 4)]
+    modelos = [DadosMesAnoVazao.model_validate(item) for item in items]
+
+    assert serie_diaria(modelos).equals(
+        serie_diaria(items_to_dataframe(items, DadosMesAnoVazao))
+    )
+
+    with pytest.raises(ValueError):
+        serie_diaria(pd.DataFrame({"x": [1]}))
+
+
+def test_deduplica_consistencia_keeps_preferred_level():
+    items = [
+        item_vazao(2020, 1, Nivel_Consistencia="1", Maxima="1"),
+        item_vazao(2020, 1, Nivel_Consistencia="2", Maxima="2"),
+        item_vazao(2020, 2, Nivel_Consistencia="1", Maxima="3"),
+        item_vazao(2020, 1, codigoestacao="2", Nivel_Consistencia="1", Maxima="4"),
+    ]
+    df = items_to_dataframe(items, DadosMesAnoVazao)
+
+    consistido = deduplica_consistencia(df)
+    assert consistido["maxima"].tolist() == [4.0, 2.0, 3.0]
+    assert deduplica_consistencia(df, "bruto")["maxima"].tolist() == [4.0, 1.0, 3.0]
+    assert len(deduplica_consistencia(df, "todos")) == 4
+
+    diaria = deduplica_consistencia(serie_diaria(df))
+    assert len(diaria) == 31 + 29 + 31
+    assert diaria.loc["2020-01-01", "nivel_consistencia"].tolist() == [1, 2]
+
+
+def test_serie_historica_df_deduplicates_and_streams(make_token_auth):
+    def responde(url, params):
+        ano = int(params["Data Inicial (yyyy-MM-dd)"][:4])
+        return [
+            item_vazao(ano, 1, Nivel_Consistencia="1"),
+            item_vazao(ano, 1, Nivel_Consistencia="2"),
+        ]
+
+    token_auth = make_token_auth(responde)
+
+    df = hs.serie_historica_vazao_df(token_auth, 1, "2019-01-01", "2020-12-31")
+    assert df["nivel_consistencia"].tolist() == [2, 2]
+
+    lotes = list(
+        hs.iter_serie_historica_df(
+            token_auth, 1, "Vazao", "2019-01-01", "2020-12-31", consistencia="bruto"
+        )
+    )
+    assert sorted(len(lote) for lote in lotes) == [1, 1]
+    assert all((lote["nivel_consistencia"] == 1).all() for lote in lotes)
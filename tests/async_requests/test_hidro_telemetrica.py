@@ -17,14 +17,6 @@ def test_validation_dates():
         )
 
 
-def test_interval_exceeded():
-    # more than 10 days
-    with pytest.raises(ValueError):
-        ht.__retorna_serie_historica_telemetrica(
-            1, "Detalhada", "DATA_LEITURA", "2021-01-01", "2021-01-20", "PT5M"
-        )
-
-
 def test_retorna_serie_historica_telemetrica_concat(monkeypatch):
     monkeypatch.setattr(ht, "token_auth", DummyToken())
 
@@ -0,0 +1,136 @@
+import pytest
+from test_inventory_snapshot import FakeInventario, item_inventario
+
+from api_hidro.api_requests import hidro_inventario as hi
+from api_hidro.errors import IncompleteDataError
+from api_hidro.inventory_snapshot import InventorySnapshot
+
+
+class FakeEstacoes:
+    """Inventário da API com as estações fluviométricas informadas"""
+
+    def __init__(self, codigos, falha=None, bacia_falha=None):
+        self.codigos = codigos
+        self.falha = falha
+        self.bacia_falha = bacia_falha
+        self.chamadas: list[dict] = []
+
+    def __call__(self, url, params):
+        self.chamadas.append(params)
+        codigo = params.get("Código da Estação")
+        if codigo is not None:
+            if codigo == self.falha:
+                raise RuntimeError("falha")
+            codigos = [codigo] if codigo in self.codigos else []
+        else:
+            bacia = params["Código da Bacia"]
+            if bacia == self.bacia_falha:
+                raise RuntimeError("falha da bacia")
+            codigos = [c for c in self.codigos if str(c)[0] == str(bacia)]
+        return [item_inventario(c, int(str(c)[0]), "2020-01-01") for c in codigos]
+
+
+def test_few_codes_use_individual_lookups(make_token_auth):
+    api = FakeEstacoes([10100000, 20200000])
+    token_auth = make_token_auth(api)
+
+    inventario = hi.inventario_por_codigos(token_auth, [10100000, 20200000, 99])
+
+    assert sorted(inventario) == [10100000, 20200000]
+    assert inventario[20200000].codigobacia == 2
+    assert len(api.chamadas) == 3
+    assert all("Código da Estação" in params for params in api.chamadas)
+
+
+def test_many_codes_fetch_covering_basins(make_token_auth):
+    codigos = [10100000 + i for i in range(5)] + [40100000 + i for i in range(5)]
+    api = FakeEstacoes(codigos)
+    token_auth = make_token_auth(api)
+
+    inventario = hi.inventario_por_codigos(token_auth, codigos + [40999999], limiar=3)
+
+    assert sorted(inventario) == codigos
+    bacias = [params["Código da Bacia"] for params in api.chamadas[:2]]
+    assert sorted(bacias) == [1, 4]
+    # O código não encontrado na sua bacia, obtida por completo, não existe
+    assert len(api.chamadas) == 2
+
+
+def test_many_pluviometric_codes_fetch_all_basins(make_token_auth):
+    api = FakeEstacoes([1944004, 2043004, 3043004])
+    token_auth = make_token_auth(api)
+
+    inventario = hi.inventario_por_codigos(
+        token_auth, [1944004, 2043004, 3043004], limiar=1
+    )
+
+    assert sorted(inventario) == [1944004, 2043004, 3043004]
+    assert len(api.chamadas) == 9
+
+
+def test_snapshot_is_used_first(tmp_path, make_token_auth):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+    snapshot = InventorySnapshot(tmp_path / "inv.sqlite3")
+    snapshot.atualiza(token_auth)
+
+    inventario = hi.inventario_por_codigos(token_auth, [3, 5, 123], snapshot)
+
+    assert sorted(inventario) == [3, 5]
+    assert inventario[3].codigoestacao == 3
+    assert len(api.chamadas) == 9
+    snapshot.close()
+
+
+def test_snapshot_codigos_ausentes_nao_sao_consultados(tmp_path, make_token_auth):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+    snapshot = InventorySnapshot(tmp_path / "inv.sqlite3")
+    snapshot.atualiza(token_auth)
+
+    ausentes = list(range(10100000, 10100100))
+    inventario = hi.inventario_por_codigos(token_auth, [1, *ausentes], snapshot, 10)
+
+    assert list(inventario) == [1]
+    assert len(api.chamadas) == 9
+    snapshot.close()
+
+
+def test_failures_keep_found_stations(make_token_auth):
+    api = FakeEstacoes([10100000, 20200000], falha=20200000)
+    token_auth = make_token_auth(api)
+
+    with pytest.raises(IncompleteDataError) as exc_info:
+        hi.inventario_por_codigos(token_auth, [10100000, 20200000])
+
+    assert list(exc_info.value.data) == [10100000]
+    assert list(exc_info.value.failures) == [20200000]
+
+
+def test_basin_failure_is_attributed_to_its_codes(make_token_auth):
+    bacia_1 = [10100000 + i for i in range(5)]
+    bacia_4 = [40100000 + i for i in range(5)]
+    api = FakeEstacoes(bacia_1 + bacia_4, bacia_falha=4)
+    token_auth = make_token_auth(api)
+
+    with pytest.raises(IncompleteDataError) as exc_info:
+        hi.inventario_por_codigos(token_auth, bacia_1 + bacia_4 + [10999999], limiar=3)
+
+    assert sorted(exc_info.value.data) == bacia_1
+    # Apenas os códigos da bacia com falha; 10999999 não existe na bacia 1
+    assert sorted(exc_info.value.failures) == bacia_4
+    assert len(api.chamadas) == 2
+
+
+def test_few_codes_of_failed_basin_are_queried_individually(make_token_auth):
+    bacia_1 = [10100000 + i for i in range(5)]
+    api = FakeEstacoes(bacia_1 + [40100000, 40100001], bacia_falha=4)
+    token_auth = make_token_auth(api)
+
+    inventario = hi.inventario_por_codigos(
+        token_auth, bacia_1 + [40100000, 40100001], limiar=3
+    )
+
+    assert sorted(inventario) == bacia_1 + [40100000, 40100001]
+    individuais = [params["Código da Estação"] for params in api.chamadas[2:]]
+    assert sorted(individuais) == [40100000, 40100001]
@@ -0,0 +1,192 @@
+import asyncio
+import sqlite3
+import time
+from datetime import timedelta
+
+from api_hidro import inventory_snapshot as inv
+from api_hidro.columnar import colunas, items_to_dataframe
+from api_hidro.inventory_snapshot import InventorySnapshot, _aplica_alteracoes
+from api_hidro.models.models import Inventario
+
+ATUALIZACAO = "Data Atualização Inicial (yyyy-MM-dd)"
+
+
+def item_inventario(
+    codigo: int, bacia: int, atualizacao: str | None, nome: str = "E"
+) -> dict:
+    item = dict.fromkeys(alias for alias, _ in colunas(Inventario).values())
+    item |= dict.fromkeys(
+        (alias for alias, tipo in colunas(Inventario).values() if tipo == "bool"), "0"
+    )
+    item |= {
+        "Bacia_Nome": "B",
+        "Data_Periodo_Escala_Inicio": "1990-01-01 00:00:00.0",
+        "Data_Ultima_Atualizacao": atualizacao and f"{atualizacao} 00:00:00.0",
+        "Estacao_Nome": nome,
+        "Latitude": -10.0,
+        "Longitude": -50.0,
+        "Municipio_Codigo": 1,
+        "Municipio_Nome": "M",
+        "Operadora_Codigo": 1,
+        "Operadora_Sigla": "O",
+        "Operando": "1",
+        "Responsavel_Codigo": 1,
+        "Responsavel_Sigla": "R",
+        "Rio_Nome": "R",
+        "Sub_Bacia_Codigo": bacia * 10,
+        "Sub_Bacia_Nome": "S",
+        "Tipo_Estacao": "Fluviometrica",
+        "UF_Estacao": "MG",
+        "UF_Nome_Estacao": "Minas Gerais",
+        "codigobacia": bacia,
+        "codigoestacao": codigo,
+    }
+    return item
+
+
+class FakeInventario:
+    """Inventário da API: uma estação por bacia e, com filtro de atualização,
+    apenas as estações alteradas"""
+
+    def __init__(self):
+        self.alteradas: list[dict] = []
+        self.chamadas: list[dict] = []
+
+    def __call__(self, url, params):
+        self.chamadas.append(params)
+        bacia = params["Código da Bacia"]
+        if ATUALIZACAO in params:
+            return [item for item in self.alteradas if item["codigobacia"] == bacia]
+        return [item_inventario(bacia, bacia, "2020-01-01")]
+
+
+def test_snapshot_full_then_local(tmp_path, make_token_auth):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+
+    with InventorySnapshot(tmp_path / "inv.sqlite3") as snapshot:
+        assert snapshot.carrega() is None
+        df = snapshot.dataframe(token_auth)
+        assert sorted(df["codigoestacao"].tolist()) == list(range(1, 10))
+        assert len(api.chamadas) == 9
+
+        assert snapshot.dataframe(token_auth).equals(df)
+        assert len(api.chamadas) == 9
+
+    with InventorySnapshot(tmp_path / "inv.sqlite3") as snapshot:
+        assert snapshot.carrega().equals(df)
+        inventario = snapshot.inventario(token_auth)
+        assert inventario[0].data_periodo_escala_inicio.isoformat() == "1990-01-01"
+        assert inventario[0].operando is True
+        assert len(api.chamadas) == 9
+
+
+def test_snapshot_delta_refresh_applies_only_changes(tmp_path, make_token_auth):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+    snapshot = InventorySnapshot(tmp_path / "inv.sqlite3", max_idade=timedelta(0))
+    snapshot.dataframe(token_auth)
+
+    api.alteradas = [
+        item_inventario(1, 1, "2024-05-01", nome="Renomeada"),
+        item_inventario(2, 2, "2020-01-01", nome="Sem alteracao"),
+        item_inventario(100, 1, "2024-05-01", nome="Nova"),
+    ]
+    time.sleep(0.01)
+    df = snapshot.dataframe(token_auth)
+
+    assert all(ATUALIZACAO in params for params in api.chamadas[9:])
+    assert len(df) == 10
+    nomes = df.set_index("codigoestacao")["estacao_nome"]
+    assert nomes[1] == "Renomeada"
+    assert nomes[2] == "E"
+    assert nomes[100] == "Nova"
+    assert snapshot.carrega().equals(df)
+    snapshot.close()
+
+
+def test_snapshot_converts_outside_the_event_loop(
+    tmp_path, make_token_auth, monkeypatch
+):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+    no_event_loop = []
+
+    def registra(funcao):
+        def chamada(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                no_event_loop.append((funcao.__name__, True))
+            except RuntimeError:
+                no_event_loop.append((funcao.__name__, False))
+            return funcao(*args, **kwargs)
+
+        return chamada
+
+    for nome in ("_serializa", "_desserializa", "_aplica_alteracoes"):
+        monkeypatch.setattr(inv, nome, registra(getattr(inv, nome)))
+    monkeypatch.setattr(inv, "items_to_dataframe", registra(items_to_dataframe))
+
+    with InventorySnapshot(
+        tmp_path / "inv.sqlite3", max_idade=timedelta(0)
+    ) as snapshot:
+        snapshot.dataframe(token_auth)
+        time.sleep(0.01)
+        snapshot.dataframe(token_auth)
+
+    assert {nome for nome, _ in no_event_loop} == {
+        "_serializa",
+        "_desserializa",
+        "_aplica_alteracoes",
+        "items_to_dataframe",
+    }
+    assert not any(no_loop for _, no_loop in no_event_loop)
+
+
+def test_snapshot_ilegivel_e_obtido_novamente(tmp_path, make_token_auth):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+    arquivo = tmp_path / "inv.sqlite3"
+    with InventorySnapshot(arquivo) as snapshot:
+        df = snapshot.dataframe(token_auth)
+
+    with sqlite3.connect(arquivo) as conn:
+        conn.execute("UPDATE snapshot SET dados = ?", (b"\x80\x05corrompido",))
+
+    with InventorySnapshot(arquivo) as snapshot:
+        assert snapshot.carrega() is None
+        assert snapshot.dataframe(token_auth).equals(df)
+        assert len(api.chamadas) == 18
+        assert not any(ATUALIZACAO in params for params in api.chamadas)
+
+
+def test_aplica_alteracoes_sem_data_anterior():
+    base = items_to_dataframe(
+        [item_inventario(1, 1, None), item_inventario(2, 2, "2024-01-01")], Inventario
+    )
+    delta = items_to_dataframe(
+        [
+            item_inventario(1, 1, "2024-01-01", nome="Com data"),
+            item_inventario(2, 2, "2024-01-01", nome="Sem alteracao"),
+        ],
+        Inventario,
+    )
+
+    nomes = _aplica_alteracoes(base, delta).set_index("codigoestacao")["estacao_nome"]
+    assert nomes[1] == "Com data"
+    assert nomes[2] == "E"
+
+
+def test_snapshot_full_refresh_when_too_old(tmp_path, make_token_auth):
+    api = FakeInventario()
+    token_auth = make_token_auth(api)
+    snapshot = InventorySnapshot(
+        tmp_path / "inv.sqlite3", max_idade_completa=timedelta(0)
+    )
+    snapshot.dataframe(token_auth)
+    time.sleep(0.01)
+    snapshot.dataframe(token_auth)
+
+    assert len(api.chamadas) == 18
+    assert not any(ATUALIZACAO in params for params in api.chamadas)
+    snapshot.close()
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from api_hidro import json_decoder
+from api_hidro.api_requests.async_request import api_get_async
+
+URL = "https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroInventarioEstacoes/v1"
+
+DOCUMENTO = {
+    "status": "OK",
+    "items": [
+        {"codigoestacao": 1, "Estacao_Nome": "São José", "Latitude": -19.5},
+        {"codigoestacao": 2, "Operando": None, "Altitude": 0.0},
+    ],
+}
+
+
+@pytest.fixture
+def restaura_decodificador():
+    yield
+    json_decoder.set_json_decoder(None)
+
+
+def test_loads_equivale_ao_json_padrao():
+    conteudo = json.dumps(DOCUMENTO, ensure_ascii=False).encode()
+    assert json_decoder.loads(conteudo) == DOCUMENTO
+    assert json_decoder.loads(conteudo.decode()) == DOCUMENTO
+
+
+def test_loads_invalido_lanca_value_error():
+    with pytest.raises(ValueError):
+        json_decoder.loads(b'{"items": [')
+
+
+def test_backend_padrao():
+    esperado = "json"
+    for nome in ("msgspec", "orjson"):
+        try:
+            __import__(nome)
+            esperado = nome
+        except ImportError:
+            pass
+    assert json_decoder.json_backend() == esperado
+
+
+def test_set_json_decoder(make_token_auth, restaura_decodificador):
+    token_auth = make_token_auth(lambda url, params: [{"codigoestacao": 1}])
+    decodificados = []
+
+    def decoder(conteudo):
+        decodificados.append(conteudo)
+        return json.loads(conteudo)
+
+    json_decoder.set_json_decoder(decoder)
+    assert json_decoder.json_backend() == "custom"
+
+    data = token_auth.async_transport.run(api_get_async(token_auth, URL, {}))
+
+    assert data["items"] == [{"codigoestacao": 1}]
+    # Resposta do token (http_get_sync) e resposta da API (api_get_async)
+    assert len(decodificados) == 2
+    assert all(isinstance(conteudo, bytes) for conteudo in decodificados)
+
+    json_decoder.set_json_decoder(None)
+    assert json_decoder.json_backend() != "custom"
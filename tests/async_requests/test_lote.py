@@ -0,0 +1,63 @@
+import pytest
+
+from api_hidro.api_requests import hidro_lote as hl
+from api_hidro.errors import IncompleteDataError
+
+
+def responde(url, params):
+    codigo = params["Código da Estação"]
+    ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+    if codigo == 3 and ano == "2021":
+        raise RuntimeError("falha")
+    return [{"codigoestacao": codigo, "ano": ano}]
+
+
+def test_bulk_collects_series_and_reports_progress(make_token_auth):
+    token_auth = make_token_auth(responde)
+    progresso = []
+
+    series = hl.bulk_serie_historica(
+        token_auth, [1, 2], "Vazao", "2019-01-01", "2021-12-31", progresso.append
+    )
+
+    assert sorted(series) == [1, 2]
+    assert sorted(item["ano"] for item in series[2]) == ["2019", "2020", "2021"]
+    assert [p.concluidos for p in progresso] == list(range(1, 7))
+    assert progresso[-1].total == 6
+    assert progresso[-1].eta == 0
+    assert progresso[-1].percentual == 100.0
+
+
+def test_bulk_keeps_going_when_a_station_fails(make_token_auth):
+    token_auth = make_token_auth(responde)
+    progresso = []
+
+    with pytest.raises(IncompleteDataError) as exc_info:
+        hl.bulk_serie_historica(
+            token_auth, [1, 3, 2], "Chuva", "2020-01-01", "2022-12-31", progresso.append
+        )
+
+    assert sorted(exc_info.value.data) == [1, 2]
+    assert list(exc_info.value.failures) == [3]
+    falha = exc_info.value.failures[3]
+    assert isinstance(falha, IncompleteDataError)
+    assert isinstance(falha.failures[2021], RuntimeError)
+    assert progresso[-1].concluidos == 9
+    assert progresso[-1].falhas == 1
+
+
+def test_iter_bulk_streams_station_years(make_token_auth):
+    token_auth = make_token_auth(responde)
+
+    lotes = list(
+        hl.iter_bulk_serie_historica(
+            token_auth, [1, 2], "Cotas", "2020-06-01", "2021-03-31"
+        )
+    )
+
+    assert sorted((codigo, serie[0]["ano"]) for codigo, serie in lotes) == [
+        (1, "2020"),
+        (1, "2021"),
+        (2, "2020"),
+        (2, "2021"),
+    ]
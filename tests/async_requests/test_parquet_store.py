@@ -0,0 +1,103 @@
+import pandas as pd
+import pytest
+
+from api_hidro.columnar import colunas, items_to_dataframe
+from api_hidro.models.models import DadosMesAnoCota, Inventario
+from api_hidro.parquet_store import ParquetStore
+
+ds = pytest.importorskip("pyarrow.dataset")
+
+
+def item_cota(codigo: int, ano: int, mes: int, nivel: str = "1", **campos) -> dict:
+    item = dict.fromkeys(alias for alias, _ in colunas(DadosMesAnoCota).values())
+    item |= {
+        "codigoestacao": str(codigo),
+        "Data_Hora_Dado": f"{ano}-{mes:02d}-01 00:00:00.0",
+        "Maxima": "100",
+        "Maxima_Status": "1",
+        "Nivelconsistencia": nivel,
+    }
+    item |= campos
+    return item
+
+
+def test_serie_round_trip_keeps_schema(tmp_path):
+    items = [item_cota(1, 2019, 12), item_cota(1, 2020, 1), item_cota(2, 2020, 1)]
+    store = ParquetStore(tmp_path)
+
+    assert store.escreve_serie("Cotas", items) == 3
+    assert (tmp_path / "tipo=Cotas" / "codigoestacao=1" / "ano=2020").is_dir()
+
+    lido = store.le_serie("Cotas")
+    esperado = items_to_dataframe(items, DadosMesAnoCota)
+    assert lido.equals(esperado)
+    assert lido.dtypes.equals(esperado.dtypes)
+
+
+def test_serie_merges_partition_by_date_and_level(tmp_path):
+    store = ParquetStore(tmp_path)
+    store.escreve_serie("Cotas", [item_cota(1, 2020, 1), item_cota(1, 2020, 2)])
+    store.escreve_serie(
+        "Cotas",
+        [item_cota(1, 2020, 2, Maxima="200"), item_cota(1, 2020, 2, nivel="2")],
+    )
+
+    lido = store.le_serie("Cotas")
+    assert lido["maxima"].tolist() == [100.0, 200.0, 100.0]
+    assert lido["nivelconsistencia"].tolist() == [1, 1, 2]
+
+
+def test_le_serie_filters_and_prunes_columns(tmp_path):
+    store = ParquetStore(tmp_path)
+    store.escreve_serie(
+        "Cotas",
+        [
+            item_cota(codigo, ano, mes, Maxima=str(ano))
+            for codigo in (1, 2, 3)
+            for ano in (2018, 2019, 2020)
+            for mes in (1, 7)
+        ],
+    )
+
+    lido = store.le_serie(
+        "Cotas",
+        codigos=[1, 3],
+        data_inicial="2019-03-01",
+        data_final="2020-01-31",
+        colunas=["maxima", "codigoestacao", "data_hora_dado"],
+    )
+    assert list(lido.columns) == ["codigoestacao", "data_hora_dado", "maxima"]
+    assert lido["codigoestacao"].tolist() == [1, 1, 3, 3]
+    assert (
+        lido["data_hora_dado"].dt.strftime("%Y-%m").tolist()
+        == [
+            "2019-07",
+            "2020-01",
+        ]
+        * 2
+    )
+
+    filtrado = store.le_serie(
+        "Cotas", colunas=["maxima"], filtro=ds.field("maxima") > 2019
+    )
+    assert filtrado["maxima"].tolist() == [2020.0] * 6
+
+    assert store.le_serie("Chuva").empty
+    with pytest.raises(ValueError):
+        store.le_serie("Cotas", colunas=["inexistente"])
+
+
+def test_inventario_round_trip(tmp_path):
+    store = ParquetStore(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        store.le_inventario()
+
+    items = [
+        {"codigoestacao": "1", "UF_Estacao": "MG", "Operando": "1"},
+        {"codigoestacao": "2", "UF_Estacao": "SP", "Operando": "0"},
+    ]
+    assert store.escreve_inventario(items) == 2
+
+    assert store.le_inventario().equals(items_to_dataframe(items, Inventario))
+    mg = store.le_inventario(["codigoestacao"], ds.field("uf_estacao") == "MG")
+    assert mg.equals(pd.DataFrame({"codigoestacao": pd.array([1], dtype="Int64")}))
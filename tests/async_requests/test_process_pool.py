@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from api_hidro import process_pool
+from api_hidro.api_requests import hidro_lote as hl
+from api_hidro.columnar import colunas, items_to_dataframe
+from api_hidro.errors import IncompleteDataError
+from api_hidro.models.models import DadosMesAnoChuva
+from api_hidro.process_pool import ProcessPoolParser, converte_pagina, le_pagina
+
+
+def item_chuva(codigo: int, ano: int, mes: int, nivel: str = "2") -> dict:
+    item = dict.fromkeys(alias for alias, _ in colunas(DadosMesAnoChuva).values())
+    item |= {
+        "Codigoestacao": str(codigo),
+        "Data_Hora_Dado": f"{ano}-{mes:02d}-01 00:00:00.0",
+        "Data_Ultima_Alteracao": "2021-06-10 12:30:00.0",
+        "Dia_Maxima": "3",
+        "Maxima": "15.5",
+        "Maxima_Status": "1",
+        "Nivel_Consistencia": nivel,
+    }
+    for dia in range(1, 32):
+        item[f"Chuva_{dia:02d}"] = "1.5"
+        item[f"Chuva_{dia:02d}_Status"] = "1"
+    return item
+
+
+def pagina(items: list[dict]) -> bytes:
+    return json.dumps({"status": "OK", "items": items}).encode()
+
+
+ITEMS = [item_chuva(1, 2020, 1, "1"), item_chuva(1, 2020, 1), item_chuva(1, 2020, 2)]
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_converte_pagina_round_trip(monkeypatch, arrow):
+    if arrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(process_pool, "pa", None)
+
+    resultado = converte_pagina(pagina(ITEMS), DadosMesAnoChuva, True, "consistido")
+
+    assert isinstance(resultado, bytes) is arrow
+    df = le_pagina(resultado)
+    esperado = items_to_dataframe(ITEMS[1:], DadosMesAnoChuva)
+    assert df.equals(esperado)
+    assert df.dtypes.equals(esperado.dtypes)
+
+
+def test_converte_pagina_validates_items():
+    invalido = [{"Data_Hora_Dado": "não é data"}]
+
+    with pytest.raises(ValidationError):
+        converte_pagina(pagina(invalido), DadosMesAnoChuva)
+    assert len(le_pagina(converte_pagina(pagina(invalido), DadosMesAnoChuva, False)))
+
+
+def test_process_pool_parser_converts_in_workers():
+    async def converte(parser):
+        return await asyncio.gather(
+            *(parser.converte(pagina([item]), DadosMesAnoChuva) for item in ITEMS)
+        )
+
+    with ProcessPoolParser(max_workers=2) as parser:
+        dfs = asyncio.run(converte(parser))
+
+    assert [len(df) for df in dfs] == [1, 1, 1]
+    assert [df["nivel_consistencia"].iloc[0] for df in dfs] == [1, 2, 2]
+
+
+def test_bulk_serie_historica_df(make_token_auth):
+    def responde(url, params):
+        codigo = params["Código da Estação"]
+        ano = int(params["Data Inicial (yyyy-MM-dd)"][:4])
+        if codigo == 3:
+            raise RuntimeError("falha")
+        return [item_chuva(codigo, ano, 2), item_chuva(codigo, ano, 1, "1")]
+
+    token_auth = make_token_auth(responde)
+    progresso = []
+
+    series = hl.bulk_serie_historica_df(
+        token_auth, [1, 2], "Chuva", "2019-01-01", "2020-12-31", None, progresso.append
+    )
+
+    assert sorted(series) == [1, 2]
+    assert series[1]["data_hora_dado"].dt.month.tolist() == [1, 2, 1, 2]
+    assert series[1]["data_hora_dado"].is_monotonic_increasing
+    assert progresso[-1].concluidos == 4
+
+    with pytest.raises(IncompleteDataError) as exc_info:
+        hl.bulk_serie_historica_df(
+            token_auth, [1, 3], "Chuva", "2020-01-01", "2020-12-31"
+        )
+    assert list(exc_info.value.failures) == [3]
+    assert len(exc_info.value.data[1]) == 2
+
+
+def test_bulk_serie_historica_df_periodos_anuais(make_token_auth):
+    token_auth = make_token_auth(lambda url, params: [])
+
+    hl.bulk_serie_historica(token_auth, [1], "Chuva", "2020-06-01", "2020-12-31")
+    hl.bulk_serie_historica_df(token_auth, [1], "Chuva", "2020-06-01", "2020-12-31")
+
+    # Os dois caminhos solicitam o ano completo
+    json_params, df_params = (
+        params for _, params in token_auth.async_transport.chamadas
+    )
+    assert json_params == df_params
+    assert df_params["Data Inicial (yyyy-MM-dd)"] == "2020-01-01"
+    assert df_params["Data Final (yyyy-MM-dd)"] == "2020-12-31"
+
+
+def test_bulk_serie_historica_df_valida_sem_parser(make_token_auth):
+    def responde(url, params):
+        item = item_chuva(params["Código da Estação"], 2020, 1)
+        if params["Código da Estação"] == 2:
+            item["Maxima"] = "não numérico"
+        return [item]
+
+    token_auth = make_token_auth(responde)
+
+    with pytest.raises(IncompleteDataError) as exc_info:
+        hl.bulk_serie_historica_df(
+            token_auth, [1, 2], "Chuva", "2020-01-01", "2020-12-31"
+        )
+    assert list(exc_info.value.failures) == [2]
+    assert isinstance(exc_info.value.failures[2].failures[2020], ValidationError)
+    assert len(exc_info.value.data[1]) == 1
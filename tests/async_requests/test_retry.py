@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from api_hidro.api_requests import hidro_serie as hs
+from api_hidro.api_requests.retry import RetryPolicy, parse_retry_after
+from api_hidro.api_requests.transport import TransportConfig
+from api_hidro.errors import IncompleteDataError
+
+
+def test_retry_policy_backoff_is_exponential_and_capped():
+    retry = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+
+    assert [retry.delay(tentativa) for tentativa in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert retry.delay(1, retry_after="3") == 3.0
+    assert retry.should_retry(1, 503)
+    assert retry.should_retry(1)
+    assert not retry.should_retry(1, 404)
+    assert not retry.should_retry(retry.max_attempts, 503)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("invalido") is None
+    assert parse_retry_after(None) is None
+
+
+def test_transient_status_is_retried(make_token_auth):
+    falhas = {"2021": 2}
+
+    def responde(url, params):
+        ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+        if falhas.get(ano):
+            falhas[ano] -= 1
+            return httpx.Response(
+                503, headers={"Retry-After": "0"}, request=httpx.Request("GET", url)
+            )
+        return [{"ano": ano}]
+
+    token_auth = make_token_auth(responde)
+    serie = hs.retorna_serie_historica(
+        token_auth, 1, "Vazao", "2020-01-01", "2021-12-31"
+    )
+
+    assert sorted(item["ano"] for item in serie) == ["2020", "2021"]
+    assert len(token_auth.async_transport.chamadas) == 4
+
+
+def test_partial_failure_keeps_successful_years(make_token_auth):
+    def responde(url, params):
+        ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+        if ano == "2021":
+            return httpx.Response(500, request=httpx.Request("GET", url))
+        return [{"ano": ano}]
+
+    token_auth = make_token_auth(responde)
+    token_auth.async_transport.config = TransportConfig(
+        retry=RetryPolicy(max_attempts=2, backoff_base=0)
+    )
+
+    with pytest.raises(IncompleteDataError) as exc_info:
+        hs.retorna_serie_historica(token_auth, 1, "Vazao", "2020-01-01", "2022-12-31")
+
+    assert sorted(item["ano"] for item in exc_info.value.data) == ["2020", "2022"]
+    assert list(exc_info.value.failures) == [2021]
+    assert isinstance(exc_info.value.failures[2021], httpx.HTTPStatusError)
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+
+from api_hidro.api_requests.scheduler import RequestScheduler, TokenBucket
+
+URL = "https://www.ana.gov.br/hidrowebservice/EstacoesTelemetricas/HidroSerieVazao/v1"
+
+
+def test_scheduler_bounds_concurrency():
+    scheduler = RequestScheduler(max_concurrency=5, rate_per_host=None)
+    maximo = 0
+
+    async def requisicao(codigo):
+        nonlocal maximo
+        async with scheduler.slot(URL, codigo):
+            maximo = max(maximo, scheduler.active)
+            await asyncio.sleep(0.001)
+
+    async def main():
+        await asyncio.gather(*[requisicao(i % 3) for i in range(50)])
+
+    asyncio.run(main())
+    assert maximo == 5
+    assert scheduler.active == 0
+    assert scheduler.waiting == 0
+
+
+def test_scheduler_serves_keys_round_robin():
+    scheduler = RequestScheduler(max_concurrency=1, rate_per_host=None)
+    ordem: list[str] = []
+
+    async def requisicao(codigo):
+        async with scheduler.slot(URL, codigo):
+            ordem.append(codigo)
+            await asyncio.sleep(0)
+
+    async def main():
+        tarefas = [asyncio.create_task(requisicao("A")) for _ in range(10)]
+        await asyncio.sleep(0)
+        tarefas += [asyncio.create_task(requisicao("B")) for _ in range(2)]
+        await asyncio.gather(*tarefas)
+
+    asyncio.run(main())
+    # A estação B não espera todos os anos da estação A
+    assert ordem.index("B") <= 3
+    assert ordem[:6].count("B") == 2
+
+
+def test_scheduler_releases_slot_of_cancelled_waiter():
+    scheduler = RequestScheduler(max_concurrency=1, rate_per_host=None)
+
+    async def main():
+        liberar = asyncio.Event()
+
+        async def ocupa():
+            async with scheduler.slot(URL, "A"):
+                await liberar.wait()
+
+        async def aguarda():
+            async with scheduler.slot(URL, "B"):
+                pass
+
+        primeira = asyncio.create_task(ocupa())
+        await asyncio.sleep(0)
+        segunda = asyncio.create_task(aguarda())
+        await asyncio.sleep(0)
+        segunda.cancel()
+        liberar.set()
+        await primeira
+        with pytest.raises(asyncio.CancelledError):
+            await segunda
+        async with scheduler.slot(URL, "C"):
+            assert scheduler.active == 1
+
+    asyncio.run(main())
+    assert scheduler.active == 0
+
+
+def test_token_bucket_spaces_requests():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    async def main():
+        inicio = time.monotonic()
+        await asyncio.gather(*[bucket.acquire() for _ in range(11)])
+        return time.monotonic() - inicio
+
+    assert asyncio.run(main()) >= 0.09
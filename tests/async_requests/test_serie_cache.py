@@ -0,0 +1,90 @@
+import asyncio
+from datetime import date, timedelta
+
+from api_hidro.api_requests import hidro_serie as hs
+from api_hidro.serie_cache import SerieCache
+
+
+def responde_ano(url, params):
+    ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+    return [{"ano": ano, "Nivel_Consistencia": "2"}]
+
+
+def test_repeated_backfill_is_served_from_cache(make_token_auth, tmp_path):
+    token_auth = make_token_auth(responde_ano)
+
+    with SerieCache(tmp_path / "series.sqlite3") as cache:
+        primeira = hs.retorna_serie_historica(
+            token_auth, 1, "Vazao", "2000-01-01", "2009-12-31", cache=cache
+        )
+        segunda = hs.retorna_serie_historica(
+            token_auth, 1, "Vazao", "2000-01-01", "2011-12-31", cache=cache
+        )
+
+    assert primeira == segunda[:10]
+    assert len(token_auth.async_transport.chamadas) == 12
+
+
+def test_cache_is_accessed_outside_the_event_loop(make_token_auth, tmp_path):
+    token_auth = make_token_auth(responde_ano)
+    no_event_loop = []
+
+    def dentro_do_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    class Cache(SerieCache):
+        def get(self, *args, **kwargs):
+            no_event_loop.append(dentro_do_event_loop())
+            return super().get(*args, **kwargs)
+
+        def put(self, *args, **kwargs):
+            no_event_loop.append(dentro_do_event_loop())
+            return super().put(*args, **kwargs)
+
+    with Cache(tmp_path / "series.sqlite3") as cache:
+        hs.retorna_serie_historica(
+            token_auth, 1, "Vazao", "2000-01-01", "2001-12-31", cache=cache
+        )
+
+    assert no_event_loop == [False] * 4
+
+
+def test_ttl_depends_on_year_and_consistency_level(tmp_path):
+    with SerieCache(tmp_path / "series.sqlite3") as cache:
+        ano_corrente = date.today().year
+        consistido = [{"Nivel_Consistencia": 2}, {"Nivelconsistencia": "2"}]
+        bruto = [{"Nivel_Consistencia": 2}, {"Nivel_Consistencia": 1}]
+
+        assert cache.ttl(ano_corrente, consistido) == cache.ttl_ano_corrente
+        assert cache.ttl(ano_corrente - 1, consistido) == cache.ttl_consistido
+        assert cache.ttl(ano_corrente - 1, bruto) == cache.ttl_bruto
+        assert cache.ttl(ano_corrente - 1, []) == cache.ttl_bruto
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    with SerieCache(tmp_path / "series.sqlite3", ttl_bruto=timedelta(0)) as cache:
+        cache.put("HidroSerieChuva", 1, "DATA_LEITURA", 2000, [{"x": 1}])
+        assert cache.get("HidroSerieChuva", 1, "DATA_LEITURA", 2000) is None
+        assert cache.size == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    items = [{"valor": i} for i in range(50)]
+    with SerieCache(tmp_path / "series.sqlite3") as cache:
+        cache.put("HidroSerieChuva", 1, "DATA_LEITURA", 2000, items)
+        tamanho = cache.size
+        cache.max_bytes = tamanho * 2
+
+        cache.put("HidroSerieChuva", 1, "DATA_LEITURA", 2001, items)
+        # 2000 passa a ser o mais recentemente usado
+        assert cache.get("HidroSerieChuva", 1, "DATA_LEITURA", 2000) == items
+        cache.put("HidroSerieChuva", 1, "DATA_LEITURA", 2002, items)
+
+        assert cache.size <= cache.max_bytes
+        assert cache.get("HidroSerieChuva", 1, "DATA_LEITURA", 2001) is None
+        assert cache.get("HidroSerieChuva", 1, "DATA_LEITURA", 2000) == items
+        assert cache.get("HidroSerieChuva", 1, "DATA_LEITURA", 2002) == items
@@ -0,0 +1,161 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from api_hidro.api_requests import hidro_sincronizacao as hsync
+from api_hidro.errors import IncompleteDataError
+from api_hidro.sync_store import SyncStore
+
+
+def registro(mes, valor, alteracao="2020-01-10 00:00:00.0"):
+    return {
+        "Data_Hora_Dado": f"2020-{mes:02d}-01 00:00:00.0",
+        "Nivel_Consistencia": "1",
+        "Media": valor,
+        "Data_Ultima_Alteracao": alteracao,
+    }
+
+
+def test_incremental_sync_fetches_only_changes_and_merges(make_token_auth, tmp_path):
+    correcoes = [registro(2, 25.0, "2024-05-01 00:00:00.0")]
+
+    def responde(url, params):
+        if params["Tipo Filtro Data"] == "DATA_ULTIMA_ATUALIZACAO":
+            return correcoes
+        if params["Data Inicial (yyyy-MM-dd)"].startswith("2020"):
+            return [registro(1, 10.0), registro(2, 20.0)]
+        return []
+
+    token_auth = make_token_auth(responde)
+    chamadas = token_auth.async_transport.chamadas
+    hoje = date.today().isoformat()
+
+    with SyncStore(tmp_path / "sync.sqlite3") as store:
+        assert (
+            hsync.sincroniza_serie_historica(
+                token_auth, store, 1, "Vazao", "2020-01-01"
+            )
+            == 2
+        )
+        assert store.watermark("HidroSerieVazao", 1) == date.today()
+        n_completa = len(chamadas)
+        assert all(p["Tipo Filtro Data"] == "DATA_LEITURA" for _, p in chamadas)
+
+        assert (
+            hsync.sincroniza_serie_historica(
+                token_auth, store, 1, "Vazao", "2020-01-01"
+            )
+            == 1
+        )
+        incrementais = chamadas[n_completa:]
+        assert len(incrementais) == 1
+        assert incrementais[0][1]["Tipo Filtro Data"] == "DATA_ULTIMA_ATUALIZACAO"
+        assert incrementais[0][1]["Data Inicial (yyyy-MM-dd)"] == hoje
+
+        assert [r["Media"] for r in store.records("HidroSerieVazao", 1)] == [
+            10.0,
+            25.0,
+        ]
+
+
+def test_failed_station_keeps_others_synced(make_token_auth, tmp_path):
+    def responde(url, params):
+        if params["Código da Estação"] == 2:
+            raise RuntimeError("falha")
+        return [registro(1, 10.0)]
+
+    token_auth = make_token_auth(responde)
+
+    with SyncStore(tmp_path / "sync.sqlite3") as store:
+        with pytest.raises(IncompleteDataError) as exc_info:
+            hsync.sincroniza_estacoes(
+                token_auth, store, [1, 2], "Chuva", f"{date.today().year}-01-01"
+            )
+
+        assert exc_info.value.data == {1: 1}
+        assert list(exc_info.value.failures) == [2]
+
+        assert store.watermark("HidroSerieChuva", 1) == date.today()
+        assert store.watermark("HidroSerieChuva", 2) is None
+
+
+def test_sync_accesses_store_outside_the_event_loop(make_token_auth, tmp_path):
+    token_auth = make_token_auth(lambda url, params: [registro(1, 10.0)])
+    no_event_loop = []
+
+    def registra(metodo):
+        def chamada(self, *args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                no_event_loop.append((metodo.__name__, True))
+            except RuntimeError:
+                no_event_loop.append((metodo.__name__, False))
+            return metodo(self, *args, **kwargs)
+
+        return chamada
+
+    class Store(SyncStore):
+        watermark = registra(SyncStore.watermark)
+        merge = registra(SyncStore.merge)
+
+    with Store(tmp_path / "sync.sqlite3") as store:
+        hsync.sincroniza_serie_historica(
+            token_auth, store, 1, "Vazao", f"{date.today().year}-01-01"
+        )
+
+    assert no_event_loop == [("watermark", False), ("merge", False)]
+
+
+def medicao(dia, valor):
+    return {"Data_Hora_Medicao": f"{dia} 00:00:00.0", "Cota_Adotada": valor}
+
+
+def test_telemetric_sync_first_and_incremental(make_token_auth, tmp_path):
+    hoje = date.today()
+    inicio = hoje - timedelta(days=30)
+    correcoes = [medicao(inicio.isoformat(), 99.0)]
+
+    def responde(url, params):
+        if params["Tipo Filtro Data"] == "DATA_ULTIMA_ATUALIZACAO":
+            return correcoes
+        return [medicao(params["Data de Busca (yyyy-MM-dd)"], 1.0)]
+
+    token_auth = make_token_auth(responde)
+    chamadas = token_auth.async_transport.chamadas
+    endpoint = "HidroinfoanaSerieTelemetricaAdotada"
+
+    with SyncStore(tmp_path / "sync.sqlite3") as store:
+        # Primeira sincronização: período maior que 10 dias, um dia por requisição
+        assert (
+            hsync.sincroniza_serie_telemetrica(
+                token_auth, store, 1, "Adotada", inicio.isoformat()
+            )
+            == 31
+        )
+        assert len(chamadas) == 31
+        assert all(p["Tipo Filtro Data"] == "DATA_LEITURA" for _, p in chamadas)
+        assert store.watermark(endpoint, 1) == hoje
+
+        # Sincronização incremental: apenas o dia da marca d'água
+        assert (
+            hsync.sincroniza_serie_telemetrica(
+                token_auth, store, 1, "Adotada", inicio.isoformat()
+            )
+            == 1
+        )
+        incrementais = chamadas[31:]
+        assert len(incrementais) == 1
+        assert incrementais[0][1]["Tipo Filtro Data"] == "DATA_ULTIMA_ATUALIZACAO"
+        assert incrementais[0][1]["Data de Busca (yyyy-MM-dd)"] == hoje.isoformat()
+
+        # Marca d'água com mais de 10 dias
+        store.merge(endpoint, 1, [], ("Data_Hora_Medicao",), hoje - timedelta(days=15))
+        hsync.sincroniza_serie_telemetrica(
+            token_auth, store, 1, "Adotada", inicio.isoformat()
+        )
+        assert len(chamadas) == 32 + 16
+
+        registros = store.records(endpoint, 1)
+        assert len(registros) == 31
+        assert registros[0]["Cota_Adotada"] == 99.0
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from api_hidro.models.models import Inventario
+from api_hidro.spatial_index import SpatialIndex, haversine
+
+
+def estacao(codigo: int, latitude: float, longitude: float) -> Inventario:
+    return Inventario.model_construct(
+        codigoestacao=codigo, latitude=latitude, longitude=longitude
+    )
+
+
+@pytest.fixture(scope="module")
+def pontos():
+    rng = np.random.default_rng(42)
+    latitudes = rng.uniform(-34, 5, 3000)
+    longitudes = rng.uniform(-74, -34, 3000)
+    return (
+        latitudes,
+        longitudes,
+        SpatialIndex(
+            [
+                estacao(i, lat, lon)
+                for i, (lat, lon) in enumerate(zip(latitudes, longitudes))
+            ]
+        ),
+    )
+
+
+def test_haversine_known_distance():
+    # Brasília -> Rio de Janeiro, aproximadamente 930 km
+    assert haversine(-15.7939, -47.8828, -22.9068, -43.1729) == pytest.approx(
+        930, abs=5
+    )
+
+
+def test_radius_and_knn_match_brute_force(pontos):
+    latitudes, longitudes, indice = pontos
+    distancias = haversine(-20.0, -45.0, latitudes, longitudes)
+
+    assert (
+        indice.no_raio(-20.0, -45.0, 150)
+        == np.flatnonzero(distancias <= 150)[
+            np.argsort(distancias[distancias <= 150])
+        ].tolist()
+    )
+    assert (
+        indice.mais_proximas(-20.0, -45.0, 10) == np.argsort(distancias)[:10].tolist()
+    )
+    assert indice.mais_proximas(-20.0, -45.0, 0) == []
+    assert len(indice.mais_proximas(60.0, 10.0, 5)) == 5
+
+
+def test_bounding_box(pontos):
+    latitudes, longitudes, indice = pontos
+    dentro = (
+        (latitudes >= -10)
+        & (latitudes <= -5)
+        & (longitudes >= -50)
+        & (longitudes <= -40)
+    )
+
+    assert (
+        sorted(indice.no_retangulo(-10, -50, -5, -40))
+        == np.flatnonzero(dentro).tolist()
+    )
+    assert indice.no_retangulo(10, -50, 20, -40) == []
@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from api_hidro.models.models import Inventario
+from api_hidro.station_catalog import CAMPOS_BITMAP, StationCatalog
+
+
+def estacao(codigo: int, uf: str, bacia: int, tipo: str, **indicadores) -> Inventario:
+    return Inventario.model_construct(
+        codigoestacao=codigo,
+        uf_estacao=uf,
+        codigobacia=bacia,
+        sub_bacia_codigo=bacia * 10,
+        tipo_estacao=tipo,
+        **(dict.fromkeys(CAMPOS_BITMAP, False) | indicadores),
+    )
+
+
+ESTACOES = [
+    estacao(1, "MG", 4, "Fluviometrica", operando=True),
+    estacao(2, "MG", 4, "Pluviometrica", operando=True, tipo_estacao_telemetrica=True),
+    estacao(3, "SP", 6, "Fluviometrica", tipo_estacao_telemetrica=True),
+    estacao(4, "SP", 6, "Fluviometrica", operando=True, tipo_estacao_telemetrica=True),
+    estacao(5, "BA", 5, "Pluviometrica"),
+]
+
+
+def test_lookup_by_code():
+    catalogo = StationCatalog(ESTACOES)
+
+    assert len(catalogo) == 5
+    assert catalogo[3] is ESTACOES[2]
+    assert 5 in catalogo and 6 not in catalogo
+    assert catalogo.get(6) is None
+    with pytest.raises(KeyError):
+        catalogo[6]
+
+
+def test_conjunctive_queries():
+    catalogo = StationCatalog(ESTACOES)
+
+    assert catalogo.codigos(uf_estacao="MG") == [1, 2]
+    assert catalogo.codigos(uf_estacao=["SP", "BA"], tipo_estacao="Fluviometrica") == [
+        3,
+        4,
+    ]
+    assert catalogo.codigos(operando=True, tipo_estacao_telemetrica=True) == [2, 4]
+    assert catalogo.codigos(operando=False, codigobacia={5, 6}) == [3, 5]
+    assert catalogo.codigos(uf_estacao="RJ") == []
+    assert catalogo.codigos(uf_estacao=None) == [1, 2, 3, 4, 5]
+    assert catalogo.busca(sub_bacia_codigo=40, operando=True) == ESTACOES[:2]
+    assert catalogo.conta(tipo_estacao="Pluviometrica") == 2
+    assert sorted(catalogo.valores("uf_estacao")) == ["BA", "MG", "SP"]
+
+    with pytest.raises(ValueError):
+        catalogo.codigos(estacao_nome="X")
+
+
+def test_catalog_is_picklable():
+    catalogo = pickle.loads(pickle.dumps(StationCatalog(ESTACOES)))
+
+    assert catalogo.codigos(uf_estacao="SP", operando=True) == [4]
+    assert catalogo[1].codigoestacao == 1
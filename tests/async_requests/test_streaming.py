@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from api_hidro import aio
+from api_hidro.api_requests import hidro_serie as hs
+from api_hidro.errors import IncompleteDataError
+from api_hidro.utils import as_completed_bounded
+
+
+def responde_ano(url, params):
+    ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+    if ano == "2003":
+        raise RuntimeError("falha")
+    if ano == "2005":
+        return []
+    return [{"ano": ano, "mes": mes} for mes in range(1, 13)]
+
+
+def test_iter_yields_yearly_batches_and_reports_failures_at_the_end(
+    make_token_auth,
+):
+    token_auth = make_token_auth(responde_ano)
+
+    lotes = []
+    with pytest.raises(IncompleteDataError) as exc_info:
+        for lote in hs.iter_serie_historica(
+            token_auth, 1, "Chuva", "2000-01-01", "2009-12-31"
+        ):
+            lotes.append(lote)
+
+    assert len(lotes) == 8
+    assert all(len(lote) == 12 for lote in lotes)
+    assert sorted(lote[0]["ano"] for lote in lotes) == [
+        str(ano) for ano in range(2000, 2010) if ano not in (2003, 2005)
+    ]
+    assert list(exc_info.value.failures) == [2003]
+
+
+def test_aiter_runs_inside_running_event_loop(make_token_auth):
+    token_auth = make_token_auth(responde_ano)
+
+    async def main():
+        anos = []
+        async for lote in aio.iter_serie_historica(
+            token_auth, 1, "Vazao", "2010-01-01", "2012-12-31"
+        ):
+            anos.append(lote[0]["ano"])
+        return anos
+
+    assert sorted(asyncio.run(main())) == ["2010", "2011", "2012"]
+
+
+def test_as_completed_bounded_starts_tasks_on_demand():
+    iniciadas = []
+    ativas = set()
+    maximo = 0
+
+    async def tarefa(chave):
+        nonlocal maximo
+        iniciadas.append(chave)
+        ativas.add(chave)
+        maximo = max(maximo, len(ativas))
+        await asyncio.sleep(0)
+        ativas.discard(chave)
+        return chave
+
+    async def main():
+        consumidos = []
+        async for chave, resultado in as_completed_bounded(list(range(100)), tarefa, 3):
+            consumidos.append(resultado)
+            if len(consumidos) == 5:
+                break
+        return consumidos
+
+    consumidos = asyncio.run(main())
+    assert len(consumidos) == 5
+    assert maximo <= 3
+    assert len(iniciadas) < 20
+
+
+def test_as_completed_bounded_holds_at_most_limit_results():
+    # Resultados concluídos e ainda não consumidos, mais as tarefas ativas
+    em_memoria = 0
+    maximo = 0
+
+    async def tarefa(chave):
+        nonlocal em_memoria, maximo
+        em_memoria += 1
+        maximo = max(maximo, em_memoria)
+        await asyncio.sleep(0)
+        return chave
+
+    async def main():
+        nonlocal em_memoria
+        consumidos = []
+        async for chave, _ in as_completed_bounded(list(range(50)), tarefa, 4):
+            # Consumidor lento: as demais tarefas terminam enquanto ele espera
+            await asyncio.sleep(0.001)
+            em_memoria -= 1
+            consumidos.append(chave)
+        return consumidos
+
+    assert sorted(asyncio.run(main())) == list(range(50))
+    assert maximo <= 4
@@ -0,0 +1,66 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from api_hidro.api_requests import hidro_telemetrica as ht
+from api_hidro.utils import gather_bounded
+
+
+def responde_dia(url, params):
+    # Cada janela de 24h inclui a medição da meia-noite do dia seguinte
+    dia = datetime.strptime(params["Data de Busca (yyyy-MM-dd)"], "%Y-%m-%d")
+    return [
+        {
+            "codigoestacao": params["Código da Estação"],
+            "Data_Hora_Medicao": (dia + timedelta(hours=h)).strftime(
+                "%Y-%m-%d %H:%M:%S.0"
+            ),
+        }
+        for h in (0, 12, 24)
+    ]
+
+
+def test_long_range_is_split_per_day_and_deduplicated(make_token_auth):
+    token_auth = make_token_auth(responde_dia)
+
+    dados = ht.retorna_serie_historica_telemetrica(
+        token_auth, 1, "Adotada", "DATA_LEITURA", "2023-01-01", "2023-12-31", "HORA_24"
+    )
+
+    assert len(token_auth.async_transport.chamadas) == 365
+    medicoes = [item["Data_Hora_Medicao"] for item in dados]
+    assert len(medicoes) == len(set(medicoes)) == 365 * 2 + 1
+    assert medicoes == sorted(medicoes)
+
+
+def test_gather_bounded_limits_active_coroutines():
+    ativos = 0
+    maximo = 0
+
+    async def tarefa(chave):
+        nonlocal ativos, maximo
+        ativos += 1
+        maximo = max(maximo, ativos)
+        await asyncio.sleep(0)
+        ativos -= 1
+        if chave == 3:
+            raise ValueError(chave)
+        return chave * 2
+
+    sucessos, falhas = asyncio.run(gather_bounded(list(range(20)), tarefa, 4))
+
+    assert maximo == 4
+    assert list(sucessos) == [k for k in range(20) if k != 3]
+    assert sucessos[5] == 10
+    assert list(falhas) == [3]
+
+
+def test_gather_bounded_propagates_programming_errors():
+    async def tarefa(chave):
+        if chave == 3:
+            raise TypeError(chave)
+        return chave
+
+    with pytest.raises(TypeError):
+        asyncio.run(gather_bounded(list(range(5)), tarefa, 2))
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from api_hidro import token_authentication
+from api_hidro.api_requests import hidro_serie as hs
+from api_hidro.api_requests.transport import AsyncHttpTransport, HttpTransport
+from api_hidro.errors import IncompleteDataError
+from api_hidro.token_authentication import AuthCredentials, TokenAuthHandler
+from api_hidro.token_cache import FileTokenCache
+
+
+class TokenResponse:
+    status_code = 200
+
+    def __init__(self, token):
+        self.token = token
+
+    def json(self):
+        return {"items": {"tokenautenticacao": self.token}}
+
+    @property
+    def content(self):
+        return json.dumps(self.json()).encode()
+
+
+class CountingTransport(HttpTransport):
+    """Transporte que devolve um token diferente a cada chamada"""
+
+    def __init__(self, espera=0.0):
+        super().__init__()
+        self.espera = espera
+        self.chamadas = 0
+        self.__lock = threading.Lock()
+
+    def get(self, url, headers=None, params=None):
+        time.sleep(self.espera)
+        with self.__lock:
+            self.chamadas += 1
+            return TokenResponse(f"token-{self.chamadas}")
+
+
+def cria_handler(transport, **kwargs) -> TokenAuthHandler:
+    return TokenAuthHandler(
+        AuthCredentials(login="login", password="senha"),
+        transport=transport,
+        **kwargs,
+    )
+
+
+def obtem_tokens_em_threads(token_auth, n=20) -> set[str]:
+    tokens: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(token_auth.get_token()))
+        for _ in range(n)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return set(tokens)
+
+
+def test_token_is_acquired_lazily():
+    transport = CountingTransport()
+    token_auth = cria_handler(transport, auto_renew=False)
+
+    assert transport.chamadas == 0
+    with token_auth as api_token:
+        assert api_token == "token-1"
+    assert transport.chamadas == 1
+
+
+def test_expired_token_is_refreshed_once_for_concurrent_threads():
+    transport = CountingTransport(espera=0.05)
+    token_auth = cria_handler(transport, auto_renew=False)
+
+    assert obtem_tokens_em_threads(token_auth) == {"token-1"}
+    assert transport.chamadas == 1
+
+    token_auth.time_expire = datetime.now() - timedelta(seconds=1)
+    assert obtem_tokens_em_threads(token_auth) == {"token-2"}
+    assert transport.chamadas == 2
+
+
+def test_async_context_refreshes_without_blocking_the_loop():
+    transport = CountingTransport(espera=0.05)
+    token_auth = cria_handler(transport, auto_renew=False)
+    token_auth.get_token()
+    token_auth.time_expire = datetime.now() - timedelta(seconds=1)
+
+    async def usa_token():
+        async with token_auth as api_token:
+            return api_token
+
+    async def main():
+        return await asyncio.gather(*[usa_token() for _ in range(10)])
+
+    assert set(asyncio.run(main())) == {"token-2"}
+    assert transport.chamadas == 2
+
+
+def test_token_is_renewed_in_background_before_expiring(monkeypatch):
+    monkeypatch.setattr(token_authentication, "EXPIRATION_MINUTES", 0.01)
+    monkeypatch.setattr(token_authentication, "RENEWAL_MARGIN_MINUTES", 0.008)
+    transport = CountingTransport()
+    token_auth = cria_handler(transport)
+    token_auth.get_token()
+    try:
+        limite = time.monotonic() + 2
+        while transport.chamadas < 2 and time.monotonic() < limite:
+            time.sleep(0.01)
+        assert transport.chamadas >= 2
+        assert not token_auth.expired
+    finally:
+        token_auth.close()
+
+    chamadas = transport.chamadas
+    time.sleep(0.3)
+    assert transport.chamadas == chamadas
+
+
+class RevokingAsyncTransport(AsyncHttpTransport):
+    """Transporte assíncrono que recusa (HTTP 401) os tokens revogados"""
+
+    def __init__(self, revogados):
+        super().__init__()
+        self.revogados = revogados
+        self.tokens: list[str] = []
+
+    async def get(self, url, headers=None, params=None, fairness_key=None):
+        token = headers["Authorization"].removeprefix("Bearer ")
+        self.tokens.append(token)
+        request = httpx.Request("GET", url)
+        if token in self.revogados:
+            return httpx.Response(401, request=request)
+        ano = params["Data Inicial (yyyy-MM-dd)"][:4]
+        return httpx.Response(200, json={"items": [{"ano": ano}]}, request=request)
+
+
+def test_unauthorized_requests_refresh_token_once_and_replay():
+    transport = CountingTransport()
+    async_transport = RevokingAsyncTransport(revogados={"token-1"})
+    token_auth = cria_handler(
+        transport, async_transport=async_transport, auto_renew=False
+    )
+    try:
+        serie = hs.retorna_serie_historica(
+            token_auth, 1, "Vazao", "2010-01-01", "2019-12-31"
+        )
+    finally:
+        async_transport.close()
+
+    assert len(serie) == 10
+    assert transport.chamadas == 2
+    assert async_transport.tokens.count("token-2") == 10
+
+
+def test_unauthorized_after_refresh_is_raised():
+    transport = CountingTransport()
+    async_transport = RevokingAsyncTransport(revogados={"token-1", "token-2"})
+    token_auth = cria_handler(
+        transport, async_transport=async_transport, auto_renew=False
+    )
+    try:
+        with pytest.raises(IncompleteDataError) as exc_info:
+            hs.retorna_serie_historica(
+                token_auth, 1, "Vazao", "2019-01-01", "2019-12-31"
+            )
+    finally:
+        async_transport.close()
+
+    falha = exc_info.value.failures[2019]
+    assert isinstance(falha, httpx.HTTPStatusError)
+    assert falha.response.status_code == 401
+    assert transport.chamadas == 2
+
+
+def test_token_cache_is_shared_between_handlers(tmp_path):
+    cache = FileTokenCache(tmp_path)
+    transport = CountingTransport()
+
+    primeiro = cria_handler(transport, auto_renew=False, token_cache=cache)
+    segundo = cria_handler(transport, auto_renew=False, token_cache=cache)
+
+    assert primeiro.get_token() == segundo.get_token() == "token-1"
+    assert transport.chamadas == 1
+    (arquivo,) = tmp_path.glob("*.token")
+    assert arquivo.stat().st_mode & 0o777 == 0o600
+    assert "login" not in arquivo.name
+
+    # Um token recusado pela API não é reutilizado a partir do cache
+    segundo.invalidate("token-1")
+    assert segundo.get_token() == "token-2"
+    assert cria_handler(transport, token_cache=cache).get_token() == "token-2"
+    assert transport.chamadas == 2
+
+
+def test_token_cache_encryption(tmp_path):
+    fernet = pytest.importorskip("cryptography.fernet")
+    cache = FileTokenCache(tmp_path, encryption_key=fernet.Fernet.generate_key())
+    expires = datetime.now() + timedelta(minutes=10)
+
+    cache.store("login", "segredo", expires)
+
+    (arquivo,) = tmp_path.glob("*.token")
+    assert b"segredo" not in arquivo.read_bytes()
+    assert cache.load("login") == ("segredo", expires)
+    assert FileTokenCache(tmp_path).load("login") is None
+
+
+def test_token_cache_ignores_unreadable_files(tmp_path):
+    expires = datetime.now() + timedelta(minutes=10)
+    cache = FileTokenCache(tmp_path)
+    assert cache.load("login") is None
+
+    cache.store("login", "segredo", expires)
+    (arquivo,) = tmp_path.glob("*.token")
+    for conteudo in (b"{corrompido", b"[]", b'{"token": "segredo"}'):
+        arquivo.write_bytes(conteudo)
+        assert cache.load("login") is None
+
+    fernet = pytest.importorskip("cryptography.fernet")
+    FileTokenCache(tmp_path, fernet.Fernet.generate_key()).store(
+        "login", "segredo", expires
+    )
+    outra_chave = FileTokenCache(tmp_path, fernet.Fernet.generate_key())
+    assert outra_chave.load("login") is None
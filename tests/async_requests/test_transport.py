@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api_hidro.api_requests.async_request import http_get_async
+from api_hidro.api_requests.sync_request import http_get_sync
+from api_hidro.api_requests.transport import (
+    AsyncHttpTransport,
+    HttpTransport,
+    TransportConfig,
+)
+from api_hidro.token_authentication import AuthCredentials, TokenAuthHandler
+
+CORPO = json.dumps({"items": {"tokenautenticacao": "fake-token"}}).encode()
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(CORPO)))
+        self.end_headers()
+        self.wfile.write(CORPO)
+
+    def log_message(self, format, *args): ...
+
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeHandler)
+        self.conexoes = 0
+
+    def get_request(self):
+        self.conexoes += 1
+        return super().get_request()
+
+
+@pytest.fixture
+def servidor():
+    server = FakeServer()
+    threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    ).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_reuses_connection(servidor):
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/"
+    with HttpTransport() as transport:
+        for _ in range(5):
+            data = http_get_sync(url, {}, {}, transport)
+            assert data["items"]["tokenautenticacao"] == "fake-token"
+
+    assert servidor.conexoes == 1
+
+
+def test_transport_without_keep_alive_opens_new_connections(servidor):
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/"
+    with HttpTransport(TransportConfig(keep_alive=False)) as transport:
+        for _ in range(3):
+            http_get_sync(url, {}, {}, transport)
+
+    assert servidor.conexoes == 3
+
+
+def test_token_auth_handler_uses_given_transport():
+    class FakeResponse:
+        status_code = 200
+
+        def json(self):
+            return {"items": {"tokenautenticacao": "fake-token"}}
+
+        @property
+        def content(self):
+            return json.dumps(self.json()).encode()
+
+    class FakeTransport(HttpTransport):
+        def __init__(self):
+            super().__init__()
+            self.urls: list[str] = []
+
+        def get(self, url, headers=None, params=None):
+            self.urls.append(url)
+            return FakeResponse()
+
+    transport = FakeTransport()
+    token_auth = TokenAuthHandler(
+        AuthCredentials(login="login", password="senha"), transport=transport
+    )
+
+    assert token_auth.transport is transport
+    with token_auth as api_token:
+        assert api_token == "fake-token"
+    assert len(transport.urls) == 1
+
+
+def test_async_transport_reuses_connection_and_omits_none_params(servidor):
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/"
+    transport = AsyncHttpTransport()
+
+    async def busca():
+        params = {"Código da Estação": 1, "Código da Bacia": None}
+        response = await transport.get(url, params=params)
+        assert "Bacia" not in str(response.request.url)
+        for _ in range(4):
+            data = await http_get_async(url, {}, params, transport)
+            assert data["items"]["tokenautenticacao"] == "fake-token"
+
+    transport.run(busca())
+    transport.close()
+    assert servidor.conexoes == 1
+
+
+def test_async_transport_reuses_connection_between_sync_runs(servidor):
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/"
+    transport = AsyncHttpTransport()
+
+    transport.run(http_get_async(url, {}, {}, transport))
+    transport.run(http_get_async(url, {}, {}, transport))
+    transport.close()
+    assert servidor.conexoes == 1
+
+
+def test_async_transport_creates_one_client_per_event_loop(servidor):
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/"
+    transport = AsyncHttpTransport()
+
+    async def busca():
+        await http_get_async(url, {}, {}, transport)
+        await transport.aclose()
+
+    asyncio.run(busca())
+    asyncio.run(busca())
+    assert servidor.conexoes == 2